@@ -5,12 +5,16 @@ from __future__ import annotations
 
 # standard libraries
 import asyncio
+import collections
 import contextlib
 import copy
 import gettext
+import heapq
+import itertools
 import logging
 import os
 import sys
+import threading
 import types
 import typing
 import weakref
@@ -29,20 +33,61 @@ _ = gettext.gettext
 
 
 class LoggingHandler(logging.StreamHandler):  # type: ignore
+    """A logging handler that also keeps the records until they are taken.
 
-    def __init__(self) -> None:
+    At most capacity records are kept (None for no limit); when full, the oldest record is dropped. The level capacities
+    optionally limit the records kept for specific levels, e.g. {logging.DEBUG: 1000}; the oldest record of that level is
+    dropped when the limit is reached. The number of dropped records is available from dropped_count.
+    """
+
+    def __init__(self, capacity: typing.Optional[int] = 10000, level_capacities: typing.Optional[typing.Mapping[int, int]] = None) -> None:
         super().__init__()
-        self.__records: typing.List[logging.LogRecord] = list()
+        self.capacity = capacity
+        self.level_capacities = dict(level_capacities or dict())
+        self.__records_lock = threading.Lock()
+        # records are kept in a queue for each level, tagged with a sequence number to restore their order when taken.
+        self.__records = dict[int, collections.deque[typing.Tuple[int, logging.LogRecord]]]()
+        self.__record_count = 0
+        self.__sequence = itertools.count()
+        self.__dropped_count = 0
 
     def emit(self, record: logging.LogRecord) -> None:
         super().emit(record)
-        if self.__records is not None:
-            self.__records.append(record)
+        with self.__records_lock:
+            level_records = self.__records.setdefault(record.levelno, collections.deque())
+            level_records.append((next(self.__sequence), record))
+            self.__record_count += 1
+            level_capacity = self.level_capacities.get(record.levelno)
+            if level_capacity is not None and len(level_records) > level_capacity:
+                level_records.popleft()
+                self.__record_count -= 1
+                self.__dropped_count += 1
+            capacity = self.capacity
+            if capacity is not None:
+                while self.__record_count > capacity:
+                    # drop the oldest record; there are only a few levels, so finding it is quick.
+                    oldest_level_records = min((r for r in self.__records.values() if r), key=lambda r: r[0][0])
+                    oldest_level_records.popleft()
+                    self.__record_count -= 1
+                    self.__dropped_count += 1
+
+    @property
+    def record_count(self) -> int:
+        """Return the number of records kept."""
+        return self.__record_count
+
+    @property
+    def dropped_count(self) -> int:
+        """Return the number of records dropped because of the capacity limits."""
+        return self.__dropped_count
 
     def take_records(self) -> typing.List[logging.LogRecord]:
-        records = self.__records
-        self.__records = list()
-        return records
+        # swap the records while holding the lock; merge them in order after releasing it.
+        with self.__records_lock:
+            records = self.__records
+            self.__records = dict()
+            self.__record_count = 0
+        return [record for sequence, record in heapq.merge(*records.values())]
 
 
 logging_handler = LoggingHandler()
@@ -105,6 +105,7 @@ from __future__ import annotations
 
 # standard libraries
 import abc
+import collections
 import concurrent.futures
 import contextlib
 import copy
@@ -116,6 +117,7 @@ import imageio.v3 as imageio
 import logging
 import math
 import operator
+import os
 import random
 import sys
 import threading
@@ -130,6 +132,7 @@ import numpy
 # local libraries
 from nion.ui import Bitmap
 from nion.ui import DrawingContext
+from nion.ui import LRUCache
 from nion.utils import Color
 from nion.utils import Event
 from nion.utils import Geometry
@@ -153,6 +156,8 @@ class Constraint:
 
     """ A constraint on an item in a layout. Preferred is only used when free sizing. """
 
+    __slots__ = ("minimum", "maximum", "preferred")
+
     def __init__(self) -> None:
         self.minimum: typing.Optional[int] = None
         self.maximum: typing.Optional[int] = None
@@ -163,6 +168,8 @@ class Constraint:
 
 
 class SolverItem:
+    __slots__ = ("constraint", "size", "is_constrained")
+
     def __init__(self, constraint: Constraint) -> None:
         self.constraint = constraint
         self.size: typing.Optional[int] = None
@@ -319,7 +326,7 @@ class SizingEnum(enum.Enum):
 SizingSpecifierType = int | float | SizingEnum | None
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SizingData:
     preferred_width: SizingSpecifierType = None
     preferred_height: SizingSpecifierType = None
@@ -346,10 +353,28 @@ class Sizing:
         Preferred values are only used when free sizing.
 
         Collapsible items collapse to fixed size of 0 if they don't have children.
+
+        Sizing objects are immutable. The with_ methods return interned instances so that commonly used sizings (such
+        as unconstrained or fixed sizes) are shared between canvas items rather than allocated per item.
     """
 
+    __slots__ = ("__preferred_width", "__preferred_height", "__preferred_aspect_ratio",
+                 "__minimum_width", "__minimum_height", "__minimum_aspect_ratio",
+                 "__maximum_width", "__maximum_height", "__maximum_aspect_ratio",
+                 "__collapsible", "__hash")
+
     def __init__(self, sizing_data: SizingData) -> None:
-        self.__sizing_data = sizing_data
+        self.__preferred_width = sizing_data.preferred_width
+        self.__preferred_height = sizing_data.preferred_height
+        self.__preferred_aspect_ratio = sizing_data.preferred_aspect_ratio
+        self.__minimum_width = sizing_data.minimum_width
+        self.__minimum_height = sizing_data.minimum_height
+        self.__minimum_aspect_ratio = sizing_data.minimum_aspect_ratio
+        self.__maximum_width = sizing_data.maximum_width
+        self.__maximum_height = sizing_data.maximum_height
+        self.__maximum_aspect_ratio = sizing_data.maximum_aspect_ratio
+        self.__collapsible = sizing_data.collapsible
+        self.__hash: typing.Optional[int] = None
 
     def __repr__(self) -> str:
         format_str = "Sizing (min_w={0}, max_w={1}, pref_w={2}, min_h={3}, max_h={4}, pref_h={5}, min_a={6}, max_a={7}, pref_a={8}, collapsible={9})"
@@ -358,206 +383,147 @@ class Sizing:
                                  self.minimum_aspect_ratio, self.maximum_aspect_ratio, self.preferred_aspect_ratio,
                                  self.collapsible)
 
+    @property
+    def _values(self) -> typing.Tuple[typing.Any, ...]:
+        # values in the same order as the SizingData fields.
+        return (self.__preferred_width, self.__preferred_height, self.__preferred_aspect_ratio,
+                self.__minimum_width, self.__minimum_height, self.__minimum_aspect_ratio,
+                self.__maximum_width, self.__maximum_height, self.__maximum_aspect_ratio,
+                self.__collapsible)
+
     def __eq__(self, other: typing.Any) -> bool:
-        return isinstance(other, Sizing) and other.sizing_data == self.sizing_data
+        return self is other or (isinstance(other, Sizing) and other._values == self._values)
+
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            self.__hash = hash(self._values)
+        return self.__hash
+
+    def __copy__(self) -> Sizing:
+        return self
 
     def __deepcopy__(self, memo: typing.Dict[typing.Any, typing.Any]) -> Sizing:
-        deepcopy = Sizing(self.sizing_data)
-        memo[id(self)] = deepcopy
-        return deepcopy
+        memo[id(self)] = self
+        return self
 
     @property
     def sizing_data(self) -> SizingData:
-        return copy.copy(self.__sizing_data)
+        return SizingData(*self._values)
 
     @property
     def preferred_width(self) -> SizingSpecifierType:
-        return self.__sizing_data.preferred_width
+        return self.__preferred_width
 
     @property
     def preferred_width_int(self) -> int:
-        return round(self.__sizing_data.preferred_width) if isinstance(self.__sizing_data.preferred_width, (int, float)) else 0
+        return round(self.__preferred_width) if isinstance(self.__preferred_width, (int, float)) else 0
 
     @property
     def preferred_height(self) -> SizingSpecifierType:
-        return self.__sizing_data.preferred_height
+        return self.__preferred_height
 
     @property
     def preferred_height_int(self) -> int:
-        return round(self.__sizing_data.preferred_height) if isinstance(self.__sizing_data.preferred_height, (int, float)) else 0
+        return round(self.__preferred_height) if isinstance(self.__preferred_height, (int, float)) else 0
 
     @property
     def preferred_aspect_ratio(self) -> typing.Optional[float]:
-        return self.__sizing_data.preferred_aspect_ratio
+        return self.__preferred_aspect_ratio
 
     @property
     def minimum_width(self) -> SizingSpecifierType:
-        return self.__sizing_data.minimum_width
+        return self.__minimum_width
 
     @property
     def minimum_height(self) -> SizingSpecifierType:
-        return self.__sizing_data.minimum_height
+        return self.__minimum_height
 
     @property
     def minimum_aspect_ratio(self) -> typing.Optional[float]:
-        return self.__sizing_data.minimum_aspect_ratio
+        return self.__minimum_aspect_ratio
 
     @property
     def maximum_width(self) -> SizingSpecifierType:
-        return self.__sizing_data.maximum_width
+        return self.__maximum_width
 
     @property
     def maximum_height(self) -> SizingSpecifierType:
-        return self.__sizing_data.maximum_height
+        return self.__maximum_height
 
     @property
     def maximum_aspect_ratio(self) -> typing.Optional[float]:
-        return self.__sizing_data.maximum_aspect_ratio
+        return self.__maximum_aspect_ratio
 
     @property
     def collapsible(self) -> bool:
-        return self.__sizing_data.collapsible
+        return self.__collapsible
 
-    def with_preferred_width(self, width: SizingSpecifierType) -> Sizing:
+    def __with(self, **kwargs: typing.Any) -> Sizing:
         sizing_data = self.sizing_data
-        sizing_data.preferred_width = width
-        return Sizing(sizing_data)
+        for key, value in kwargs.items():
+            setattr(sizing_data, key, value)
+        return make_sizing(sizing_data)
+
+    def with_preferred_width(self, width: SizingSpecifierType) -> Sizing:
+        return self.__with(preferred_width=width)
 
     def with_preferred_height(self, height: SizingSpecifierType) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.preferred_height = height
-        return Sizing(sizing_data)
+        return self.__with(preferred_height=height)
 
     def with_preferred_aspect_ratio(self, aspect_ratio: typing.Optional[float]) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.preferred_aspect_ratio = aspect_ratio
-        return Sizing(sizing_data)
+        return self.__with(preferred_aspect_ratio=aspect_ratio)
 
     def with_minimum_width(self, width: SizingSpecifierType) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.minimum_width = width
-        return Sizing(sizing_data)
+        return self.__with(minimum_width=width)
 
     def with_minimum_height(self, height: SizingSpecifierType) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.minimum_height = height
-        return Sizing(sizing_data)
+        return self.__with(minimum_height=height)
 
     def with_minimum_aspect_ratio(self, aspect_ratio: typing.Optional[float]) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.minimum_aspect_ratio = aspect_ratio
-        return Sizing(sizing_data)
+        return self.__with(minimum_aspect_ratio=aspect_ratio)
 
     def with_maximum_width(self, width: SizingSpecifierType) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.maximum_width = width
-        return Sizing(sizing_data)
+        return self.__with(maximum_width=width)
 
     def with_maximum_height(self, height: SizingSpecifierType) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.maximum_height = height
-        return Sizing(sizing_data)
+        return self.__with(maximum_height=height)
 
     def with_maximum_aspect_ratio(self, aspect_ratio: typing.Optional[float]) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.maximum_aspect_ratio = aspect_ratio
-        return Sizing(sizing_data)
+        return self.__with(maximum_aspect_ratio=aspect_ratio)
 
     def with_collapsible(self, collapsible: bool) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.collapsible = collapsible
-        return Sizing(sizing_data)
+        return self.__with(collapsible=collapsible)
 
     def with_unconstrained_height(self) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.preferred_height = None
-        sizing_data.minimum_height = None
-        sizing_data.maximum_height = None
-        return Sizing(sizing_data)
+        return self.__with(preferred_height=None, minimum_height=None, maximum_height=None)
 
     def with_unconstrained_width(self) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.preferred_width = None
-        sizing_data.minimum_width = None
-        sizing_data.maximum_width = None
-        return Sizing(sizing_data)
+        return self.__with(preferred_width=None, minimum_width=None, maximum_width=None)
 
     def with_fixed_height(self, height: SizingSpecifierType) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.preferred_height = height
-        sizing_data.minimum_height = height
-        sizing_data.maximum_height = height
-        return Sizing(sizing_data)
+        return self.__with(preferred_height=height, minimum_height=height, maximum_height=height)
 
     def with_fixed_width(self, width: SizingSpecifierType) -> Sizing:
-        sizing_data = self.sizing_data
-        sizing_data.preferred_width = width
-        sizing_data.minimum_width = width
-        sizing_data.maximum_width = width
-        return Sizing(sizing_data)
+        return self.__with(preferred_width=width, minimum_width=width, maximum_width=width)
 
     def with_fixed_size(self, size: Geometry.IntSizeTuple) -> Sizing:
         size_ = Geometry.IntSize.make(size)
-        sizing_data = self.sizing_data
-        sizing_data.preferred_width = size_.width
-        sizing_data.minimum_width = size_.width
-        sizing_data.maximum_width = size_.width
-        sizing_data.preferred_height = size_.height
-        sizing_data.minimum_height = size_.height
-        sizing_data.maximum_height = size_.height
-        return Sizing(sizing_data)
+        return self.__with(preferred_width=size_.width, minimum_width=size_.width, maximum_width=size_.width,
+                           preferred_height=size_.height, minimum_height=size_.height, maximum_height=size_.height)
 
     def get_width_constraint(self, width: typing.Union[int, float]) -> Constraint:
-        """ Create and return a new width Constraint object made from this sizing object. """
-        constraint = Constraint()
-        if self.minimum_width is not None and not isinstance(self.minimum_width, SizingEnum):
-            if isinstance(self.minimum_width, float) and self.minimum_width <= 1.0:
-                constraint.minimum = int(width * self.minimum_width)
-            else:
-                constraint.minimum = int(self.minimum_width)
-        else:
-            constraint.minimum = 0
-        if self.maximum_width is not None and not isinstance(self.maximum_width, SizingEnum):
-            if isinstance(self.maximum_width, float) and self.maximum_width <= 1.0:
-                constraint.maximum = int(width * self.maximum_width)
-            else:
-                constraint.maximum = int(self.maximum_width)
-        else:
-            constraint.maximum = MAX_VALUE
-        if self.preferred_width is not None and not isinstance(self.preferred_width, SizingEnum):
-            if isinstance(self.preferred_width, float) and self.preferred_width <= 1.0:
-                constraint.preferred = int(width * self.preferred_width)
-            else:
-                constraint.preferred = int(self.preferred_width)
-        else:
-            constraint.preferred = None
-        return constraint
+        """ Return a width Constraint object made from this sizing object.
+
+        The constraint is cached and shared; callers must not modify it.
+        """
+        return _get_constraint(self.__minimum_width, self.__maximum_width, self.__preferred_width, width)
 
     def get_height_constraint(self, height: typing.Union[int, float]) -> Constraint:
-        """ Create and return a new height Constraint object made from this sizing object. """
-        constraint = Constraint()
-        if self.minimum_height is not None and not isinstance(self.minimum_height, SizingEnum):
-            if isinstance(self.minimum_height, float) and self.minimum_height <= 1.0:
-                constraint.minimum = int(height * self.minimum_height)
-            else:
-                constraint.minimum = int(self.minimum_height)
-        else:
-            constraint.minimum = 0
-        if self.maximum_height is not None and not isinstance(self.maximum_height, SizingEnum):
-            if isinstance(self.maximum_height, float) and self.maximum_height <= 1.0:
-                constraint.maximum = int(height * self.maximum_height)
-            else:
-                constraint.maximum = int(self.maximum_height)
-        else:
-            constraint.maximum = MAX_VALUE
-        if self.preferred_height is not None and not isinstance(self.preferred_height, SizingEnum):
-            if isinstance(self.preferred_height, float) and self.preferred_height <= 1.0:
-                constraint.preferred = int(height * self.preferred_height)
-            else:
-                constraint.preferred = int(self.preferred_height)
-        else:
-            constraint.preferred = None
-        return constraint
+        """ Return a height Constraint object made from this sizing object.
+
+        The constraint is cached and shared; callers must not modify it.
+        """
+        return _get_constraint(self.__minimum_height, self.__maximum_height, self.__preferred_height, height)
 
     def get_unrestrained_width(self, maximum_width: typing.Union[int, float]) -> int:
         if self.maximum_width is not None and not isinstance(self.maximum_width, SizingEnum):
@@ -595,6 +561,40 @@ class Sizing:
         return Geometry.IntSize(int(self.get_preferred_height()), int(self.get_preferred_width()))
 
 
+@functools.lru_cache(maxsize=4096, typed=True)
+def _intern_sizing(*values: typing.Any) -> Sizing:
+    # typed=True keeps int and float specifiers distinct since floats <= 1.0 are percentages.
+    return Sizing(SizingData(*values))
+
+
+def make_sizing(sizing_data: typing.Optional[SizingData] = None) -> Sizing:
+    """Return an interned sizing object for the sizing data.
+
+    Sizing objects are immutable, so identical sizings can be shared. Prefer this over constructing Sizing directly
+    when the sizing is likely to be repeated across many canvas items.
+    """
+    return _intern_sizing(*dataclasses.astuple(sizing_data or SizingData()))
+
+
+def _resolve_size_specifier(value: SizingSpecifierType, size: typing.Union[int, float]) -> typing.Optional[int]:
+    if value is not None and not isinstance(value, SizingEnum):
+        if isinstance(value, float) and value <= 1.0:
+            return int(size * value)
+        return int(value)
+    return None
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _get_constraint(minimum: SizingSpecifierType, maximum: SizingSpecifierType, preferred: SizingSpecifierType, size: typing.Union[int, float]) -> Constraint:
+    constraint = Constraint()
+    minimum_ = _resolve_size_specifier(minimum, size)
+    maximum_ = _resolve_size_specifier(maximum, size)
+    constraint.minimum = minimum_ if minimum_ is not None else 0
+    constraint.maximum = maximum_ if maximum_ is not None else MAX_VALUE
+    constraint.preferred = _resolve_size_specifier(preferred, size)
+    return constraint
+
+
 class KeyboardModifiers:
     def __init__(self, shift: bool = False, control: bool = False, alt: bool = False, meta: bool = False, keypad: bool = False) -> None:
         self.__shift = shift
@@ -704,6 +704,36 @@ class ComposerCache:
         return cache_value
 
 
+class RepaintAbortedError(Exception):
+    """Raised from a repaint checkpoint when a threaded repaint has been superseded by a newer update."""
+    pass
+
+
+_repaint_state = threading.local()
+
+
+@contextlib.contextmanager
+def _repaint_superseded_check(is_superseded_fn: typing.Callable[[], bool]) -> typing.Iterator[None]:
+    # install the superseded check for repaints running on this thread.
+    old_is_superseded_fn = getattr(_repaint_state, "is_superseded_fn", None)
+    _repaint_state.is_superseded_fn = is_superseded_fn
+    try:
+        yield
+    finally:
+        _repaint_state.is_superseded_fn = old_is_superseded_fn
+
+
+def repaint_checkpoint() -> None:
+    """Abort the current threaded layer repaint if a newer update has superseded it.
+
+    Composers doing lengthy repaints can call this periodically. It raises RepaintAbortedError, which is handled by the
+    layer performing the repaint. Outside of a threaded layer repaint, it does nothing.
+    """
+    is_superseded_fn = getattr(_repaint_state, "is_superseded_fn", None)
+    if is_superseded_fn and is_superseded_fn():
+        raise RepaintAbortedError()
+
+
 class BaseComposer:
     def __init__(self, canvas_item: AbstractCanvasItem, layout_sizing: Sizing, cache: ComposerCache) -> None:
         self.__canvas_item_ref = weakref.ref(canvas_item)
@@ -712,6 +742,7 @@ class BaseComposer:
         self.__actual_visible_rect: typing.Optional[Geometry.IntRect] = None
         self.__canvas_bounds: typing.Optional[Geometry.IntRect] = None
         self.__cache = cache
+        self.__is_opaque = canvas_item.is_opaque
 
     def repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect) -> None:
         # if layout is changed, update it. it may clear the drawing context.
@@ -723,6 +754,8 @@ class BaseComposer:
             try:
                 self._repaint_visible(existing_draw_context, canvas_rect, visible_rect, self.__cache)
                 self._draw_unique_marker(existing_draw_context, canvas_rect)
+            except RepaintAbortedError:
+                raise
             except Exception as e:
                 logging.exception(f"Error in composer repaint {type(self)} {e}")
             self._update_repaint_count()
@@ -736,6 +769,16 @@ class BaseComposer:
         if canvas_item:
             canvas_item._update_repaint_count_from_composer()
 
+    def _update_culled_repaint_count(self, culled_repaint_count: int) -> None:
+        canvas_item = self.__canvas_item_ref()
+        if canvas_item:
+            canvas_item._update_culled_repaint_count_from_composer(culled_repaint_count)
+
+    @property
+    def is_opaque(self) -> bool:
+        """Return whether the canvas item fully paints its bounds."""
+        return self.__is_opaque
+
     # used for debugging
     def _draw_unique_marker(self, drawing_context: DrawingContext.DrawingContext, canvas_bounds: Geometry.IntRect) -> None:
         MARKER_SIZE: typing.Final[int] = 3
@@ -797,6 +840,14 @@ class BaseComposer:
     def _update_layout(self, canvas_bounds: Geometry.IntRect) -> None:
         pass
 
+    def _get_region_key(self, region_rect: Geometry.IntRect) -> typing.Any:
+        """Return a key that changes whenever the drawing within the region rect (in container coordinates) changes.
+
+        The default is the composer itself, which changes whenever the canvas item is updated. Subclasses may return a
+        finer grained key. Call after update_layout.
+        """
+        return self
+
 
 class _BaseContainerInterface(typing.Protocol):
     """Interface to allow canvas items to interact with their containers."""
@@ -857,6 +908,9 @@ class _BaseContainerInterface(typing.Protocol):
 _g_draw_unique_marker = False
 
 
+_lazy_init_lock = threading.Lock()
+
+
 class AbstractCanvasItem:
     """An item drawn on a canvas supporting mouse and keyboard actions.
 
@@ -895,24 +949,36 @@ class AbstractCanvasItem:
     repaint on a thread.
     """
 
+    # canvas items are created in large numbers for lists and grids, so the core attributes are stored in slots and the
+    # locks, streams, event, and composer cache are created lazily on first use.
+    __slots__ = ("__weakref__", "__composer_lock", "__composer", "__composer_last_request_time",
+                 "__composer_last_update_time", "__cache", "__container", "__canvas_size", "__canvas_origin",
+                 "__canvas_size_stream", "__canvas_origin_stream", "__sizing", "__focused", "__focusable",
+                 "wants_mouse_events", "wants_drag_events", "on_focus_changed", "__focus_changed_event",
+                 "__cursor_shape", "__tool_tip", "__background_color", "__border_color", "__visible", "__enabled",
+                 "__thread", "__update_lock", "__update_level", "__update_pending", "_update_count", "_repaint_count",
+                 "_layout_count", "_culled_repaint_count", "_last_culled_repaint_count", "is_root_opaque", "is_opaque",
+                 "_draw_unique_marker")
+
     def __init__(self, cache: typing.Optional[ComposerCache] = None) -> None:
         super().__init__()
-        self.__composer_lock = threading.RLock()
+        self.__composer_lock: typing.Optional[threading.RLock] = None
         self.__composer: typing.Optional[BaseComposer] = None
         self.__composer_last_request_time = 0.0
         self.__composer_last_update_time = 0.0
-        self.__cache = cache or ComposerCache()
+        self.__cache = cache
         self.__container: typing.Optional[CanvasItemComposition] = None
-        self._canvas_size_stream = Stream.ValueStream[Geometry.IntSize]()
-        self._canvas_origin_stream = Stream.ValueStream[Geometry.IntPoint]()
-        self.__sizing = Sizing(SizingData())
-        self.__layout_count = 0
+        self.__canvas_size: typing.Optional[Geometry.IntSize] = None
+        self.__canvas_origin: typing.Optional[Geometry.IntPoint] = None
+        self.__canvas_size_stream: typing.Optional[Stream.ValueStream[Geometry.IntSize]] = None
+        self.__canvas_origin_stream: typing.Optional[Stream.ValueStream[Geometry.IntPoint]] = None
+        self.__sizing = make_sizing()
         self.__focused = False
         self.__focusable = False
         self.wants_mouse_events = False
         self.wants_drag_events = False
         self.on_focus_changed: typing.Optional[typing.Callable[[bool], None]] = None
-        self.focus_changed_event = Event.Event()
+        self.__focus_changed_event: typing.Optional[Event.Event] = None
         self.__cursor_shape: typing.Optional[str] = None
         self.__tool_tip: typing.Optional[str] = None
         self.__background_color: typing.Optional[typing.Union[str, DrawingContext.LinearGradient]] = None
@@ -920,16 +986,90 @@ class AbstractCanvasItem:
         self.__visible = True
         self.__enabled = True
         self.__thread = threading.current_thread()
-        self.__update_lock = threading.RLock()
+        self.__update_lock: typing.Optional[threading.RLock] = None
         self.__update_level = 0  # used for deferred updating
         self.__update_pending = False  # whether update was called during batch update
         # stats for testing
         self._update_count = 0
         self._repaint_count = 0
         self._layout_count = 0
+        self._culled_repaint_count = 0  # total children skipped because they were covered by opaque siblings
+        self._last_culled_repaint_count = 0  # children skipped during the last repaint
         self.is_root_opaque = False
+        # opaque items fully paint their bounds, allowing compositions to skip painting children covered by them.
+        # compositions and background canvas items with a solid background color are opaque without being marked.
+        self.is_opaque = False
         self._draw_unique_marker = False
 
+    @property
+    def __composer_lock_(self) -> threading.RLock:
+        composer_lock = self.__composer_lock
+        if composer_lock is None:
+            with _lazy_init_lock:
+                composer_lock = self.__composer_lock
+                if composer_lock is None:
+                    composer_lock = threading.RLock()
+                    self.__composer_lock = composer_lock
+        return composer_lock
+
+    @property
+    def __update_lock_(self) -> threading.RLock:
+        update_lock = self.__update_lock
+        if update_lock is None:
+            with _lazy_init_lock:
+                update_lock = self.__update_lock
+                if update_lock is None:
+                    update_lock = threading.RLock()
+                    self.__update_lock = update_lock
+        return update_lock
+
+    @property
+    def _canvas_size_stream(self) -> Stream.ValueStream[Geometry.IntSize]:
+        canvas_size_stream = self.__canvas_size_stream
+        if canvas_size_stream is None:
+            with _lazy_init_lock:
+                canvas_size_stream = self.__canvas_size_stream
+                if canvas_size_stream is None:
+                    canvas_size_stream = Stream.ValueStream[Geometry.IntSize]()
+                    # publish the stream before reading the value so a concurrent size change is not lost.
+                    self.__canvas_size_stream = canvas_size_stream
+                    canvas_size_stream.value = self.__canvas_size
+        return canvas_size_stream
+
+    @property
+    def _canvas_origin_stream(self) -> Stream.ValueStream[Geometry.IntPoint]:
+        canvas_origin_stream = self.__canvas_origin_stream
+        if canvas_origin_stream is None:
+            with _lazy_init_lock:
+                canvas_origin_stream = self.__canvas_origin_stream
+                if canvas_origin_stream is None:
+                    canvas_origin_stream = Stream.ValueStream[Geometry.IntPoint]()
+                    # publish the stream before reading the value so a concurrent origin change is not lost.
+                    self.__canvas_origin_stream = canvas_origin_stream
+                    canvas_origin_stream.value = self.__canvas_origin
+        return canvas_origin_stream
+
+    @property
+    def focus_changed_event(self) -> Event.Event:
+        focus_changed_event = self.__focus_changed_event
+        if focus_changed_event is None:
+            with _lazy_init_lock:
+                focus_changed_event = self.__focus_changed_event
+                if focus_changed_event is None:
+                    focus_changed_event = Event.Event()
+                    self.__focus_changed_event = focus_changed_event
+        return focus_changed_event
+
+    def __set_canvas_size_value(self, canvas_size: typing.Optional[Geometry.IntSize]) -> None:
+        self.__canvas_size = canvas_size
+        if canvas_size_stream := self.__canvas_size_stream:
+            canvas_size_stream.value = canvas_size
+
+    def __set_canvas_origin_value(self, canvas_origin: typing.Optional[Geometry.IntPoint]) -> None:
+        self.__canvas_origin = canvas_origin
+        if canvas_origin_stream := self.__canvas_origin_stream:
+            canvas_origin_stream.value = canvas_origin
+
     def close(self) -> None:
         """ Close the canvas object. """
         if threading.current_thread() != self.__thread:
@@ -966,25 +1106,25 @@ class AbstractCanvasItem:
     @property
     def canvas_size(self) -> typing.Optional[Geometry.IntSize]:
         """ Returns size of canvas_rect (external coordinates). """
-        return self._canvas_size_stream.value
+        return self.__canvas_size
 
     def _set_canvas_size(self, canvas_size: typing.Optional[Geometry.IntSizeTuple]) -> None:
-        old_canvas_size_ = self._canvas_size_stream.value
+        old_canvas_size_ = self.__canvas_size
         canvas_size_ = Geometry.IntSize.make(canvas_size) if canvas_size is not None else None
         if ((old_canvas_size_ is None) != (canvas_size_ is None)) or (old_canvas_size_ != canvas_size_):
-            self._canvas_size_stream.value = canvas_size_
+            self.__set_canvas_size_value(canvas_size_)
             self.update()
 
     @property
     def canvas_origin(self) -> typing.Optional[Geometry.IntPoint]:
         """ Returns origin of canvas_rect (external coordinates). """
-        return self._canvas_origin_stream.value
+        return self.__canvas_origin
 
     def _set_canvas_origin(self, canvas_origin: typing.Optional[Geometry.IntPointTuple]) -> None:
-        old_canvas_origin_ = self._canvas_origin_stream.value
+        old_canvas_origin_ = self.__canvas_origin
         canvas_origin_ = Geometry.IntPoint.make(canvas_origin) if canvas_origin is not None else None
         if ((old_canvas_origin_ is None) != (canvas_origin_ is None)) or (old_canvas_origin_ != canvas_origin_):
-            self._canvas_origin_stream.value = canvas_origin_
+            self.__set_canvas_origin_value(canvas_origin_)
             self.update()
 
     @property
@@ -1065,7 +1205,8 @@ class AbstractCanvasItem:
             self.update()
             if callable(self.on_focus_changed):
                 self.on_focus_changed(focused)
-            self.focus_changed_event.fire()
+            if focus_changed_event := self.__focus_changed_event:
+                focus_changed_event.fire()
 
     def _request_focus(self, p: typing.Optional[Geometry.IntPoint] = None,
                        modifiers: typing.Optional[UserInterface.KeyboardModifiers] = None) -> None:
@@ -1214,6 +1355,8 @@ class AbstractCanvasItem:
         if self.__visible != value:
             self.__visible = value
             self.update()
+            if value:
+                animation_timeline.visibility_changed()
             # the regular update path will only invalidate the composer and call _updated
             # if the item is visible. if we just set it to not visible, we need to call it
             # here to get things to update properly. hack. one place where this would show
@@ -1265,7 +1408,7 @@ class AbstractCanvasItem:
             self.update()
 
     def _begin_batch_update(self) -> None:
-        with self.__update_lock:
+        with self.__update_lock_:
             # Reset state at the start of each outermost batch. Call _batch_update_started to allow subclasses to
             # know when a batch update is starting.
             if self.__update_level == 0:
@@ -1275,13 +1418,15 @@ class AbstractCanvasItem:
             self.__update_level += 1
 
     def _end_batch_update(self) -> None:
-        with self.__update_lock:
+        with self.__update_lock_:
+            # When the outermost batch update is ending, call _batch_update_ended to allow subclasses to know. It is
+            # called before the level reaches zero so that updates requested by subclasses join this batch.
+            if self.__update_level == 1:
+                self._batch_update_ended()
             # Count the update level so that the first/last batch update can be determined.
             self.__update_level -= 1
-            # When `__update_level` reaches zero, call _batch_update_ended to allow subclasses to know when a batch
-            # update is ending. If an update is pending, call _update to trigger an update.
+            # When `__update_level` reaches zero, if an update is pending, call _update to trigger an update.
             if self.__update_level == 0:
-                self._batch_update_ended()
                 if self.__update_pending:
                     self._update()
 
@@ -1337,6 +1482,13 @@ class AbstractCanvasItem:
         """Force full redraw of this item. Used for resolution changes. Subclasses may override."""
         self.update()
 
+    def _animation_tick(self, animation_time: float) -> None:
+        """Advance the animation to the animation time (seconds). Called from the animation timeline when registered.
+
+        Subclasses may override.
+        """
+        pass
+
     def _updated(self) -> None:
         # Notify this canvas item that a child has been updated, repaint if needed at next opportunity.
         # thread-safe
@@ -1349,16 +1501,37 @@ class AbstractCanvasItem:
         self.update()
 
     def _get_composer_cache(self) -> ComposerCache:
-        return self.__cache
+        cache = self.__cache
+        if cache is None:
+            with _lazy_init_lock:
+                cache = self.__cache
+                if cache is None:
+                    cache = ComposerCache()
+                    self.__cache = cache
+        return cache
 
     def _invalidate_composer(self) -> None:
         # avoid the race condition where the composer gets set in _get_composer_inner immediately after
         # being cleared here and no further updates occur, resulting in an incorrect composer.
-        with self.__composer_lock:
+        # if the composer lock has not been created, a composer has never been requested and there is nothing to do.
+        composer_lock = self.__composer_lock
+        if composer_lock is None:
+            return
+        with composer_lock:
             self.__composer = None
             # record the last request time so that get composed knows whether it is out of date or not.
             self.__composer_last_request_time = time.time()
 
+    def _evict_composer(self) -> None:
+        """Release the cached composer without marking the item as needing an update.
+
+        The composer will be rebuilt when it is next requested.
+        """
+        composer_lock = self.__composer_lock
+        if composer_lock:
+            with composer_lock:
+                self.__composer = None
+
     def get_composer(self, cache: ComposerCache) -> typing.Optional[BaseComposer]:
         """Return the composer for this canvas item. Subclasses should not override.
 
@@ -1370,7 +1543,7 @@ class AbstractCanvasItem:
         return self._get_composer_inner(cache)
 
     def _get_composer_inner(self, cache: ComposerCache) -> typing.Optional[BaseComposer]:
-        with self.__composer_lock:
+        with self.__composer_lock_:
             # if either the composer is missing or the last request time is newer than the last update time,
             # then we need to get the composer. the last update time is updated when the composer is generated.
             if not self.__composer or self.__composer_last_request_time > self.__composer_last_update_time:
@@ -1382,6 +1555,10 @@ class AbstractCanvasItem:
     def _get_composer(self, composer_cache: ComposerCache) -> typing.Optional[BaseComposer]:
         return None
 
+    def _is_content_opaque(self) -> bool:
+        # return whether drawing this item is known to fill its bounds. subclasses may derive it from what they draw.
+        return self.is_opaque
+
     def get_composer_immediate(self, composer_cache: ComposerCache) -> typing.Optional[BaseComposer]:
         return self.get_composer(composer_cache)
 
@@ -1415,15 +1592,19 @@ class AbstractCanvasItem:
     def _update_repaint_count_from_composer(self) -> None:
         self._repaint_count += 1
 
+    def _update_culled_repaint_count_from_composer(self, culled_repaint_count: int) -> None:
+        self._culled_repaint_count += culled_repaint_count
+        self._last_culled_repaint_count = culled_repaint_count
+
     def _update_layout_from_composer(self, canvas_bounds: Geometry.IntRect) -> None:
         did_layout_change = False
-        old_canvas_origin_ = self._canvas_origin_stream.value
+        old_canvas_origin_ = self.__canvas_origin
         if (old_canvas_origin_ is None) or (old_canvas_origin_ != canvas_bounds.origin):
-            self._canvas_origin_stream.value = canvas_bounds.origin
+            self.__set_canvas_origin_value(canvas_bounds.origin)
             did_layout_change = True
-        old_canvas_size_ = self._canvas_size_stream.value
+        old_canvas_size_ = self.__canvas_size
         if (old_canvas_size_ is None) or (old_canvas_size_ != canvas_bounds.size):
-            self._canvas_size_stream.value = canvas_bounds.size
+            self.__set_canvas_size_value(canvas_bounds.size)
             did_layout_change = True
         self._layout_count += 1 if did_layout_change else 0
         if did_layout_change:
@@ -2081,6 +2262,28 @@ class CanvasItemGridLayout(CanvasItemAbstractLayout):
         return Sizing(sizing_data)
 
 
+def _is_rect_covered(rect: Geometry.IntRect, covering_rect: Geometry.IntRect) -> bool:
+    return (covering_rect.left <= rect.left and covering_rect.top <= rect.top and
+            rect.right <= covering_rect.right and rect.bottom <= covering_rect.bottom)
+
+
+def _is_opaque_color(color: typing.Optional[typing.Union[str, DrawingContext.LinearGradient]]) -> bool:
+    # return whether the color is known to be fully opaque. gradients and unrecognized colors are not.
+    if not isinstance(color, str):
+        return False
+    color = color.strip().lower()
+    if color.startswith("rgba("):
+        try:
+            return float(color[5:-1].split(",")[3]) >= 1.0
+        except (IndexError, ValueError):
+            return False
+    if color.startswith("rgb("):
+        return True
+    if color.startswith("#"):
+        return len(color) in (4, 7)
+    return color in Color.svg_color_map
+
+
 class CanvasItemCompositionComposer(BaseComposer):
     def __init__(self,
                  canvas_item: AbstractCanvasItem,
@@ -2095,9 +2298,37 @@ class CanvasItemCompositionComposer(BaseComposer):
         self.__child_composers = child_composers
         self.__background_color = background_color
         self.__border_color = border_color
+        self.__region_keys = dict[Geometry.IntRect, typing.Any]()
+        self.__is_background_opaque = _is_opaque_color(background_color)
+
+    @property
+    def is_opaque(self) -> bool:
+        # a solid background fills the bounds before the children are drawn.
+        return self.__is_background_opaque or super().is_opaque
 
     def _update_layout(self, canvas_bounds: Geometry.IntRect) -> None:
         self.__layout.layout(Geometry.IntPoint(), canvas_bounds.size, self.__child_composers)
+        self.__region_keys = dict()
+
+    def _get_region_key(self, region_rect: Geometry.IntRect) -> typing.Any:
+        # the region key is made from the child composers intersecting the region, which only change when those
+        # children are updated. this is only valid if the drawing is done by the base class methods. the keys are
+        # remembered for the life of this composer (or until the next layout).
+        if type(self)._repaint_visible is not CanvasItemCompositionComposer._repaint_visible or type(self)._repaint_children is not CanvasItemCompositionComposer._repaint_children:
+            return super()._get_region_key(region_rect)
+        region_key = self.__region_keys.get(region_rect)
+        if region_key is None:
+            canvas_bounds = self._canvas_bounds
+            child_region_rect = region_rect - canvas_bounds.origin
+            top, left, bottom, right = child_region_rect.top, child_region_rect.left, child_region_rect.bottom, child_region_rect.right
+            child_keys = list[typing.Any]()
+            for child_composer in self.__child_composers:
+                (child_top, child_left), (child_height, child_width) = child_composer._canvas_bounds
+                if child_left < right and left < child_left + child_width and child_top < bottom and top < child_top + child_height:
+                    child_keys.append((child_composer._get_region_key(child_region_rect), child_composer._canvas_bounds))
+            region_key = canvas_bounds, self.__background_color, self.__border_color, tuple(child_keys)
+            self.__region_keys[region_rect] = region_key
+        return region_key
 
     def _repaint_visible(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect, composer_cache: ComposerCache) -> None:
         self.__draw_background(drawing_context, canvas_rect, self.__background_color)
@@ -2109,10 +2340,29 @@ class CanvasItemCompositionComposer(BaseComposer):
         with drawing_context.saver():
             drawing_context.translate(canvas_rect.left, canvas_rect.top)
             visible_rect -= canvas_rect.origin
-            for child_composer in child_composers:
+            # occlusion culling: working back to front, skip children whose visible part is entirely covered by a
+            # later (drawn on top) opaque child.
+            opaque_rects = list[Geometry.IntRect]()
+            paint_child_composers = list[BaseComposer]()
+            culled_repaint_count = 0
+            now = time.perf_counter()
+            for child_composer in reversed(child_composers):
                 child_canvas_rect = child_composer._canvas_bounds
-                if visible_rect.intersects_rect(child_canvas_rect):
-                    child_composer.repaint(drawing_context, child_canvas_rect, visible_rect)
+                if not visible_rect.intersects_rect(child_canvas_rect):
+                    if isinstance(child_composer, DeferredChildComposer):
+                        child_composer._check_eviction(now)
+                else:
+                    child_visible_rect = child_canvas_rect.intersect(visible_rect)
+                    if any(_is_rect_covered(child_visible_rect, opaque_rect) for opaque_rect in opaque_rects):
+                        culled_repaint_count += 1
+                        continue
+                    paint_child_composers.append(child_composer)
+                    if child_composer.is_opaque:
+                        opaque_rects.append(child_canvas_rect)
+            for child_composer in reversed(paint_child_composers):
+                repaint_checkpoint()
+                child_composer.repaint(drawing_context, child_composer._canvas_bounds, visible_rect)
+            self._update_culled_repaint_count(culled_repaint_count)
 
     def __draw_background(self, drawing_context: DrawingContext.DrawingContext, canvas_bounds: Geometry.IntRect, background_color: typing.Optional[typing.Union[str, DrawingContext.LinearGradient]]) -> None:
         if background_color:
@@ -2131,6 +2381,25 @@ class CanvasItemCompositionComposer(BaseComposer):
                 drawing_context.stroke()
 
 
+@dataclasses.dataclass
+class CanvasItemPoolStats:
+    """Statistics for the canvas item recycling pool of a composition."""
+    acquire_count: int = 0
+    hit_count: int = 0
+    release_count: int = 0
+    discard_count: int = 0
+
+    @property
+    def created_count(self) -> int:
+        """Return the number of acquired canvas items that had to be created."""
+        return self.acquire_count - self.hit_count
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of acquired canvas items that came from the pool."""
+        return self.hit_count / self.acquire_count if self.acquire_count else 0.0
+
+
 class CanvasItemComposition(AbstractCanvasItem):
     """A composite canvas item comprised of other canvas items.
 
@@ -2145,11 +2414,24 @@ class CanvasItemComposition(AbstractCanvasItem):
         super().__init__()
         self.__canvas_items: typing.List[AbstractCanvasItem] = list()
         self.layout: CanvasItemAbstractLayout = CanvasItemLayout()
+        # when deferring, child composers are only built once the child intersects the visible rect during repaint.
+        # this is useful for long content in a scroll area. optionally, child composers that have not been painted
+        # for the eviction interval are released.
+        self.defer_child_composers = False
+        self.composer_eviction_interval: typing.Optional[float] = None
+        self.__child_paint_times = weakref.WeakKeyDictionary[AbstractCanvasItem, float]()
+        # recycling pool. released children are kept for reuse (up to the pool capacity) instead of being closed.
+        self.pool_capacity = 0
+        self.__pool = list[AbstractCanvasItem]()
+        self.__pool_stats = CanvasItemPoolStats()
 
     def close(self) -> None:
         canvas_items = self.canvas_items
         for canvas_item in canvas_items:
             canvas_item.close()
+        for canvas_item in self.__pool:
+            canvas_item.close()
+        self.__pool.clear()
         # this goes after closing; if this goes before closing, threaded canvas items don't get closed properly
         # since they notify their container (to cull). to reproduce the bug, create a 1x2, then a 4x3 in the bottom.
         # then close several panels and undo. not sure if this is  the permanent fix or not. reset to a list rather
@@ -2166,6 +2448,16 @@ class CanvasItemComposition(AbstractCanvasItem):
     def _base_remove_canvas_item(self, canvas_item: AbstractCanvasItem) -> None:
         self.__canvas_items.remove(canvas_item)
 
+    def _base_insert_canvas_items(self, before_index: int, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        self.__canvas_items[before_index:before_index] = canvas_items
+
+    def _base_remove_canvas_items(self, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        removed_ids = {id(canvas_item) for canvas_item in canvas_items}
+        self.__canvas_items[:] = [canvas_item for canvas_item in self.__canvas_items if id(canvas_item) not in removed_ids]
+
+    def _base_reorder_canvas_items(self, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        self.__canvas_items[:] = canvas_items
+
     @property
     def canvas_items_count(self) -> int:
         """Return count of canvas items managed by this composition."""
@@ -2242,6 +2534,7 @@ class CanvasItemComposition(AbstractCanvasItem):
         self.layout.add_canvas_item(canvas_item, pos)
         # trigger layout of both this item and the container.
         self.update()
+        animation_timeline.visibility_changed()
         return canvas_item
 
     def insert_spacing(self, before_index: int, spacing: int) -> AbstractCanvasItem:
@@ -2280,6 +2573,98 @@ class CanvasItemComposition(AbstractCanvasItem):
         for canvas_item in reversed(self.canvas_items):
             self._remove_canvas_item(canvas_item)
 
+    def detach_canvas_item(self, canvas_item: AbstractCanvasItem) -> None:
+        """ Remove canvas item from layout without closing it. The caller becomes responsible for closing it. """
+        canvas_item._removed(self)
+        self.layout.remove_canvas_item(canvas_item)
+        canvas_item.container = None
+        self._base_remove_canvas_item(canvas_item)
+        canvas_item._evict_composer()
+        # trigger layout of both this item and the container.
+        self.update()
+
+    def acquire_canvas_item(self, before_index: int, create_fn: typing.Callable[[], AbstractCanvasItem],
+                            reset_fn: typing.Optional[typing.Callable[[AbstractCanvasItem], None]] = None,
+                            pos: typing.Optional[typing.Any] = None) -> AbstractCanvasItem:
+        """Insert a canvas item from the recycling pool; or a new one from create_fn if the pool is empty.
+
+        A recycled canvas item is passed to reset_fn to rebind it to new content before it is inserted.
+        """
+        self.__pool_stats.acquire_count += 1
+        if self.__pool:
+            canvas_item = self.__pool.pop()
+            self.__pool_stats.hit_count += 1
+            if callable(reset_fn):
+                reset_fn(canvas_item)
+        else:
+            canvas_item = create_fn()
+        return self.insert_canvas_item(before_index, canvas_item, pos)
+
+    def release_canvas_item(self, canvas_item: AbstractCanvasItem) -> None:
+        """Remove the canvas item and keep it in the recycling pool. The canvas item is closed if the pool is full."""
+        self.__pool_stats.release_count += 1
+        if len(self.__pool) < self.pool_capacity:
+            self.detach_canvas_item(canvas_item)
+            self.__pool.append(canvas_item)
+        else:
+            self.__pool_stats.discard_count += 1
+            self._remove_canvas_item(canvas_item)
+
+    def acquire_canvas_items(self, before_index: int, count: int, create_fn: typing.Callable[[int], AbstractCanvasItem],
+                             reset_fn: typing.Optional[typing.Callable[[int, AbstractCanvasItem], None]] = None) -> typing.Sequence[AbstractCanvasItem]:
+        """Insert count canvas items at before_index in one step, taking them from the recycling pool first.
+
+        create_fn and reset_fn are passed the offset of the canvas item within the inserted range.
+        """
+        canvas_items = list[AbstractCanvasItem]()
+        for offset in range(count):
+            self.__pool_stats.acquire_count += 1
+            if self.__pool:
+                canvas_item = self.__pool.pop()
+                self.__pool_stats.hit_count += 1
+                if callable(reset_fn):
+                    reset_fn(offset, canvas_item)
+            else:
+                canvas_item = create_fn(offset)
+            canvas_items.append(canvas_item)
+        self._base_insert_canvas_items(before_index, canvas_items)
+        for canvas_item in canvas_items:
+            canvas_item.container = self
+            canvas_item._inserted(self)
+            self.layout.add_canvas_item(canvas_item, None)
+        self.update()
+        animation_timeline.visibility_changed()
+        return canvas_items
+
+    def release_canvas_items(self, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        """Remove the canvas items in one step, keeping them in the recycling pool until it is full."""
+        for canvas_item in canvas_items:
+            self.__pool_stats.release_count += 1
+            canvas_item._removed(self)
+            self.layout.remove_canvas_item(canvas_item)
+            canvas_item.container = None
+        self._base_remove_canvas_items(canvas_items)
+        for canvas_item in canvas_items:
+            if len(self.__pool) < self.pool_capacity:
+                canvas_item._evict_composer()
+                self.__pool.append(canvas_item)
+            else:
+                self.__pool_stats.discard_count += 1
+                canvas_item.close()
+        self.update()
+
+    def reorder_canvas_items(self, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        """Put the canvas items, which must be the current canvas items, in the given order."""
+        if len(canvas_items) != self.canvas_items_count or {id(canvas_item) for canvas_item in canvas_items} != {id(canvas_item) for canvas_item in self.canvas_items}:
+            raise ValueError("Reordered canvas items must be the current canvas items.")
+        self._base_reorder_canvas_items(canvas_items)
+        self.update()
+
+    @property
+    def pool_stats(self) -> CanvasItemPoolStats:
+        """Return a copy of the recycling pool statistics."""
+        return copy.copy(self.__pool_stats)
+
     def replace_canvas_item(self, old_canvas_item: AbstractCanvasItem, new_canvas_item: AbstractCanvasItem) -> None:
         """ Replace the given canvas item with the new one. Canvas item is closed. """
         index = self.canvas_items.index(old_canvas_item)
@@ -2358,8 +2743,30 @@ class CanvasItemComposition(AbstractCanvasItem):
         # update the layout if origin and size already known
         self.update()
 
+    def _evict_composer(self) -> None:
+        super()._evict_composer()
+        for canvas_item in self.canvas_items:
+            canvas_item._evict_composer()
+
+    def _is_content_opaque(self) -> bool:
+        # a solid background or a visible opaque child covering the bounds fills the bounds.
+        if super()._is_content_opaque() or _is_opaque_color(self.background_color):
+            return True
+        canvas_size = self.canvas_size
+        if canvas_size:
+            canvas_bounds = Geometry.IntRect(Geometry.IntPoint(), canvas_size)
+            for canvas_item in self.visible_canvas_items:
+                canvas_rect = canvas_item.canvas_rect
+                if canvas_rect and _is_rect_covered(canvas_bounds, canvas_rect) and canvas_item._is_content_opaque():
+                    return True
+        return False
+
     def _get_composer(self, composer_cache: ComposerCache) -> typing.Optional[BaseComposer]:
         child_composers = list[BaseComposer]()
+        if self.defer_child_composers:
+            for canvas_item in self.visible_canvas_items:
+                child_composers.append(DeferredChildComposer(canvas_item, canvas_item.layout_sizing, composer_cache, self.__child_paint_times, self.composer_eviction_interval))
+            return self._get_composition_composer(child_composers, composer_cache)
         for canvas_item in self.visible_canvas_items:
             composer = canvas_item.get_composer(composer_cache)
             if composer:
@@ -2423,6 +2830,55 @@ class CanvasItemComposition(AbstractCanvasItem):
         return False
 
 
+class DeferredChildComposer(BaseComposer):
+    """A placeholder composer for a child of a composition that builds the child composer when first painted.
+
+    The placeholder takes part in layout using the child layout sizing. The child composer is built when the child
+    first intersects the visible rect. If an eviction interval is given, the child composer is released after the child
+    has not been painted for that interval.
+    """
+
+    def __init__(self, canvas_item: AbstractCanvasItem, layout_sizing: Sizing, cache: ComposerCache,
+                 paint_times: weakref.WeakKeyDictionary[AbstractCanvasItem, float],
+                 eviction_interval: typing.Optional[float]) -> None:
+        super().__init__(canvas_item, layout_sizing, cache)
+        self.__cache = cache
+        self.__paint_times = paint_times
+        self.__eviction_interval = eviction_interval
+        self.__composer: typing.Optional[BaseComposer] = None
+
+    @property
+    def is_opaque(self) -> bool:
+        composer = self.__composer
+        return composer.is_opaque if composer else super().is_opaque
+
+    def repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect) -> None:
+        canvas_item = self._canvas_item
+        composer = self.__composer or canvas_item.get_composer(self.__cache)
+        self.__composer = composer
+        self.__paint_times[canvas_item] = time.perf_counter()
+        if composer:
+            composer.repaint(drawing_context, canvas_rect, visible_rect)
+
+    def _get_region_key(self, region_rect: Geometry.IntRect) -> typing.Any:
+        # the placeholder is rebuilt with its container; use the child composer, which is only rebuilt on update.
+        canvas_item = self._canvas_item
+        composer = self.__composer or canvas_item.get_composer(self.__cache)
+        self.__composer = composer
+        if composer:
+            composer.update_layout(self._canvas_bounds.origin, self._canvas_bounds.size)
+            return composer._get_region_key(region_rect)
+        return None
+
+    def _check_eviction(self, now: float) -> None:
+        # called when the child is not painted. release the child composer if it has been unpainted for too long.
+        if self.__composer and self.__eviction_interval is not None:
+            canvas_item = self._canvas_item
+            if now - self.__paint_times.get(canvas_item, 0.0) >= self.__eviction_interval:
+                self.__composer = None
+                canvas_item._evict_composer()
+
+
 class DrawingContextCanvasItemComposer(BaseComposer):
     def __init__(self, canvas_item: AbstractCanvasItem, layout_sizing: Sizing, cache: ComposerCache, drawing_context: typing.Optional[DrawingContext.DrawingContext]) -> None:
         super().__init__(canvas_item, layout_sizing, cache)
@@ -2442,21 +2898,498 @@ class DrawingContextCanvasItemComposer(BaseComposer):
 
 _threaded_rendering_enabled = True
 
+# the clock used to measure layer update rates. replaceable for testing.
+_update_rate_clock: typing.Callable[[], float] = time.perf_counter
+
+
+class RenderPriority(enum.IntEnum):
+    """Priority classes for layer repaints. Lower values run first."""
+    FOCUSED = 0
+    VISIBLE = 1
+    BACKGROUND = 2
+
+
+@dataclasses.dataclass
+class RenderQueueStats:
+    """Queue wait time statistics for a render key, typically a layer."""
+    last_wait_time: float = 0.0
+    maximum_wait_time: float = 0.0
+    total_wait_time: float = 0.0
+    count: int = 0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.count if self.count else 0.0
+
+
+class _RenderWorkItem:
+    __slots__ = ("future", "fn", "key", "enqueue_time")
+
+    def __init__(self, future: concurrent.futures.Future[typing.Any], fn: typing.Callable[[], typing.Any], key: typing.Any, enqueue_time: float) -> None:
+        self.future = future
+        self.fn = fn
+        self.key = key
+        self.enqueue_time = enqueue_time
+
+
+class RenderScheduler(concurrent.futures.Executor):
+    """An executor for layer repaints with priorities, per-group fairness, and starvation protection.
+
+    Work is taken from the highest priority class first. Within a priority class, groups (typically one per base
+    container, i.e. per window) are served round-robin so that a busy window cannot monopolize the workers. Any work
+    that has waited longer than the starvation interval runs next, regardless of priority.
+
+    The number of worker threads is bounded by max_workers. Workers are created on demand.
+
+    Queue wait times are recorded per key (typically the layer) and available via get_queue_stats.
+
+    Plain submit calls run with visible priority in a shared group, so this can be used anywhere an executor is used.
+    """
+
+    def __init__(self, max_workers: typing.Optional[int] = None, starvation_interval: float = 0.5) -> None:
+        self.__max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.__starvation_interval = starvation_interval
+        self.__condition = threading.Condition()
+        self.__queues = {priority: collections.OrderedDict[typing.Any, collections.deque[_RenderWorkItem]]() for priority in RenderPriority}
+        self.__pending_count = 0
+        self.__idle_count = 0
+        self.__threads = list[threading.Thread]()
+        self.__shutdown = False
+        self.__queue_stats = weakref.WeakKeyDictionary[typing.Any, RenderQueueStats]()
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    def submit(self, fn: typing.Callable[..., typing.Any], /, *args: typing.Any, **kwargs: typing.Any) -> concurrent.futures.Future[typing.Any]:
+        return self.submit_render(functools.partial(fn, *args, **kwargs))
+
+    def submit_render(self, fn: typing.Callable[[], typing.Any], *, priority: RenderPriority = RenderPriority.VISIBLE,
+                      group: typing.Any = None, key: typing.Any = None) -> concurrent.futures.Future[typing.Any]:
+        """Submit a render function with the priority, fairness group, and stats key. Returns a future."""
+        future = concurrent.futures.Future[typing.Any]()
+        with self.__condition:
+            if self.__shutdown:
+                raise RuntimeError("cannot schedule new renders after shutdown")
+            groups = self.__queues[priority]
+            work_items = groups.get(group)
+            if work_items is None:
+                work_items = collections.deque()
+                groups[group] = work_items
+            work_items.append(_RenderWorkItem(future, fn, key, time.perf_counter()))
+            self.__pending_count += 1
+            if self.__pending_count > self.__idle_count and len(self.__threads) < self.__max_workers:
+                thread = threading.Thread(target=self.__run_worker, name="render-scheduler", daemon=True)
+                self.__threads.append(thread)
+                thread.start()
+            self.__condition.notify()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self.__condition:
+            self.__shutdown = True
+            if cancel_futures:
+                for groups in self.__queues.values():
+                    for work_items in groups.values():
+                        for work_item in work_items:
+                            work_item.future.cancel()
+                    groups.clear()
+                self.__pending_count = 0
+            self.__condition.notify_all()
+            threads = list(self.__threads)
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    def get_queue_stats(self, key: typing.Any) -> typing.Optional[RenderQueueStats]:
+        """Return the queue wait time statistics for the key, if any work for it has started."""
+        with self.__condition:
+            queue_stats = self.__queue_stats.get(key)
+            return dataclasses.replace(queue_stats) if queue_stats else None
+
+    def __take_work_item(self) -> _RenderWorkItem:
+        # called with the condition lock held and at least one pending work item.
+        now = time.perf_counter()
+        oldest: typing.Optional[typing.Tuple[_RenderWorkItem, RenderPriority, typing.Any]] = None
+        for priority, groups in self.__queues.items():
+            for group, work_items in groups.items():
+                if oldest is None or work_items[0].enqueue_time < oldest[0].enqueue_time:
+                    oldest = work_items[0], priority, group
+        assert oldest is not None
+        priority, group = oldest[1], oldest[2]
+        # starvation protection: anything waiting longer than the interval runs next. otherwise take the highest
+        # priority class and serve its groups round-robin.
+        if now - oldest[0].enqueue_time < self.__starvation_interval:
+            priority = next(priority for priority, groups in self.__queues.items() if groups)
+            group = next(iter(self.__queues[priority]))
+        groups = self.__queues[priority]
+        work_items = groups[group]
+        work_item = work_items.popleft()
+        if work_items:
+            groups.move_to_end(group)
+        else:
+            groups.pop(group)
+        self.__pending_count -= 1
+        if work_item.key is not None:
+            wait_time = now - work_item.enqueue_time
+            queue_stats = self.__queue_stats.setdefault(work_item.key, RenderQueueStats())
+            queue_stats.last_wait_time = wait_time
+            queue_stats.maximum_wait_time = max(queue_stats.maximum_wait_time, wait_time)
+            queue_stats.total_wait_time += wait_time
+            queue_stats.count += 1
+        return work_item
+
+    def __run_worker(self) -> None:
+        while True:
+            with self.__condition:
+                while not self.__pending_count and not self.__shutdown:
+                    self.__idle_count += 1
+                    self.__condition.wait()
+                    self.__idle_count -= 1
+                if not self.__pending_count:
+                    self.__threads.remove(threading.current_thread())
+                    return
+                work_item = self.__take_work_item()
+            if work_item.future.set_running_or_notify_cancel():
+                try:
+                    work_item.future.set_result(work_item.fn())
+                except BaseException as e:
+                    work_item.future.set_exception(e)
+            del work_item
+
+
+class FrameClock:
+    """A clock to batch layer repaint requests into frames.
+
+    Layers request a frame at a particular time. Requests from the same layer are coalesced and all requests that are
+    due are run together as one batch on the clock thread. The clock thread is only running while there are pending
+    requests.
+
+    The frame rate limits how often each layer repaints. The inactive frame rate is used instead when the is active
+    function reports that the window is inactive (low-power mode). A frame rate of zero means unlimited.
+    """
+
+    def __init__(self, frame_rate: float = 60.0, inactive_frame_rate: float = 10.0, is_active_fn: typing.Optional[typing.Callable[[], bool]] = None) -> None:
+        self.frame_rate = frame_rate
+        self.inactive_frame_rate = inactive_frame_rate
+        self.__is_active_fn = is_active_fn
+        self.__condition = threading.Condition()
+        self.__requests = dict[typing.Any, typing.Tuple[float, typing.Callable[[], None]]]()
+        self.__thread: typing.Optional[threading.Thread] = None
+        self.__closed = False
+        # stats for testing
+        self._frame_count = 0
+
+    def close(self) -> None:
+        with self.__condition:
+            self.__closed = True
+            self.__requests.clear()
+            self.__condition.notify_all()
+
+    @property
+    def is_active(self) -> bool:
+        return self.__is_active_fn() if self.__is_active_fn else True
+
+    @property
+    def frame_interval(self) -> float:
+        """Return the current minimum interval between frames, in seconds."""
+        frame_rate = self.frame_rate if self.is_active else self.inactive_frame_rate
+        return 1.0 / frame_rate if frame_rate > 0 else 0.0
+
+    def request_frame(self, key: typing.Any, fn: typing.Callable[[], None], frame_time: float) -> None:
+        """Call fn on the clock thread at or after frame_time (a time.perf_counter value).
+
+        Requests with the same key are coalesced, keeping the earliest frame time.
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+            existing_request = self.__requests.get(key)
+            if existing_request:
+                frame_time = min(frame_time, existing_request[0])
+            self.__requests[key] = frame_time, fn
+            if not self.__thread:
+                self.__thread = threading.Thread(target=self.__run, name="frame-clock", daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                while True:
+                    if self.__closed or not self.__requests:
+                        self.__thread = None
+                        return
+                    now = time.perf_counter()
+                    next_frame_time = min(frame_time for frame_time, fn in self.__requests.values())
+                    if next_frame_time <= now:
+                        break
+                    self.__condition.wait(next_frame_time - now)
+                due_keys = [key for key, (frame_time, fn) in self.__requests.items() if frame_time <= now]
+                fns = [self.__requests.pop(key)[1] for key in due_keys]
+                self._frame_count += 1
+            for fn in fns:
+                try:
+                    fn()
+                except Exception as e:
+                    logging.exception(f"Error in frame clock callback {e}")
+
+
+# used for layers which are not in a canvas widget hierarchy. unlimited, but honors per layer maximum frame rates.
+_default_frame_clock = FrameClock(frame_rate=0.0, inactive_frame_rate=0.0)
+
+
+def _is_animation_visible(canvas_item: AbstractCanvasItem) -> bool:
+    # animations are paused for hidden items, items in hidden containers, and items not in a visible canvas widget.
+    container: typing.Optional[AbstractCanvasItem] = canvas_item
+    while container:
+        if not container.visible:
+            return False
+        container = container.container
+    base_container = canvas_item._base_container
+    if isinstance(base_container, CanvasWidgetCanvasItem):
+        return base_container.is_canvas_visible
+    return base_container is not None
+
+
+class AnimationTimeline:
+    """A timeline to tick registered animated canvas items together, once per frame.
+
+    Registered items have _animation_tick called with the timeline time. Items within the same canvas widget are ticked
+    within a single batch update so that their updates result in a single repaint per frame. Items that are not visible
+    are not ticked. When reduced motion is enabled, no items are ticked and animated items should draw statically.
+
+    The timeline thread only runs while items are registered and threaded rendering is enabled. Otherwise (typically
+    during testing), call tick directly. When none of the registered items are visible, the thread waits until an item
+    is registered or unregistered or until visibility_changed is called.
+    """
+
+    def __init__(self, frame_rate: float = 60.0) -> None:
+        self.frame_rate = frame_rate
+        self.__condition = threading.Condition()
+        self.__canvas_items = weakref.WeakSet[AbstractCanvasItem]()
+        self.__reduced_motion = False
+        self.__thread: typing.Optional[threading.Thread] = None
+        self.__start_time = time.perf_counter()
+        self.__change_count = 0  # incremented on changes that may wake the thread when idle
+        # stats for testing
+        self._frame_count = 0
+        self._tick_count = 0
+        self._idle_count = 0
+
+    @property
+    def time(self) -> float:
+        """Return the timeline time, in seconds."""
+        return time.perf_counter() - self.__start_time
+
+    @property
+    def reduced_motion(self) -> bool:
+        return self.__reduced_motion
+
+    @reduced_motion.setter
+    def reduced_motion(self, value: bool) -> None:
+        with self.__condition:
+            self.__reduced_motion = value
+            canvas_items = list(self.__canvas_items)
+            self.__start_thread_if_needed()
+        # animated items draw differently with reduced motion.
+        for canvas_item in canvas_items:
+            canvas_item.update()
+
+    def register(self, canvas_item: AbstractCanvasItem) -> None:
+        """Register the canvas item to be ticked each frame. The timeline does not keep the canvas item alive."""
+        with self.__condition:
+            self.__canvas_items.add(canvas_item)
+            self.__start_thread_if_needed()
+
+    def unregister(self, canvas_item: AbstractCanvasItem) -> None:
+        with self.__condition:
+            self.__canvas_items.discard(canvas_item)
+            self.__changed()
+
+    def visibility_changed(self) -> None:
+        """Wake the timeline after a change that may make a registered item visible. Thread safe."""
+        if self.__canvas_items:
+            with self.__condition:
+                self.__changed()
+
+    def tick(self) -> None:
+        """Tick the visible registered items once."""
+        self.__tick()
+
+    def __tick(self) -> int:
+        # tick the visible items and return the number ticked.
+        with self.__condition:
+            if self.__reduced_motion:
+                return 0
+            canvas_items = list(self.__canvas_items)
+        animation_time = self.time
+        canvas_items_by_base_container = dict[int, typing.Tuple[AbstractCanvasItem, typing.List[AbstractCanvasItem]]]()
+        for canvas_item in canvas_items:
+            base_container = canvas_item._base_container
+            if isinstance(base_container, AbstractCanvasItem) and _is_animation_visible(canvas_item):
+                canvas_items_by_base_container.setdefault(id(base_container), (base_container, list()))[1].append(canvas_item)
+        for base_canvas_item, base_container_canvas_items in canvas_items_by_base_container.values():
+            with base_canvas_item.batch_update():
+                for canvas_item in base_container_canvas_items:
+                    try:
+                        canvas_item._animation_tick(animation_time)
+                    except Exception as e:
+                        logging.exception(f"Error in animation tick {e}")
+                    self._tick_count += 1
+        self._frame_count += 1
+        return sum(len(base_container_canvas_items) for base_canvas_item, base_container_canvas_items in canvas_items_by_base_container.values())
+
+    def __changed(self) -> None:
+        # called with the condition lock held.
+        self.__change_count += 1
+        self.__condition.notify_all()
+
+    def __start_thread_if_needed(self) -> None:
+        # called with the condition lock held.
+        if self.__canvas_items and _threaded_rendering_enabled and not self.__thread:
+            self.__thread = threading.Thread(target=self.__run, name="animation-timeline", daemon=True)
+            self.__thread.start()
+        self.__changed()
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                while self.__reduced_motion and self.__canvas_items:
+                    self.__condition.wait(1.0)
+                if not self.__canvas_items or not _threaded_rendering_enabled:
+                    self.__thread = None
+                    return
+                change_count = self.__change_count
+            if self.__tick() == 0:
+                # nothing is visible; instead of ticking each frame, wait for a change that may make an item visible.
+                with self.__condition:
+                    self._idle_count += 1
+                    while self.__change_count == change_count:
+                        self.__condition.wait()
+            else:
+                with self.__condition:
+                    self.__condition.wait(1.0 / self.frame_rate if self.frame_rate > 0 else 0.0)
+
+
+# the process wide animation timeline.
+animation_timeline = AnimationTimeline()
+
+
+def _get_frame_clock(canvas_item: AbstractCanvasItem) -> FrameClock:
+    base_container = canvas_item._base_container
+    frame_clock = base_container.frame_clock if isinstance(base_container, CanvasWidgetCanvasItem) else None
+    return frame_clock or _default_frame_clock
+
+
+class _FrameThrottle:
+    """Run the latest submitted function at most once per frame of the canvas item frame clock.
+
+    Functions submitted within a frame replace each other. When the frame is due, the frame clock queues the latest one
+    to run on the UI thread of the canvas widget. Call flush to run the pending function immediately.
+    """
+
+    def __init__(self, canvas_item: AbstractCanvasItem) -> None:
+        self.__canvas_item_ref = weakref.ref(canvas_item)
+        self.__lock = threading.RLock()
+        self.__pending_fn: typing.Optional[typing.Callable[[], None]] = None
+        self.__frame_requested = False
+        self.__last_frame_time = 0.0
+
+    def submit(self, fn: typing.Callable[[], None]) -> None:
+        canvas_item = self.__canvas_item_ref()
+        if not canvas_item:
+            return
+        frame_clock = _get_frame_clock(canvas_item)
+        with self.__lock:
+            self.__pending_fn = fn
+            now = time.perf_counter()
+            frame_time = self.__last_frame_time + frame_clock.frame_interval
+            if frame_time > now:
+                if not self.__frame_requested:
+                    self.__frame_requested = True
+                    frame_clock.request_frame(self, self.__frame_ready, frame_time)
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        with self.__lock:
+            fn = self.__pending_fn
+            self.__pending_fn = None
+            if fn:
+                self.__last_frame_time = time.perf_counter()
+                fn()
+
+    def __frame_ready(self) -> None:
+        # called on the frame clock thread. the frame clock only decides when to run; the pending function changes
+        # layout, so it is queued to run on the UI thread. if the canvas item is no longer in a canvas widget, the
+        # pending function is left for the next submit or flush.
+        canvas_item = self.__canvas_item_ref()
+        base_container = canvas_item._base_container if canvas_item else None
+        if isinstance(base_container, CanvasWidgetCanvasItem):
+            base_container._queue_task(self.__run_frame)
+        else:
+            with self.__lock:
+                self.__frame_requested = False
+
+    def __run_frame(self) -> None:
+        with self.__lock:
+            self.__frame_requested = False
+            self.flush()
+
+
+def _get_render_priority(canvas_item: AbstractCanvasItem) -> RenderPriority:
+    # hidden items (or items in hidden containers) render in the background.
+    container: typing.Optional[AbstractCanvasItem] = canvas_item
+    while container:
+        if not container.visible:
+            return RenderPriority.BACKGROUND
+        container = container.container
+    # items containing the focused item render first.
+    base_container = canvas_item._base_container
+    focused_item = base_container.focused_item if isinstance(base_container, CanvasWidgetCanvasItem) else None
+    while focused_item:
+        if focused_item is canvas_item:
+            return RenderPriority.FOCUSED
+        focused_item = focused_item.container
+    return RenderPriority.VISIBLE
+
+
+def _submit_render(executor: concurrent.futures.Executor, fn: typing.Callable[[], None], canvas_item: AbstractCanvasItem) -> concurrent.futures.Future[typing.Any]:
+    # use priorities and per base container fairness if the executor supports it; otherwise fall back to a plain submit.
+    if isinstance(executor, RenderScheduler):
+        return executor.submit_render(fn, priority=_get_render_priority(canvas_item), group=canvas_item._base_container, key=canvas_item)
+    return executor.submit(fn)
+
 
 class LayerCanvasItem(CanvasItemComposition):
-    """A composite canvas item that does layout and repainting in a thread."""
+    """A composite canvas item that does layout and repainting in a thread.
+
+    Repaints are submitted to the class level executor. Assign a different executor (such as a RenderScheduler with a
+    different worker count) to change scheduling behavior.
+    """
 
-    _executor = concurrent.futures.ThreadPoolExecutor()
+    _executor: concurrent.futures.Executor = RenderScheduler()
 
     def __init__(self) -> None:
         super().__init__()
         self.__executing = False
         self.__cancel = False
         self.__needs_repaint = False  # keep track of repaint requests that arrive during an existing repaint
+        self.__frame_pending = False  # whether a repaint is waiting for the next frame from the frame clock
+        self.__last_frame_time = 0.0
+        self.__maximum_frame_rate: typing.Optional[float] = None
         self.__layer_drawing_context: typing.Optional[DrawingContext.DrawingContext] = None
         self.__layer_thread_lock = threading.RLock()
         self.__repaint_one_future: typing.Optional[concurrent.futures.Future[typing.Any]] = None
         self.__canvas_widget_section_ref: typing.Optional[CanvasWidgetSection] = None
+        # update rate tracking, used by the root canvas item to partition frequently updated layers into sections.
+        self.__update_interval = math.inf  # smoothed interval between updates
+        self.__last_update_time: typing.Optional[float] = None
+        # stats for aborted (superseded) repaints
+        self._aborted_repaint_count = 0
+        self._aborted_repaint_time = 0.0
 
     def close(self) -> None:
         self._stop_render_behavior()
@@ -2483,17 +3416,85 @@ class LayerCanvasItem(CanvasItemComposition):
             if self.__needs_repaint:
                 self.__queue_repaint()
 
+    @property
+    def maximum_frame_rate(self) -> typing.Optional[float]:
+        """Return the maximum repaint rate for this item, in frames per second. None for the frame clock rate."""
+        return self.__maximum_frame_rate
+
+    @maximum_frame_rate.setter
+    def maximum_frame_rate(self, value: typing.Optional[float]) -> None:
+        self.__maximum_frame_rate = value
+
+    def __frame_ready(self) -> None:
+        # called from the frame clock when the next frame is due.
+        with self.__layer_thread_lock:
+            self.__frame_pending = False
+            self.__queue_repaint()
+
     def __queue_repaint(self) -> None:
         with self.__layer_thread_lock:
             # this will not launch another repaint layer if one is already running. updates will stack up and
             # be processed at the end of the current update in repaint done.
             if not self.__cancel and not self.__repaint_one_future:
+                # updates arriving before the next frame are batched into the pending frame.
+                if self.__frame_pending:
+                    return
+                frame_clock = _get_frame_clock(self)
+                frame_interval = frame_clock.frame_interval
+                if self.__maximum_frame_rate:
+                    frame_interval = max(frame_interval, 1.0 / self.__maximum_frame_rate)
+                frame_time = self.__last_frame_time + frame_interval
+                now = time.perf_counter()
+                if frame_time > now:
+                    self.__frame_pending = True
+                    frame_clock.request_frame(self, self.__frame_ready, frame_time)
+                    return
+                self.__last_frame_time = now
                 self.__needs_repaint = False
-                self.__repaint_one_future = LayerCanvasItem._executor.submit(self.__repaint_layer)
+                self.__repaint_one_future = _submit_render(LayerCanvasItem._executor, self.__repaint_layer, self)
                 self.__repaint_one_future.add_done_callback(self.__repaint_done)
             else:
                 self.__needs_repaint = True
 
+    @property
+    def render_queue_stats(self) -> typing.Optional[RenderQueueStats]:
+        """Return the render queue wait time statistics for this item, if available."""
+        executor = self.__class__._executor
+        return executor.get_queue_stats(self) if isinstance(executor, RenderScheduler) else None
+
+    @property
+    def update_rate(self) -> float:
+        """Return the recent update rate of this layer, in updates per second."""
+        with self.__layer_thread_lock:
+            if self.__last_update_time is None:
+                return 0.0
+            # include the time since the last update so that the rate decays when updates stop.
+            update_interval = max(self.__update_interval, _update_rate_clock() - self.__last_update_time)
+            return 1.0 / update_interval if update_interval > 0.0 else 0.0
+
+    def __record_update(self) -> None:
+        now = _update_rate_clock()
+        if self.__last_update_time is not None:
+            elapsed = now - self.__last_update_time
+            if math.isinf(self.__update_interval):
+                self.__update_interval = elapsed
+            else:
+                self.__update_interval += (elapsed - self.__update_interval) * 0.1
+        self.__last_update_time = now
+
+    def _set_section_enabled(self, enabled: bool) -> None:
+        # called from the root canvas item to promote this layer to (or demote it from) its own canvas widget section.
+        with self.__layer_thread_lock:
+            self.is_root_opaque = enabled
+            if not enabled:
+                # releasing the last reference to the section removes it from the canvas widget.
+                self.__canvas_widget_section_ref = None
+                # restart the update rate measurement so the layer is not promoted again right away.
+                self.__update_interval = math.inf
+                self.__last_update_time = None
+        # repaint into the new destination (the section or the container).
+        self.update()
+
     def _repaint_finished(self, drawing_context: DrawingContext.DrawingContext) -> None:
         # when the thread finishes the repaint, this method gets called. the normal container update
         # has not been called yet since the repaint wasn't finished until now. this method performs
@@ -2506,8 +3507,13 @@ class LayerCanvasItem(CanvasItemComposition):
     def _updated(self) -> None:
         # thread-safe
         with self.__layer_thread_lock:
+            self.__record_update()
             if _threaded_rendering_enabled:
                 self.__queue_repaint()
+        # let the canvas widget track the update frequency of this layer. call outside of the lock.
+        base_container = self._base_container
+        if isinstance(base_container, CanvasWidgetCanvasItem) and base_container is not self:
+            base_container._layer_updated(self)
         # normally, this method would mark a pending update and forward the update to the container;
         # however with the layer, since drawing occurs on a thread, this must occur after the thread
         # is finished. if the thread is suppressed (typically during testing), use the regular flow.
@@ -2560,11 +3566,16 @@ class LayerCanvasItem(CanvasItemComposition):
                 return None
         return p
 
+    def __is_repaint_superseded(self) -> bool:
+        # a repaint is superseded if another update arrived while it was running or if rendering is stopping.
+        return self.__needs_repaint or self.__cancel
+
     def __repaint_layer(self) -> None:
         if not self.__cancel:
             if self._has_layout:
+                start_time = time.perf_counter()
                 try:
-                    with Process.audit("repaint_layer"):
+                    with Process.audit("repaint_layer"), _repaint_superseded_check(self.__is_repaint_superseded):
                         canvas_rect = self.canvas_rect
                         base_container = self._base_container
                         canvas_widget = typing.cast(CanvasWidgetCanvasItem, base_container) if isinstance(base_container, CanvasWidgetCanvasItem) else None
@@ -2575,16 +3586,19 @@ class LayerCanvasItem(CanvasItemComposition):
                             # widget section at the location 0,0.
                             drawing_context.translate(-canvas_rect.left, -canvas_rect.top)
                         self._repaint_layer_inner(drawing_context)
-                        if not self.__cancel:
+                        # if the section state changed during the repaint, skip it; the change triggers a new repaint.
+                        if not self.__cancel and is_root_opaque == self.is_root_opaque:
                             if is_root_opaque and canvas_widget and canvas_rect:
                                 # if direct drawing is used, draw the drawing context to the canvas widget section.
-                                if not self.__canvas_widget_section_ref:
-                                    # create a section ref, which allows direct drawing for top level opaque items.
-                                    # the section is automatically deallocated (via finalize) when the last python
-                                    # reference to the section is released.
-                                    self.__canvas_widget_section_ref = canvas_widget.get_section_ref()
+                                with self.__layer_thread_lock:
+                                    if not self.__canvas_widget_section_ref:
+                                        # create a section ref, which allows direct drawing for top level opaque items.
+                                        # the section is automatically deallocated (via finalize) when the last python
+                                        # reference to the section is released.
+                                        self.__canvas_widget_section_ref = canvas_widget.get_section_ref()
+                                    canvas_widget_section_ref = self.__canvas_widget_section_ref
                                 # draw top level opaque item directly. ensure the proper canvas rect.
-                                assert self.__canvas_widget_section_ref
+                                assert canvas_widget_section_ref
                                 # get the canvas origin; but wait until the base container is ready.
                                 # this layout may occur faster than the base layout.
                                 canvas_origin = self.__map_origin_to_base_container()
@@ -2592,13 +3606,17 @@ class LayerCanvasItem(CanvasItemComposition):
                                     time.sleep(0.01)
                                     canvas_origin = self.__map_origin_to_base_container()
                                 canvas_rect = Geometry.IntRect(origin=canvas_origin, size=canvas_rect.size)
-                                self.__canvas_widget_section_ref.draw(drawing_context, canvas_rect)
+                                canvas_widget_section_ref.draw(drawing_context, canvas_rect)
                             else:
                                 # if this is a normal layer that is not top level opaque, then the drawing context
                                 # is saved and the container is asked to update after which it will return a composer
                                 # with the drawing context. if this is a base layer, then the drawing context is
                                 # directly updated to the canvas widget.
                                 self._repaint_finished(drawing_context)
+                except RepaintAbortedError:
+                    # the repaint done callback will start a repaint of the newest state.
+                    self._aborted_repaint_count += 1
+                    self._aborted_repaint_time += time.perf_counter() - start_time
                 except Exception as e:
                     import traceback
                     logging.debug("CanvasItem Render Error: %s", e)
@@ -2628,6 +3646,54 @@ class ScrollAreaLayout(CanvasItemLayout):
                 self.update_canvas_item_layout(canvas_origin, preferred_size, content)
 
 
+class _ScrollAreaTileCache:
+    """A cache of the recorded content drawing of a scroll area, in square tiles of content coordinates.
+
+    Each tile is stored with the region key of the content composer for the tile. A tile is re-recorded when its key
+    changes, i.e. when content within the tile region is updated. The least recently used tiles beyond the capacity are
+    discarded.
+    """
+
+    def __init__(self, tile_size: int, capacity: int) -> None:
+        self.tile_size = tile_size
+        self.__tiles = LRUCache.LRUCache[typing.Tuple[int, int], typing.Tuple[typing.Any, DrawingContext.DrawingContext]](capacity)
+        # stats for testing
+        self._record_count = 0
+        self._hit_count = 0
+
+    def repaint_content(self, drawing_context: DrawingContext.DrawingContext, content_composer: BaseComposer, visible_rect: Geometry.IntRect) -> None:
+        # draw the tiles intersecting the visible rect (content container coordinates), recording missing or stale ones.
+        tile_size = self.tile_size
+        content_bounds = content_composer._canvas_bounds
+        visible_rect = visible_rect.intersect(content_bounds)
+        if visible_rect.width <= 0 or visible_rect.height <= 0:
+            return
+        for ty in range(visible_rect.top // tile_size, (visible_rect.bottom - 1) // tile_size + 1):
+            for tx in range(visible_rect.left // tile_size, (visible_rect.right - 1) // tile_size + 1):
+                repaint_checkpoint()
+                tile_rect = Geometry.IntRect(Geometry.IntPoint(y=ty * tile_size, x=tx * tile_size), Geometry.IntSize(height=tile_size, width=tile_size))
+                key = content_composer._get_region_key(tile_rect)
+                tile = self.__tiles.get((ty, tx))
+                if tile and tile[0] == key:
+                    self._hit_count += 1
+                    tile_drawing_context = tile[1]
+                else:
+                    tile_drawing_context = DrawingContext.DrawingContext()
+                    content_composer.repaint(tile_drawing_context, content_bounds, tile_rect)
+                    self.__tiles.put((ty, tx), (key, tile_drawing_context))
+                    self._record_count += 1
+                with drawing_context.saver():
+                    drawing_context.clip_rect(tile_rect.left, tile_rect.top, tile_rect.width, tile_rect.height)
+                    drawing_context.add(tile_drawing_context)
+
+    @property
+    def capacity(self) -> int:
+        return self.__tiles.capacity
+
+    def clear(self) -> None:
+        self.__tiles.clear()
+
+
 class ScrollAreaCanvasItemComposer(CanvasItemCompositionComposer):
     def __init__(self,
                  canvas_item: AbstractCanvasItem,
@@ -2637,15 +3703,24 @@ class ScrollAreaCanvasItemComposer(CanvasItemCompositionComposer):
                  child_composers: typing.Sequence[BaseComposer],
                  background_color: typing.Optional[typing.Union[str, DrawingContext.LinearGradient]],
                  border_color: typing.Optional[str],
-                 content_origin: Geometry.IntPoint) -> None:
+                 content_origin: Geometry.IntPoint,
+                 tile_cache: typing.Optional[_ScrollAreaTileCache] = None) -> None:
         super().__init__(canvas_item, layout_sizing, composer_cache, layout, child_composers, background_color, border_color)
         self.__content_origin = content_origin
+        self.__tile_cache = tile_cache
 
     def _repaint_children(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect, child_composers: typing.Sequence[BaseComposer]) -> None:
         with drawing_context.saver():
             content_origin = self.__content_origin
             drawing_context.clip_rect(canvas_rect.left, canvas_rect.top, canvas_rect.width, canvas_rect.height)
-            super()._repaint_children(drawing_context, canvas_rect + content_origin, visible_rect, child_composers)
+            if self.__tile_cache and len(child_composers) == 1:
+                # draw the content from cached tiles; only tiles exposed by scrolling or with updated content are
+                # recorded again.
+                content_rect = canvas_rect + content_origin
+                drawing_context.translate(content_rect.left, content_rect.top)
+                self.__tile_cache.repaint_content(drawing_context, child_composers[0], visible_rect.intersect(canvas_rect) - content_rect.origin)
+            else:
+                super()._repaint_children(drawing_context, canvas_rect + content_origin, visible_rect, child_composers)
 
 
 class ScrollAreaCanvasItem(CanvasItemComposition):
@@ -2657,11 +3732,17 @@ class ScrollAreaCanvasItem(CanvasItemComposition):
 
     The content_origin will typically be negative if the content canvas_size is larger than the scroll area canvas
     size, and zero otherwise.
+
+    If tile_size is set, the recorded content drawing is cached in tiles so that scrolling only records the newly
+    exposed tiles. Tiles are recorded again when the content children intersecting them are updated.
     """
 
     def __init__(self, content: typing.Optional[AbstractCanvasItem] = None) -> None:
         super().__init__()
         self.__content_origin = Geometry.IntPoint()
+        self.tile_size: typing.Optional[int] = None
+        self.tile_cache_capacity = 64
+        self.__tile_cache: typing.Optional[_ScrollAreaTileCache] = None
         self.__scroll_area_layout = ScrollAreaLayout()
         self.layout = self.__scroll_area_layout
         # the content_updated_event is used by scroll bars to update their size and position.
@@ -2791,8 +3872,21 @@ class ScrollAreaCanvasItem(CanvasItemComposition):
                 self.content_updated_event.fire()
                 self.update()
 
+    @property
+    def _tile_cache(self) -> typing.Optional[_ScrollAreaTileCache]:
+        # for testing.
+        return self.__tile_cache
+
     def _get_composition_composer(self, child_composers: typing.Sequence[BaseComposer], composer_cache: ComposerCache) -> BaseComposer:
-        return ScrollAreaCanvasItemComposer(self, self.layout_sizing, composer_cache, self.layout, child_composers, self.background_color, self.border_color, self.__content_origin)
+        tile_size = self.tile_size
+        tile_cache = self.__tile_cache
+        if tile_size:
+            if not tile_cache or tile_cache.tile_size != tile_size or tile_cache.capacity != self.tile_cache_capacity:
+                tile_cache = _ScrollAreaTileCache(tile_size, self.tile_cache_capacity)
+        else:
+            tile_cache = None
+        self.__tile_cache = tile_cache
+        return ScrollAreaCanvasItemComposer(self, self.layout_sizing, composer_cache, self.layout, child_composers, self.background_color, self.border_color, self.__content_origin, tile_cache)
 
     def map_to_container(self, p: Geometry.IntPoint) -> Geometry.IntPoint:
         return super().map_to_container(p + self.content_origin)
@@ -2873,22 +3967,57 @@ class SplitterCanvasItemComposer(CanvasItemCompositionComposer):
                  canvas_item: AbstractCanvasItem,
                  layout_sizing: Sizing,
                  composer_cache: ComposerCache,
-                 layout: CanvasItemAbstractLayout,
+                 layout: SplitterLayout,
                  child_composers: typing.Sequence[BaseComposer],
                  background_color: typing.Optional[typing.Union[str, DrawingContext.LinearGradient]],
                  border_color: typing.Optional[str],
-                 orientation: str) -> None:
+                 orientation: str,
+                 snapshots: typing.Optional[typing.Sequence[typing.Tuple[DrawingContext.DrawingContext, Geometry.IntRect]]] = None) -> None:
         super().__init__(canvas_item, layout_sizing, composer_cache, layout, child_composers, background_color, border_color)
         self.__child_composers = child_composers
         self.__orientation = orientation
+        self.__sizings = layout.sizings
+        self.__snapshots = snapshots if snapshots is not None and len(snapshots) == len(child_composers) else None
+        self.__snapshot_rects = list[Geometry.IntRect]()
+
+    def _update_layout(self, canvas_bounds: Geometry.IntRect) -> None:
+        if self.__snapshots is not None:
+            # while tracking with snapshots, only calculate the child rects. the children keep their existing layout.
+            canvas_size = canvas_bounds.size
+            layout = SplitterCanvasItem.calculate_layout(self.__orientation, canvas_size, self.__sizings)
+            if self.__orientation == "horizontal":
+                self.__snapshot_rects = [Geometry.IntRect(Geometry.IntPoint(y=origin, x=0), Geometry.IntSize(height=size, width=canvas_size.width)) for origin, size in zip(layout.origins, layout.sizes)]
+            else:
+                self.__snapshot_rects = [Geometry.IntRect(Geometry.IntPoint(y=0, x=origin), Geometry.IntSize(height=canvas_size.height, width=size)) for origin, size in zip(layout.origins, layout.sizes)]
+        else:
+            super()._update_layout(canvas_bounds)
+
+    def _repaint_children(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect, child_composers: typing.Sequence[BaseComposer]) -> None:
+        if self.__snapshots is not None:
+            # draw the snapshot of each child scaled to its new rect.
+            with drawing_context.saver():
+                drawing_context.translate(canvas_rect.left, canvas_rect.top)
+                for (snapshot_drawing_context, snapshot_rect), rect in zip(self.__snapshots, self.__snapshot_rects):
+                    if snapshot_rect.width > 0 and snapshot_rect.height > 0:
+                        with drawing_context.saver():
+                            drawing_context.clip_rect(rect.left, rect.top, rect.width, rect.height)
+                            drawing_context.translate(rect.left, rect.top)
+                            drawing_context.scale(rect.width / snapshot_rect.width, rect.height / snapshot_rect.height)
+                            drawing_context.translate(-snapshot_rect.left, -snapshot_rect.top)
+                            drawing_context.add(snapshot_drawing_context)
+        else:
+            super()._repaint_children(drawing_context, canvas_rect, visible_rect, child_composers)
 
     def _repaint_visible(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect, composer_cache: ComposerCache) -> None:
         super()._repaint_visible(drawing_context, canvas_rect, visible_rect, composer_cache)
         # this section is only to draw the splitter lines.
+        if self.__snapshots is not None:
+            child_canvas_origins = [rect.origin for rect in self.__snapshot_rects]
+        else:
+            child_canvas_origins = [child_composer._canvas_bounds.origin for child_composer in self.__child_composers]
         with drawing_context.saver():
             drawing_context.begin_path()
-            for child_composer in self.__child_composers[1:]:
-                child_canvas_origin = child_composer._canvas_bounds.origin
+            for child_canvas_origin in child_canvas_origins[1:]:
                 if self.__orientation == "horizontal":
                     drawing_context.move_to(canvas_rect.left, child_canvas_origin.y)
                     drawing_context.line_to(canvas_rect.right, child_canvas_origin.y)
@@ -2901,6 +4030,12 @@ class SplitterCanvasItemComposer(CanvasItemCompositionComposer):
 
 
 class SplitterCanvasItem(CanvasItemComposition):
+    """A composition with adjustable splits between its children.
+
+    When throttle_tracking is set, the splits are applied at most once per frame while dragging a splitter. When
+    tracking_snapshots is set, scaled snapshots of the children are drawn while dragging instead of laying out and
+    repainting them. In either case, the exact layout is done when the drag ends.
+    """
 
     def __init__(self, orientation: typing.Optional[str] = None) -> None:
         super().__init__()
@@ -2916,7 +4051,13 @@ class SplitterCanvasItem(CanvasItemComposition):
         self.__tracking_start_index = 0
         self.__tracking_start_preferred = 0
         self.__tracking_start_preferred_next = 0
+        self.__tracking_throttle = _FrameThrottle(self)
+        self.__tracking_snapshots: typing.Optional[typing.List[typing.Tuple[DrawingContext.DrawingContext, Geometry.IntRect]]] = None
+        self.throttle_tracking = False
+        self.tracking_snapshots = False
         self.on_splits_will_change: typing.Optional[typing.Callable[[], None]] = None
+        # stats for testing
+        self._tracking_layout_count = 0
         self.on_splits_changed: typing.Optional[typing.Callable[[], None]] = None
 
     def _description(self) -> str:
@@ -3000,6 +4141,24 @@ class SplitterCanvasItem(CanvasItemComposition):
         super()._base_remove_canvas_item(canvas_item)
         self.update()
 
+    def _base_insert_canvas_items(self, before_index: int, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        # each canvas item needs its own sizing.
+        for offset, canvas_item in enumerate(canvas_items):
+            self._base_insert_canvas_item(before_index + offset, canvas_item)
+
+    def _base_remove_canvas_items(self, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        for canvas_item in canvas_items:
+            self._base_remove_canvas_item(canvas_item)
+
+    def _base_reorder_canvas_items(self, canvas_items: typing.Sequence[AbstractCanvasItem]) -> None:
+        with self.__lock:
+            old_indexes = {id(canvas_item): index for index, canvas_item in enumerate(self.canvas_items)}
+            self.__sizings = [self.__sizings[old_indexes[id(canvas_item)]] for canvas_item in canvas_items]
+            self.__splitter_layout = self.__splitter_layout.with_sizings(self.__sizings)
+            self.layout = self.__splitter_layout
+        super()._base_reorder_canvas_items(canvas_items)
+        self.update()
+
     def canvas_items_at_point(self, x: int, y: int) -> typing.List[AbstractCanvasItem]:
         if self.orientation == "horizontal":
             for canvas_item in self.canvas_items[1:]:  # don't check the '0' origin
@@ -3024,7 +4183,27 @@ class SplitterCanvasItem(CanvasItemComposition):
         self.splits = typing.cast(typing.Sequence[float], state)
 
     def _get_composition_composer(self, child_composers: typing.Sequence[BaseComposer], composer_cache: ComposerCache) -> BaseComposer:
-        return SplitterCanvasItemComposer(self, self.layout_sizing, composer_cache, self.__splitter_layout, child_composers, self.background_color, self.border_color, self.orientation)
+        return SplitterCanvasItemComposer(self, self.layout_sizing, composer_cache, self.__splitter_layout, child_composers, self.background_color, self.border_color, self.orientation, self.__tracking_snapshots)
+
+    def __take_tracking_snapshots(self) -> None:
+        # record the current drawing of each visible child, reusing the cached drawing where possible.
+        snapshots = list[typing.Tuple[DrawingContext.DrawingContext, Geometry.IntRect]]()
+        for canvas_item in self.visible_canvas_items:
+            canvas_rect = canvas_item.canvas_rect
+            if not canvas_rect:
+                return
+            drawing_context = DrawingContext.DrawingContext()
+            canvas_item._repaint(drawing_context)
+            snapshots.append((drawing_context, canvas_rect))
+        self.__tracking_snapshots = snapshots
+
+    def __set_tracking_sizings(self, sizings: typing.List[Sizing]) -> None:
+        with self.__lock:
+            self.__sizings = sizings
+            self.__splitter_layout = self.__splitter_layout.with_sizings(self.__sizings)
+            self.layout = self.__splitter_layout
+        self._tracking_layout_count += 1
+        self.update()
 
     def __hit_test(self, x: int, y: int, modifiers: UserInterface.KeyboardModifiers) -> typing.Tuple[str, int, int]:
         if self._has_layout:
@@ -3054,6 +4233,8 @@ class SplitterCanvasItem(CanvasItemComposition):
             self.__tracking_start_preferred_next = next_canvas_size.height if orientation == "horizontal" else next_canvas_size.width
             if callable(self.on_splits_will_change):
                 self.on_splits_will_change()
+            if self.tracking_snapshots:
+                self.__take_tracking_snapshots()
             # fix the size of all children except for the two in question
             new_sizings: typing.List[Sizing] = list()
             for index, (canvas_item, sizing) in enumerate(zip(canvas_items, sizings)):
@@ -3075,7 +4256,10 @@ class SplitterCanvasItem(CanvasItemComposition):
         return super().mouse_pressed(x, y, modifiers)
 
     def mouse_released(self, x: int, y: int, modifiers: UserInterface.KeyboardModifiers) -> bool:
+        # apply any pending (throttled) splits and then do the exact layout.
+        self.__tracking_throttle.flush()
         self.__tracking = False
+        self.__tracking_snapshots = None
         # restore the freedom of the others
         with self.__lock:
             sizings = self.__sizings
@@ -3134,11 +4318,10 @@ class SplitterCanvasItem(CanvasItemComposition):
                                 break
                     new_sizings[self.__tracking_start_index] = new_sizings[self.__tracking_start_index].with_preferred_width(tracking_start_preferred + offset)
                     new_sizings[self.__tracking_start_index + 1] = new_sizings[self.__tracking_start_index + 1].with_preferred_width(tracking_start_preferred_next - offset)
-            with self.__lock:
-                self.__sizings = new_sizings
-                self.__splitter_layout = self.__splitter_layout.with_sizings(self.__sizings)
-                self.layout = self.__splitter_layout
-            self.update()
+            if self.throttle_tracking:
+                self.__tracking_throttle.submit(functools.partial(self.__set_tracking_sizings, new_sizings))
+            else:
+                self.__set_tracking_sizings(new_sizings)
             return True
         else:
             control, _, _ = self.__hit_test(x, y, modifiers)
@@ -3367,14 +4550,11 @@ class ScrollBarCanvasItemComposer(BaseComposer):
             drawing_context.translate(canvas_rect.left, canvas_rect.top)
             drawing_context.begin_path()
             drawing_context.rect(0, 0, canvas_rect.width, canvas_rect.height)
+            color_stops = ((0.0, "#F2F2F2"), (0.35, "#FDFDFD"), (0.65, "#FDFDFD"), (1.0, "#F2F2F2"))
             if orientation == Orientation.Vertical:
-                gradient = drawing_context.create_linear_gradient(canvas_rect.width, canvas_rect.height, 0, 0, canvas_rect.width, 0)
+                gradient = drawing_context.create_linear_gradient(canvas_rect.width, canvas_rect.height, 0, 0, canvas_rect.width, 0, color_stops)
             else:
-                gradient = drawing_context.create_linear_gradient(canvas_rect.width, canvas_rect.height, 0, 0, 0, canvas_rect.height)
-            gradient.add_color_stop(0.0, "#F2F2F2")
-            gradient.add_color_stop(0.35, "#FDFDFD")
-            gradient.add_color_stop(0.65, "#FDFDFD")
-            gradient.add_color_stop(1.0, "#F2F2F2")
+                gradient = drawing_context.create_linear_gradient(canvas_rect.width, canvas_rect.height, 0, 0, 0, canvas_rect.height, color_stops)
             drawing_context.fill_style = gradient
             drawing_context.fill()
             # draw the thumb, if any
@@ -3543,6 +4723,20 @@ class CanvasWidgetSection:
         raise NotImplementedError()
 
 
+@dataclasses.dataclass(frozen=True)
+class SectionStats:
+    """Update statistics for a layer within a canvas widget.
+
+    The canvas rect is in canvas widget coordinates. The is_section flag indicates whether the layer is drawn as its own
+    canvas widget section; is_auto_section indicates whether it was partitioned automatically.
+    """
+    canvas_item: LayerCanvasItem
+    canvas_rect: typing.Optional[Geometry.IntRect]
+    update_rate: float
+    is_section: bool
+    is_auto_section: bool
+
+
 class CanvasWidgetCanvasItem(LayerCanvasItem):
     """Internal class to represent a composition with a canvas widget."""
 
@@ -3560,6 +4754,26 @@ class CanvasWidgetCanvasItem(LayerCanvasItem):
     @abc.abstractmethod
     def get_section_ref(self) -> CanvasWidgetSection: ...
 
+    @property
+    def frame_clock(self) -> typing.Optional[FrameClock]:
+        """Return the frame clock used to batch repaints of layers within this canvas widget, if any."""
+        return None
+
+    def _layer_updated(self, layer: LayerCanvasItem) -> None:
+        """Called when a layer within this canvas widget is updated. Thread safe."""
+        pass
+
+    def _queue_task(self, task: typing.Callable[[], None]) -> None:
+        """Queue task to run on the UI thread. Thread safe."""
+        canvas_widget = self.canvas_widget
+        if canvas_widget:
+            canvas_widget.queue_task(task)
+
+    @property
+    def is_canvas_visible(self) -> bool:
+        """Return whether the canvas widget is visible. Animations are paused when it is not."""
+        return True
+
 
 class ThreadedCanvasItemContentWrapperCanvasItem(CanvasItemComposition):
     """A canvas item that wraps the content of a threaded canvas item.
@@ -3620,12 +4834,15 @@ class ThreadedCanvasItem(AbstractCanvasItem):
     then trigger an update on this canvas item using that latest drawing context produced by the thread.
     """
 
-    _executor = concurrent.futures.ThreadPoolExecutor()
+    _executor: concurrent.futures.Executor = RenderScheduler()
 
     def __init__(self, canvas_item: AbstractCanvasItem) -> None:
         super().__init__()
         self.__cancel = False
         self.__needs_repaint = False  # keep track of repaint requests that arrive during an existing repaint
+        self.__frame_pending = False  # whether a repaint is waiting for the next frame from the frame clock
+        self.__last_frame_time = 0.0
+        self.__maximum_frame_rate: typing.Optional[float] = None
         self.__layer_drawing_context: DrawingContext.DrawingContext | None = None
         self.__layer_thread_lock = threading.RLock()
         self.__repaint_one_future: concurrent.futures.Future[None] | None = None
@@ -3647,6 +4864,9 @@ class ThreadedCanvasItem(AbstractCanvasItem):
         self.__drag_tracking = False
         self.__drag_tracking_canvas_item: AbstractCanvasItem | None = None
         self.__in_repaint_layer = False
+        # stats for aborted (superseded) repaints
+        self._aborted_repaint_count = 0
+        self._aborted_repaint_time = 0.0
 
     def close(self) -> None:
         self._stop_render_behavior()
@@ -3672,17 +4892,52 @@ class ThreadedCanvasItem(AbstractCanvasItem):
             if self.__needs_repaint:
                 self.__queue_repaint()
 
+    @property
+    def maximum_frame_rate(self) -> typing.Optional[float]:
+        """Return the maximum repaint rate for this item, in frames per second. None for the frame clock rate."""
+        return self.__maximum_frame_rate
+
+    @maximum_frame_rate.setter
+    def maximum_frame_rate(self, value: typing.Optional[float]) -> None:
+        self.__maximum_frame_rate = value
+
+    def __frame_ready(self) -> None:
+        # called from the frame clock when the next frame is due.
+        with self.__layer_thread_lock:
+            self.__frame_pending = False
+            self.__queue_repaint()
+
     def __queue_repaint(self) -> None:
         with self.__layer_thread_lock:
             # this will not launch another repaint layer if one is already running. updates will stack up and
             # be processed at the end of the current update in repaint done.
             if not self.__cancel and not self.__repaint_one_future:
+                # updates arriving before the next frame are batched into the pending frame.
+                if self.__frame_pending:
+                    return
+                frame_clock = _get_frame_clock(self)
+                frame_interval = frame_clock.frame_interval
+                if self.__maximum_frame_rate:
+                    frame_interval = max(frame_interval, 1.0 / self.__maximum_frame_rate)
+                frame_time = self.__last_frame_time + frame_interval
+                now = time.perf_counter()
+                if frame_time > now:
+                    self.__frame_pending = True
+                    frame_clock.request_frame(self, self.__frame_ready, frame_time)
+                    return
+                self.__last_frame_time = now
                 self.__needs_repaint = False
-                self.__repaint_one_future = self.__class__._executor.submit(self.__repaint_layer)
+                self.__repaint_one_future = _submit_render(self.__class__._executor, self.__repaint_layer, self)
                 self.__repaint_one_future.add_done_callback(self.__repaint_done)
             else:
                 self.__needs_repaint = True
 
+    @property
+    def render_queue_stats(self) -> typing.Optional[RenderQueueStats]:
+        """Return the render queue wait time statistics for this item, if available."""
+        executor = self.__class__._executor
+        return executor.get_queue_stats(self) if isinstance(executor, RenderScheduler) else None
+
     def _repaint_finished(self, drawing_context: DrawingContext.DrawingContext) -> None:
         # when the thread finishes the repaint, this method gets called. the normal container update
         # has not been called yet since the repaint wasn't finished until now. this method performs
@@ -3743,11 +4998,16 @@ class ThreadedCanvasItem(AbstractCanvasItem):
         self.__call_will_repaint()
         return self.__wrapper_canvas_item.get_composer_immediate(composer_cache)
 
+    def __is_repaint_superseded(self) -> bool:
+        # a repaint is superseded if another update arrived while it was running or if rendering is stopping.
+        return self.__needs_repaint or self.__cancel
+
     def __repaint_layer(self) -> None:
         if not self.__cancel:
             if self._has_layout:
+                start_time = time.perf_counter()
                 try:
-                    with Process.audit("repaint_layer"):
+                    with Process.audit("repaint_layer"), _repaint_superseded_check(self.__is_repaint_superseded):
                         drawing_context = DrawingContext.DrawingContext()
                         self._repaint_layer_inner(drawing_context)
                         if not self.__cancel:
@@ -3756,6 +5016,10 @@ class ThreadedCanvasItem(AbstractCanvasItem):
                             # with the drawing context. if this is a root layer, then the drawing context is
                             # directly updated to the canvas widget.
                             self._repaint_finished(drawing_context)
+                except RepaintAbortedError:
+                    # the repaint done callback will start a repaint of the newest state.
+                    self._aborted_repaint_count += 1
+                    self._aborted_repaint_time += time.perf_counter() - start_time
                 except Exception as e:
                     import traceback
                     logging.debug("CanvasItem Render Error: %s", e)
@@ -4134,6 +5398,7 @@ class RootCanvasItem(CanvasWidgetCanvasItem):
         self.__canvas_widget.on_drop = self.__drop
         self.__canvas_widget.on_tool_tip = self.handle_tool_tip
         self.__canvas_widget.on_pan_gesture = self.pan_gesture
+        self.__canvas_widget.on_visible_changed = self.__visible_changed
         self.__canvas_widget.on_dispatch_any = self.__dispatch_any
         self.__canvas_widget.on_can_dispatch_any = self.__can_dispatch_any
         self.__canvas_widget.on_get_menu_item_state = self.__get_menu_item_state
@@ -4151,11 +5416,24 @@ class RootCanvasItem(CanvasWidgetCanvasItem):
         self.__request_focus_modifiers: typing.Optional[UserInterface.KeyboardModifiers] = None  # modifiers at the time of mouse press
         self.__drag_tracking = False
         self.__drag_tracking_canvas_item: typing.Optional[AbstractCanvasItem] = None
+        self.__frame_clock = FrameClock(is_active_fn=self.__is_window_active)
+        # automatic section partitioning. opaque layers updating faster than the section update rate are drawn as
+        # their own canvas widget section; they return to the regular layer drawing when below the idle update rate.
+        self.__auto_section_enabled = False
+        self.auto_section_update_rate = 20.0
+        self.auto_section_idle_update_rate = 5.0
+        self.__auto_section_lock = threading.RLock()
+        self.__updated_layers: weakref.WeakSet[LayerCanvasItem] = weakref.WeakSet()
+        self.__auto_sections: weakref.WeakSet[LayerCanvasItem] = weakref.WeakSet()
+        # when throttling resizes, size changes are applied at most once per frame.
+        self.throttle_resize = False
+        self.__resize_throttle = _FrameThrottle(self)
         self._set_canvas_origin(Geometry.IntPoint())
 
     def close(self) -> None:
         # shut down the repaint thread first
         self._stop_render_behavior()  # call first so that it doesn't use canvas widget
+        self.__frame_clock.close()
         self.__mouse_tracking_canvas_item = None
         self.__drag_tracking_canvas_item = None
         self.__focused_item = None
@@ -4181,6 +5459,7 @@ class RootCanvasItem(CanvasWidgetCanvasItem):
         self.__canvas_widget.on_drop = None
         self.__canvas_widget.on_tool_tip = None
         self.__canvas_widget.on_pan_gesture = None
+        self.__canvas_widget.on_visible_changed = None
         super().close()
         # culling will require the canvas widget; clear it here (after close) so that it is availahle.
         self.__canvas_widget = typing.cast(typing.Any, None)
@@ -4219,6 +5498,89 @@ class RootCanvasItem(CanvasWidgetCanvasItem):
     def _repaint_finished(self, drawing_context: DrawingContext.DrawingContext) -> None:
         self.__canvas_widget.draw(drawing_context)
 
+    @property
+    def frame_clock(self) -> typing.Optional[FrameClock]:
+        return self.__frame_clock
+
+    def __is_window_active(self) -> bool:
+        # use the low-power frame rate when the window is inactive.
+        window = self.__canvas_widget.root_container
+        return window.is_active if window else True
+
+    @property
+    def is_canvas_visible(self) -> bool:
+        canvas_widget = self.__canvas_widget
+        return canvas_widget.visible if canvas_widget else False
+
+    def __visible_changed(self, visible: bool) -> None:
+        if visible:
+            animation_timeline.visibility_changed()
+
+    @property
+    def auto_section_enabled(self) -> bool:
+        """Return whether frequently updated opaque layers are automatically partitioned into their own sections.
+
+        Only layers known to fill their bounds are considered: layers marked is_opaque, layers with a solid background,
+        or layers with an opaque child (such as a progress bar) covering them. They must not be overlapped by other
+        items since sections are drawn on top of the regular drawing.
+        """
+        return self.__auto_section_enabled
+
+    @auto_section_enabled.setter
+    def auto_section_enabled(self, value: bool) -> None:
+        with self.__auto_section_lock:
+            self.__auto_section_enabled = value
+            demoted_layers = list(self.__auto_sections) if not value else list()
+            self.__auto_sections.clear()
+        for layer in demoted_layers:
+            layer._set_section_enabled(False)
+
+    @property
+    def section_stats(self) -> typing.List[SectionStats]:
+        """Return update statistics for the updated layers in this canvas widget, most frequently updated first."""
+        with self.__auto_section_lock:
+            layers = list(self.__updated_layers)
+            auto_sections = set(self.__auto_sections)
+        section_stats = list()
+        for layer in layers:
+            canvas_rect = layer.canvas_rect
+            if canvas_rect:
+                canvas_rect = Geometry.IntRect(origin=layer.map_to_base_container(Geometry.IntPoint()), size=canvas_rect.size)
+            section_stats.append(SectionStats(layer, canvas_rect, layer.update_rate, layer.is_root_opaque, layer in auto_sections))
+        return sorted(section_stats, key=lambda x: x.update_rate, reverse=True)
+
+    def _layer_updated(self, layer: LayerCanvasItem) -> None:
+        # track the updated layers for stats; promote hot opaque layers to sections and demote idle ones.
+        with self.__auto_section_lock:
+            self.__updated_layers.add(layer)
+        self._update_auto_sections(layer)
+
+    def _update_auto_sections(self, updated_layer: typing.Optional[LayerCanvasItem] = None) -> None:
+        # promote the updated layer if it is hot and opaque; demote idle auto sections. idle layers do not report
+        # updates, so while there are auto sections, this is called again from the frame clock after the idle update
+        # interval. without threaded rendering (typically during testing), call this directly to demote idle layers.
+        promoted_layers = list()
+        demoted_layers = list()
+        with self.__auto_section_lock:
+            if not self.__auto_section_enabled:
+                return
+            if updated_layer and updated_layer not in self.__auto_sections and not updated_layer.is_root_opaque:
+                if updated_layer.update_rate >= self.auto_section_update_rate and updated_layer._is_content_opaque():
+                    self.__auto_sections.add(updated_layer)
+                    promoted_layers.append(updated_layer)
+            for auto_section in list(self.__auto_sections):
+                if auto_section.update_rate < self.auto_section_idle_update_rate:
+                    self.__auto_sections.discard(auto_section)
+                    demoted_layers.append(auto_section)
+            has_auto_sections = bool(self.__auto_sections)
+        for promoted_layer in promoted_layers:
+            promoted_layer._set_section_enabled(True)
+        for demoted_layer in demoted_layers:
+            demoted_layer._set_section_enabled(False)
+        if has_auto_sections and _threaded_rendering_enabled and self.auto_section_idle_update_rate > 0.0:
+            check_time = time.perf_counter() + 1.0 / self.auto_section_idle_update_rate
+            self.__frame_clock.request_frame(self._update_auto_sections, self._update_auto_sections, check_time)
+
     def get_section_ref(self) -> CanvasWidgetSection:
         """Return a section ref object for direct top level drawing.
 
@@ -4271,8 +5633,14 @@ class RootCanvasItem(CanvasWidgetCanvasItem):
     def size_changed(self, width: int, height: int) -> None:
         """ Called when size changes. """
         if width > 0 and height > 0:
-            self._set_canvas_origin(Geometry.IntPoint())
-            self._set_canvas_size(Geometry.IntSize(height=height, width=width))
+            if self.throttle_resize:
+                self.__resize_throttle.submit(functools.partial(self.__apply_size, width, height))
+            else:
+                self.__apply_size(width, height)
+
+    def __apply_size(self, width: int, height: int) -> None:
+        self._set_canvas_origin(Geometry.IntPoint())
+        self._set_canvas_size(Geometry.IntSize(height=height, width=width))
 
     @property
     def focused_item(self) -> typing.Optional[AbstractCanvasItem]:
@@ -4598,6 +5966,11 @@ class BackgroundCanvasItemComposer(BaseComposer):
     def __init__(self, canvas_item: AbstractCanvasItem, layout_sizing: Sizing, composer_cache: ComposerCache, background_color: typing.Optional[typing.Union[str, DrawingContext.LinearGradient]]) -> None:
         super().__init__(canvas_item, layout_sizing, composer_cache)
         self.__background_color = background_color
+        self.__is_background_opaque = _is_opaque_color(background_color)
+
+    @property
+    def is_opaque(self) -> bool:
+        return self.__is_background_opaque or super().is_opaque
 
     def _repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, composer_cache: ComposerCache) -> None:
         if self.__background_color:
@@ -4631,6 +6004,9 @@ class BackgroundCanvasItem(AbstractCanvasItem):
     def _get_composer(self, composer_cache: ComposerCache) -> typing.Optional[BaseComposer]:
         return BackgroundCanvasItemComposer(self, self.layout_sizing, composer_cache, self.background_color or self.__fallback_color)
 
+    def _is_content_opaque(self) -> bool:
+        return super()._is_content_opaque() or _is_opaque_color(self.background_color or self.__fallback_color)
+
 
 @dataclasses.dataclass
 class CellBorderProperties:
@@ -4692,6 +6068,18 @@ class CellLike(typing.Protocol):
     def paint_cell(self, drawing_context: DrawingContext.DrawingContext, rect: Geometry.FloatRect, style: typing.Set[str]) -> None: ...
 
 
+@functools.cache
+def _is_cell_content_key_valid(cell_type: type) -> bool:
+    # a content key is only valid if it is provided by the same or a more derived class than any painting override.
+    mro = cell_type.__mro__
+
+    def owner_index(name: str) -> int:
+        return next(i for i, c in enumerate(mro) if name in c.__dict__)
+
+    content_key_index = owner_index("_get_content_key")
+    return all(content_key_index <= owner_index(name) for name in ("paint_cell", "_paint_cell", "_get_background_and_overlay_colors"))
+
+
 class Cell(CellLike):
     # PRIVATE CLASS. DO NOT USE OUTSIDE NIONUI
 
@@ -4769,6 +6157,23 @@ class Cell(CellLike):
     def _paint_cell(self, drawing_context: DrawingContext.DrawingContext, rect: Geometry.FloatRect, style: typing.Set[str]) -> None:
         pass
 
+    def _get_content_key(self) -> typing.Optional[typing.Hashable]:
+        """Return a key for the subclass specific content. Subclasses may override to allow sharing drawing."""
+        return None
+
+    def get_content_key(self, size: Geometry.IntSize, style: typing.Set[str]) -> typing.Optional[typing.Hashable]:
+        """Return a key identifying the painted content for the size and style, or None if it cannot be shared.
+
+        Cells with equal content keys paint identical drawing (relative to their origin).
+        """
+        content_key = self._get_content_key() if _is_cell_content_key_valid(type(self)) else None
+        background_color = self.__background_color
+        if content_key is None or not (background_color is None or isinstance(background_color, str)):
+            return None
+        border = self.__border
+        border_key = tuple((p.color.color_str, p.style, p.width) if p else None for p in (border.border, border.border_horizontal, border.border_vertical, border.border_top, border.border_left, border.border_bottom, border.border_right))
+        return type(self), content_key, background_color, border_key, self.__padding, size, frozenset(style)
+
     def paint_cell(self, drawing_context: DrawingContext.DrawingContext, rect: Geometry.FloatRect, style: typing.Set[str]) -> None:
         background_color, overlay_color = self._get_background_and_overlay_colors(style)
 
@@ -4869,6 +6274,113 @@ class Cell(CellLike):
                 drawing_context.stroke()
 
 
+class _IdentityKey:
+    """A content key component that compares by identity. Refers to the object weakly if it supports weak references."""
+
+    __slots__ = ("__ref", "__hash")
+
+    def __init__(self, o: typing.Any) -> None:
+        self.__ref: typing.Callable[[], typing.Any]
+        try:
+            self.__ref = weakref.ref(o)
+        except TypeError:
+            self.__ref = lambda: o
+        self.__hash = id(o)
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, _IdentityKey) or other.__hash != self.__hash:
+            return False
+        o = self.__ref()
+        return o is not None and o is other.__ref()
+
+
+def _get_drawing_context_byte_size(drawing_context: DrawingContext.DrawingContext) -> int:
+    return len(drawing_context.binary_commands) + sum(image.nbytes for image in drawing_context.images.values())
+
+
+@dataclasses.dataclass
+class _CellDisplayList:
+    drawing_context: DrawingContext.DrawingContext
+    owners: weakref.WeakSet[typing.Any]
+
+
+class CellDisplayListCache:
+    """A cache of recorded cell drawing, keyed on the cell content key, bounded by the byte size of the drawing.
+
+    Cells with identical content record their drawing once, relative to the origin, and then replay it with a
+    translation. The recorded drawing is discarded when all cells using it are released. Thread safe.
+    """
+
+    def __init__(self, capacity: int = 64 * 1024 * 1024) -> None:
+        self.__display_lists = LRUCache.LRUCache[typing.Hashable, _CellDisplayList](capacity, self.__get_byte_size)
+        self.__lock = threading.Lock()
+        self.__owner_content_keys = weakref.WeakKeyDictionary[typing.Any, typing.Set[typing.Hashable]]()
+        # stats for testing
+        self._record_count = 0
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum byte size of the recorded drawing."""
+        return self.__display_lists.capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int) -> None:
+        self.__display_lists = LRUCache.LRUCache[typing.Hashable, _CellDisplayList](capacity, self.__get_byte_size)
+
+    @property
+    def _byte_size(self) -> int:
+        # for testing
+        return self.__display_lists.size
+
+    @property
+    def _replay_count(self) -> int:
+        # for testing
+        return self.__display_lists.hit_count
+
+    def clear(self) -> None:
+        self.__display_lists.clear()
+
+    def get_drawing_context(self, content_key: typing.Hashable, record_fn: typing.Callable[[DrawingContext.DrawingContext], None], owner: typing.Any = None) -> DrawingContext.DrawingContext:
+        """Return the recorded drawing for the content key, recording it with record_fn if not cached.
+
+        The owner, if provided, uses the drawing until it is released.
+        """
+
+        def record() -> _CellDisplayList:
+            drawing_context = DrawingContext.DrawingContext()
+            record_fn(drawing_context)
+            self._record_count += 1
+            return _CellDisplayList(drawing_context, weakref.WeakSet())
+
+        display_list = self.__display_lists.get_or_create(content_key, record)
+        if owner is not None:
+            with self.__lock:
+                display_list.owners.add(owner)
+                self.__owner_content_keys.setdefault(owner, set()).add(content_key)
+        return display_list.drawing_context
+
+    def release(self, owner: typing.Any) -> None:
+        """Release the drawing used by owner, discarding the drawing no longer used by any owner."""
+        with self.__lock:
+            for content_key in self.__owner_content_keys.pop(owner, set()):
+                display_list = self.__display_lists.peek(content_key)
+                if display_list:
+                    display_list.owners.discard(owner)
+                    if not display_list.owners:
+                        self.__display_lists.pop(content_key)
+
+    @staticmethod
+    def __get_byte_size(display_list: _CellDisplayList) -> int:
+        return _get_drawing_context_byte_size(display_list.drawing_context)
+
+
+# the process wide cache of cell drawing. set the capacity to zero to disable sharing cell drawing.
+cell_display_list_cache = CellDisplayListCache()
+
+
 class CellCanvasItemComposer(BaseComposer):
 
     def __init__(self, canvas_item: AbstractCanvasItem, layout_sizing: Sizing, cache: ComposerCache, cell: CellLike, style: typing.Set[str]) -> None:
@@ -4877,8 +6389,18 @@ class CellCanvasItemComposer(BaseComposer):
         self.__style = style
 
     def _repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, composer_cache: ComposerCache) -> None:
-        with drawing_context.saver():
-            self.__cell.paint_cell(drawing_context, canvas_rect.to_float_rect(), self.__style)
+        cell = self.__cell
+        content_key = cell.get_content_key(canvas_rect.size, self.__style) if isinstance(cell, Cell) and cell_display_list_cache.capacity > 0 else None
+        if content_key is not None:
+            # replay the shared drawing for cells with identical content.
+            cell_rect = Geometry.IntRect(Geometry.IntPoint(), canvas_rect.size).to_float_rect()
+            cell_drawing_context = cell_display_list_cache.get_drawing_context(content_key, lambda dc: cell.paint_cell(dc, cell_rect, self.__style), cell)
+            with drawing_context.saver():
+                drawing_context.translate(canvas_rect.left, canvas_rect.top)
+                drawing_context.add(cell_drawing_context)
+        else:
+            with drawing_context.saver():
+                cell.paint_cell(drawing_context, canvas_rect.to_float_rect(), self.__style)
 
 
 class CellCanvasItem(AbstractCanvasItem):
@@ -4896,6 +6418,9 @@ class CellCanvasItem(AbstractCanvasItem):
         hover, active (default is none)
     """
 
+    __slots__ = ("__enabled", "__check_state", "__mouse_inside", "__mouse_pressed", "__cell",
+                 "__cell_update_event_listener", "style", "on_button_clicked", "on_clicked")
+
     def __init__(self, cell: typing.Optional[CellLike] = None) -> None:
         super().__init__()
         self.__enabled = True
@@ -5028,6 +6553,9 @@ class CellCanvasItem(AbstractCanvasItem):
         if self.__cell_update_event_listener:
             self.__cell_update_event_listener.close()
             self.__cell_update_event_listener = None
+        if self.__cell and self.__cell is not new_cell:
+            # discard the shared drawing of the old cell if no other cell uses it.
+            cell_display_list_cache.release(self.__cell)
         self.__cell = new_cell
         if self.__cell:
             self.__cell_update_event_listener = self.__cell.update_event.listen(self.update)
@@ -5192,6 +6720,10 @@ class TextButtonCell(Cell):
         font_metrics = get_font_metrics_fn(text_font, self.text)
         return Geometry.IntSize(width=font_metrics.width, height=font_metrics.height)
 
+    def _get_content_key(self) -> typing.Optional[typing.Hashable]:
+        text_measure = _IdentityKey(self.__text_measure) if self.__text_measure else None
+        return self.__text, self.__text_font, self.__text_color, self.__text_baseline, self.__text_align, self.__truncation_mode, text_measure
+
     def _paint_cell(self, drawing_context: DrawingContext.DrawingContext, rect: Geometry.FloatRect, style: typing.Set[str]) -> None:
         text = self.__text
         if text:
@@ -5227,6 +6759,8 @@ class TextCanvasItem(CellCanvasItem):
     will be sized to the text content without padding.
     """
 
+    __slots__ = ("__text_cell",)
+
     def __init__(self, text: str | None = None,
                  background_color: str | DrawingContext.LinearGradient | None = None,
                  border_color: str | None = None, padding: Geometry.IntSize | None = None, *,
@@ -5333,6 +6867,9 @@ class TwistDownCell(Cell):
     def _size_to_content(self, get_font_metrics_fn: typing.Callable[[str, str], UserInterface.FontMetrics]) -> Geometry.IntSize:
         return Geometry.IntSize(height=18, width=16)
 
+    def _get_content_key(self) -> typing.Optional[typing.Hashable]:
+        return ()
+
     def _get_background_and_overlay_colors(self, style: typing.Set[str]) -> typing.Tuple[typing.Optional[typing.Union[str, DrawingContext.LinearGradient]], typing.Optional[str]]:
         return None, super()._get_background_and_overlay_colors(style)[1]
 
@@ -5420,6 +6957,12 @@ class BitmapCell(Cell):
             return Geometry.IntSize.make(typing.cast(Geometry.IntSizeTuple, self.__data.shape))
         return Geometry.IntSize()
 
+    def _get_content_key(self) -> typing.Optional[typing.Hashable]:
+        # bitmaps are keyed by identity; the bitmap data is assumed not to be modified in place.
+        if self.__bitmap and self.__data is None:
+            return _IdentityKey(self.__bitmap), _IdentityKey(self.__bitmap.rgba_bitmap_data)
+        return None
+
     def _get_background_and_overlay_colors(self, style: typing.Set[str]) -> typing.Tuple[typing.Optional[typing.Union[str, DrawingContext.LinearGradient]], typing.Optional[str]]:
         # bitmaps are disabled by dimming them
         background_color, overlay_color = super()._get_background_and_overlay_colors(style)
@@ -5771,6 +7314,8 @@ class EmptyCanvasItemComposer(BaseComposer):
 class EmptyCanvasItem(CellCanvasItem):
     """ Canvas item to act as a placeholder (spacer or stretch). """
 
+    __slots__ = ()
+
     def __init__(self, background_color: typing.Optional[typing.Union[str, DrawingContext.LinearGradient]] = None, border: typing.Optional[CellBorder] = None) -> None:
         super().__init__()
         self.cell = Cell(background_color, border)
@@ -5865,12 +7410,14 @@ class DividerCanvasItem(AbstractCanvasItem):
 
 
 class ProgressBarCanvasItemComposer(BaseComposer):
-    def __init__(self, canvas_item: AbstractCanvasItem, layout_sizing: Sizing, cache: ComposerCache, progress: float) -> None:
+    def __init__(self, canvas_item: AbstractCanvasItem, layout_sizing: Sizing, cache: ComposerCache, progress: float, busy_phase: typing.Optional[float] = None) -> None:
         super().__init__(canvas_item, layout_sizing, cache)
         self.__progress = progress
+        self.__busy_phase = busy_phase
 
     def _repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, composer_cache: ComposerCache) -> None:
         progress = self.__progress
+        busy_phase = self.__busy_phase
         canvas_size = canvas_rect.size
         canvas_rect_center = canvas_rect.center
         with drawing_context.saver():
@@ -5882,7 +7429,16 @@ class ProgressBarCanvasItemComposer(BaseComposer):
             drawing_context.fill_style = "#CCC"
             drawing_context.fill()
             drawing_context.stroke()
-            if canvas_size.width * progress >= 1:
+            if busy_phase is not None:
+                # busy indicator: a block sweeping across the bar.
+                block_width = canvas_size.width * 0.25
+                block_left = busy_phase * (canvas_size.width + block_width) - block_width
+                drawing_context.begin_path()
+                drawing_context.rect(max(block_left, 0), 0, min(block_left + block_width, canvas_size.width) - max(block_left, 0), canvas_size.height)
+                drawing_context.close_path()
+                drawing_context.fill_style = "#6AB"
+                drawing_context.fill()
+            elif canvas_size.width * progress >= 1:
                 drawing_context.begin_path()
                 drawing_context.rect(0, 0, canvas_size.width * progress, canvas_size.height)
                 drawing_context.close_path()
@@ -5915,14 +7471,47 @@ class ProgressBarCanvasItemComposer(BaseComposer):
 
 
 class ProgressBarCanvasItem(AbstractCanvasItem):
+    """A progress bar. When busy, it displays an animated busy indicator driven by the animation timeline."""
+
     def __init__(self) -> None:
         super().__init__()
         self.__enabled = True
         self.__progress = 0.0  # 0.0 to 1.0
+        self.__busy = False
+        self.__busy_phase = 0.0
         self.update_sizing(self.sizing.with_fixed_height(4))
+        # the bar is always filled before the progress is drawn.
+        self.is_opaque = True
+
+    def close(self) -> None:
+        animation_timeline.unregister(self)
+        super().close()
 
     def _get_composer(self, composer_cache: ComposerCache) -> typing.Optional[BaseComposer]:
-        return ProgressBarCanvasItemComposer(self, self.layout_sizing, composer_cache, self.__progress)
+        busy_phase: typing.Optional[float] = None
+        if self.__busy:
+            # with reduced motion, the busy indicator is drawn statically in the center.
+            busy_phase = 0.5 if animation_timeline.reduced_motion else self.__busy_phase
+        return ProgressBarCanvasItemComposer(self, self.layout_sizing, composer_cache, self.__progress, busy_phase)
+
+    @property
+    def busy(self) -> bool:
+        return self.__busy
+
+    @busy.setter
+    def busy(self, value: bool) -> None:
+        if value != self.__busy:
+            self.__busy = value
+            if value:
+                animation_timeline.register(self)
+            else:
+                animation_timeline.unregister(self)
+            self.update()
+
+    def _animation_tick(self, animation_time: float) -> None:
+        # one sweep every 1.5 seconds.
+        self.__busy_phase = (animation_time / 1.5) % 1.0
+        self.update()
 
     @property
     def enabled(self) -> bool:
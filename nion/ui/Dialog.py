@@ -299,7 +299,7 @@ def pose_select_item_popup(items: typing.Sequence[typing.Any],
     from nion.ui import Declarative  # avoid circular reference
 
     # calculate the max string width, add 10%, min 200, max 480
-    width = min(max(int(max([window.get_font_metrics("system", item_getter(c)).width for c in items]) * 1.10), 200), 480)
+    width = min(max(int(max(window.measure_texts("system", [item_getter(c) for c in items])) * 1.10), 200), 480)
 
     size, position = _get_popup_size_and_position(window, position=position, size=size, parent_rect=parent_rect, position_offset=position_offset)
 
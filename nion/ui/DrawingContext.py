@@ -12,7 +12,9 @@ import collections
 import contextlib
 import copy
 import enum
+import functools
 import io
+import itertools
 import logging
 import math
 import re
@@ -28,6 +30,7 @@ import imageio.v3 as imageio
 import numpy
 
 # local libraries
+from nion.ui import LRUCache
 from nion.utils import Color
 from nion.utils import Geometry
 
@@ -99,22 +102,87 @@ def get_alpha_view(rgba_image: RGBA32Type, byteorder: ByteOrderType = None) -> C
         return typing.cast(C8Type, bytes[..., 0])  # A of ARGB
 
 
+ColorStopType = typing.Tuple[float, typing.Optional[str]]
+_GradientKeyType = typing.Tuple[typing.Tuple[float, ...], typing.Tuple[typing.Tuple[float, str], ...]]
+
+# ids of the most recently used gradient contents. ids are never reused, so an evicted content gets a new id.
+_gradient_ids = LRUCache.LRUCache[_GradientKeyType, int](1024)
+_gradient_id_counter = itertools.count(1)
+
+
+def _get_gradient_id(key: _GradientKeyType) -> int:
+    return _gradient_ids.get_or_create(key, functools.partial(next, _gradient_id_counter))
+
+
+def _normalize_color_stop(x: float, color: typing.Optional[str]) -> typing.Tuple[float, str]:
+    return float(x), str(color or "#0000")
+
+
 class LinearGradient:
-    next = 1
+    """A linear gradient fill style.
 
-    def __init__(self, width: float, height: float, x1: float, y1: float, x2: float, y2: float) -> None:
-        self.commands: typing.List[typing.Sequence[typing.Any]] = []
-        self.binary_commands = bytearray()
-        self.command_var = LinearGradient.next
-        self.commands.append(("gradient", self.command_var, float(width), float(height), float(x1), float(y1), float(x2), float(y2)))
-        self.binary_commands.extend(struct.pack("4siffffff", b"grad", self.command_var, float(width), float(height), float(x1), float(y1), float(x2), float(y2)))
-        LinearGradient.next += 1
+    The command_var id is derived from the geometry and color stops: gradients with the same contents have the same id,
+    which lets the host reuse the gradient it built for that id.
+    """
+
+    def __init__(self, width: float, height: float, x1: float, y1: float, x2: float, y2: float,
+                 color_stops: typing.Optional[typing.Sequence[ColorStopType]] = None) -> None:
+        self.__geometry = (float(width), float(height), float(x1), float(y1), float(x2), float(y2))
+        self.__color_stops = list[typing.Tuple[float, str]]()
+        self.__command_var: typing.Optional[int] = None
+        self.__commands: typing.Optional[typing.List[typing.Sequence[typing.Any]]] = None
+        self.__binary_commands: typing.Optional[bytearray] = None
+        self.__is_shared = False
+        for x, color in color_stops or list():
+            self.add_color_stop(x, color)
 
     def add_color_stop(self, x: float, color: typing.Optional[str]) -> None:
-        color = color or "#0000"
-        self.commands.append(("colorStop", self.command_var, float(x), str(color)))
-        color_encoded = color.encode("utf-8")
-        self.binary_commands.extend(struct.pack("4sifi{}s0i".format(len(color_encoded)), b"grcs", self.command_var, float(x), len(color_encoded), color_encoded))
+        if self.__is_shared:
+            raise RuntimeError("Cannot add a color stop to a shared gradient created with color stops.")
+        self.__color_stops.append(_normalize_color_stop(x, color))
+        self.__command_var = None
+        self.__commands = None
+        self.__binary_commands = None
+
+    def _share(self) -> LinearGradient:
+        self.__is_shared = True
+        return self
+
+    @property
+    def command_var(self) -> int:
+        if self.__command_var is None:
+            self.__command_var = _get_gradient_id((self.__geometry, tuple(self.__color_stops)))
+        return self.__command_var
+
+    @property
+    def commands(self) -> typing.List[typing.Sequence[typing.Any]]:
+        if self.__commands is None:
+            command_var = self.command_var
+            commands: typing.List[typing.Sequence[typing.Any]] = [("gradient", command_var, *self.__geometry)]
+            commands.extend(("colorStop", command_var, x, color) for x, color in self.__color_stops)
+            self.__commands = commands
+        return self.__commands
+
+    @property
+    def binary_commands(self) -> bytearray:
+        if self.__binary_commands is None:
+            command_var = self.command_var
+            binary_commands = bytearray(struct.pack("4siffffff", b"grad", command_var, *self.__geometry))
+            for x, color in self.__color_stops:
+                color_encoded = color.encode("utf-8")
+                binary_commands.extend(struct.pack("4sifi{}s0i".format(len(color_encoded)), b"grcs", command_var, x, len(color_encoded), color_encoded))
+            self.__binary_commands = binary_commands
+        return self.__binary_commands
+
+
+# the most recently used shared gradients, keyed by their contents.
+_shared_linear_gradients = LRUCache.LRUCache[_GradientKeyType, LinearGradient](256)
+
+
+def _get_shared_linear_gradient(width: float, height: float, x1: float, y1: float, x2: float, y2: float,
+                                color_stops: typing.Tuple[typing.Tuple[float, str], ...]) -> LinearGradient:
+    return _shared_linear_gradients.get_or_create(((width, height, x1, y1, x2, y2), color_stops),
+                                                  lambda: LinearGradient(width, height, x1, y1, x2, y2, color_stops)._share())
 
 
 class DrawingContext:
@@ -802,7 +870,17 @@ class DrawingContext:
         a_encoded = a.encode("utf-8")
         self.binary_commands.extend(struct.pack("4si{}s0i".format(len(a_encoded)), b"lnjn", len(a_encoded), a_encoded))
 
-    def create_linear_gradient(self, width: float, height: float, x1: float, y1: float, x2: float, y2: float) -> LinearGradient:
+    def create_linear_gradient(self, width: float, height: float, x1: float, y1: float, x2: float, y2: float,
+                               color_stops: typing.Optional[typing.Sequence[ColorStopType]] = None) -> LinearGradient:
+        """Create a linear gradient.
+
+        If color_stops is passed, the gradient is complete, cannot be modified, and is shared with other callers
+        passing the same arguments; prefer this when painting the same gradient repeatedly.
+        """
+        if color_stops is not None:
+            # normalize the color stops so that any sequence of pairs is hashable and equal stops share a gradient.
+            normalized_color_stops = tuple(_normalize_color_stop(x, color) for x, color in color_stops)
+            return _get_shared_linear_gradient(float(width), float(height), float(x1), float(y1), float(x2), float(y2), normalized_color_stops)
         gradient = LinearGradient(width, height, x1, y1, x2, y2)
         return gradient
 
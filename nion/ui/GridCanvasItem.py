@@ -497,6 +497,7 @@ class Grid2CanvasItemCompositionComposer(CanvasItem.CanvasItemCompositionCompose
                 column = index - row * n_columns
                 child_canvas_rect = Geometry.IntRect(Geometry.IntPoint(y=row * canvas_item_size.height, x=column * canvas_item_size.width), canvas_item_size)
                 if visible_rect.intersects_rect(child_canvas_rect):
+                    CanvasItem.repaint_checkpoint()
                     with drawing_context.saver():
                         child_composer.update_layout(Geometry.IntPoint(), child_canvas_rect.size)
                         child_composer.repaint(drawing_context, child_canvas_rect, visible_rect)
@@ -516,9 +517,9 @@ class GridCanvasItem2(GridFlowCanvasItem.GridFlowCanvasItem):
     from being modified when items are inserted or removed.
     """
 
-    def __init__(self, list_model: ListModel.ListModelLike, selection: Selection.IndexedSelection, item_factory: GridFlowCanvasItem.GridFlowItemFactory, delegate: GridFlowCanvasItem.GridFlowCanvasItemDelegate, item_size: Geometry.IntSize | None = None, *, key: typing.Optional[str] = None, is_shared_selection: bool = False) -> None:
+    def __init__(self, list_model: ListModel.ListModelLike, selection: Selection.IndexedSelection, item_factory: GridFlowCanvasItem.GridFlowItemFactory, delegate: GridFlowCanvasItem.GridFlowCanvasItemDelegate, item_size: Geometry.IntSize | None = None, *, key: typing.Optional[str] = None, is_shared_selection: bool = False, pool_capacity: int = 0, item_rebinder: GridFlowCanvasItem.GridFlowItemRebinder | None = None) -> None:
         self.__item_size = item_size or Geometry.IntSize(80, 80)
-        super().__init__(list_model, selection, GridLayout(self.__item_size), item_factory, delegate, key=key, is_shared_selection=is_shared_selection)
+        super().__init__(list_model, selection, GridLayout(self.__item_size), item_factory, delegate, key=key, is_shared_selection=is_shared_selection, pool_capacity=pool_capacity, item_rebinder=item_rebinder)
 
     def _get_composition_composer(self, child_composers: typing.Sequence[CanvasItem.BaseComposer], composer_cache: CanvasItem.ComposerCache) -> CanvasItem.BaseComposer:
         return Grid2CanvasItemCompositionComposer(self, self.layout_sizing, composer_cache, self.layout.copy(), child_composers, self.background_color, self.border_color, self._list_model, self.__item_size)
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 # standard libraries
+import contextlib
 import dataclasses
+import functools
 import typing
 import weakref
 
@@ -16,6 +18,7 @@ from nion.utils import Geometry
 from nion.utils import ListModel
 from nion.utils import Model
 from nion.utils import ReferenceCounting
+from nion.utils import Stream
 
 if typing.TYPE_CHECKING:
     from nion.ui import DrawingContext
@@ -47,6 +50,10 @@ class GridFlowItemAdornmentsCanvasItem(CanvasItem.AbstractCanvasItem):
         self.__grid_flow_canvas_item_ref = weakref.ref(grid_flow_canvas_item)
         self.__is_dropping = is_dropping
 
+    def _rebind(self, item: typing.Any) -> None:
+        self.__item = item
+        self.is_dropping = False
+
     @property
     def is_dropping(self) -> bool:
         return self.__is_dropping
@@ -62,6 +69,9 @@ class GridFlowItemAdornmentsCanvasItem(CanvasItem.AbstractCanvasItem):
 
 GridFlowItemFactory = typing.Callable[[typing.Any, Model.PropertyModel[bool]], CanvasItem.AbstractCanvasItem]
 
+# rebind an item canvas item (made by the item factory) to a new item. return False if it cannot be rebound.
+GridFlowItemRebinder = typing.Callable[[CanvasItem.AbstractCanvasItem, typing.Any], bool]
+
 
 class GridFlowItemCanvasItem(CanvasItem.CanvasItemComposition):
     def __init__(self, grid_flow_canvas_item: GridFlowCanvasItem, item: typing.Any, item_factory: GridFlowItemFactory) -> None:
@@ -84,6 +94,20 @@ class GridFlowItemCanvasItem(CanvasItem.CanvasItemComposition):
         assert grid_flow_canvas_item
         return grid_flow_canvas_item
 
+    def _rebind(self, item: typing.Any, item_factory: GridFlowItemFactory, item_rebinder: GridFlowItemRebinder | None) -> None:
+        # called when this canvas item is recycled for a new item. reset the state and rebind the item canvas item,
+        # replacing it with a new one from the factory if it cannot be rebound.
+        self.__item = item
+        self.is_selected = False
+        self.is_focused = False
+        self.is_dropping = False
+        self.__adornments_canvas_item._rebind(item)
+        if not (callable(item_rebinder) and item_rebinder(self._canvas_item, item)):
+            canvas_item = item_factory(item, self.__is_selected_model)
+            self.replace_canvas_item(self._canvas_item, canvas_item)
+            self._canvas_item = canvas_item
+        self.update()
+
     @property
     def item(self) -> typing.Any:
         return self.__item
@@ -224,9 +248,15 @@ class GridFlowCanvasItem(CanvasItem.CanvasItemComposition):
 
     is_shared_selection parameter is used to share the selection with another canvas item and prevents the selection
     from being modified when items are inserted or removed.
+
+    pool_capacity is the number of removed item canvas items to keep for reuse when items are inserted. item_rebinder is
+    used to rebind a recycled item canvas item to a new item; if it is not provided, the item factory is used.
+
+    insert_items, remove_items, and reset_items change a range of items in a mutable list model with a single layout
+    and update, preserving the selection and, unless scrolled to the top, the position of the first visible item.
     """
 
-    def __init__(self, list_model: ListModel.ListModelLike, selection: Selection.IndexedSelection, layout: CanvasItem.CanvasItemAbstractLayout, item_factory: GridFlowItemFactory, delegate: GridFlowCanvasItemDelegate, *, key: str | None = None, is_shared_selection: bool = False) -> None:
+    def __init__(self, list_model: ListModel.ListModelLike, selection: Selection.IndexedSelection, layout: CanvasItem.CanvasItemAbstractLayout, item_factory: GridFlowItemFactory, delegate: GridFlowCanvasItemDelegate, *, key: str | None = None, is_shared_selection: bool = False, pool_capacity: int = 0, item_rebinder: GridFlowItemRebinder | None = None) -> None:
         super().__init__()
         # store parameters
         self.__list_model = list_model
@@ -236,15 +266,19 @@ class GridFlowCanvasItem(CanvasItem.CanvasItemComposition):
         self.__item_factory = item_factory
         self.__delegate = delegate
         self.__is_shared_selection = is_shared_selection
+        self.__item_rebinder = item_rebinder
         # configure super
         self.layout = self.__layout
+        self.pool_capacity = pool_capacity
         self.wants_mouse_events = True
         self.focusable = True
         # internal variables
         self.__selection_changed_listener = self.__selection.changed_event.listen(ReferenceCounting.weak_partial(GridFlowCanvasItem.__handle_selection_changed, self))
         self.__needs_size_to_content = False  # delay sizing during batch updates
         self.__needs_handle_selection_changed = False  # delay selection handling during batch updates
+        self.__selected_indexes = set[int]()  # the selected indexes last applied to the item canvas items
         self.__grid_flow_item_canvas_items = list[GridFlowItemCanvasItem]()
+        self.__is_changing_items = False  # the bulk change methods update the item canvas items themselves
         self.__item_inserted_listener = list_model.item_inserted_event.listen(ReferenceCounting.weak_partial(GridFlowCanvasItem.__handle_item_inserted, self))
         self.__item_removed_listener = list_model.item_removed_event.listen(ReferenceCounting.weak_partial(GridFlowCanvasItem.__handle_item_removed, self))
         if hasattr(list_model, "begin_changes_event") and hasattr(list_model, "end_changes_event"):
@@ -262,11 +296,15 @@ class GridFlowCanvasItem(CanvasItem.CanvasItemComposition):
         self.__dropping = True
         self.__drop_before_index: int | None = None
         self.__drop_index: int | None = None
+        self.__pending_content_origin: Geometry.IntPoint | None = None  # scroll anchor to apply after a bulk change
+        self.__canvas_size_changed_action = Stream.ValueStreamAction(self._canvas_size_stream, ReferenceCounting.weak_partial(GridFlowCanvasItem.__handle_canvas_size_changed, self))
+        # stats for testing
+        self._selection_touch_count = 0
         # initialize
         with self.batch_update():
             for index, item in enumerate(list_model.items):
                 self.__handle_item_inserted(self.__list_model_key, item, index)
-        self.__handle_selection_changed()
+        self.__refresh_selection()
 
     @property
     def _list_model(self) -> ListModel.ListModelLike:
@@ -292,10 +330,11 @@ class GridFlowCanvasItem(CanvasItem.CanvasItemComposition):
         self._end_batch_update()
 
     def __handle_item_inserted(self, key: str, item: typing.Any, index: int) -> None:
-        if key == self.__list_model_key:
-            grid_flow_item_canvas_item = GridFlowItemCanvasItem(self, item, self.__item_factory)
+        if key == self.__list_model_key and not self.__is_changing_items:
             with self.batch_update():
-                self.insert_canvas_item(index, grid_flow_item_canvas_item)
+                create_fn = functools.partial(GridFlowItemCanvasItem, self, item, self.__item_factory)
+                reset_fn = functools.partial(GridFlowCanvasItem.__rebind_grid_flow_item_canvas_item, self, item)
+                grid_flow_item_canvas_item = typing.cast(GridFlowItemCanvasItem, self.acquire_canvas_item(index, create_fn, reset_fn))
                 self.__grid_flow_item_canvas_items.insert(index, grid_flow_item_canvas_item)
                 if not self.__is_shared_selection:
                     self.__selection.insert_index(index)
@@ -303,15 +342,152 @@ class GridFlowCanvasItem(CanvasItem.CanvasItemComposition):
                 self.__needs_size_to_content = True
 
     def __handle_item_removed(self, key: str, item: typing.Any, index: int) -> None:
-        if key == self.__list_model_key:
+        if key == self.__list_model_key and not self.__is_changing_items:
             with self.batch_update():
-                self.remove_canvas_item(self.canvas_items[index])
-                self.__grid_flow_item_canvas_items.pop(index)
+                self.release_canvas_item(self.__grid_flow_item_canvas_items.pop(index))
                 if not self.__is_shared_selection:
                     self.__selection.remove_index(index)
                 self.__needs_handle_selection_changed = True
                 self.__needs_size_to_content = True
 
+    def insert_items(self, index: int, items: typing.Sequence[typing.Any]) -> None:
+        """Insert the items into the list model at index as a single change. The list model must be a ListModel."""
+        list_model = self.__get_mutable_list_model()
+        count = len(items)
+        with self.__preserve_scroll_anchor(lambda anchor_index, anchor_item: anchor_index + count if anchor_index >= index else anchor_index):
+            with self.__changing_items():
+                for offset, item in enumerate(items):
+                    list_model.insert_item(index + offset, item)
+            self.__insert_grid_flow_item_canvas_items(index, items)
+
+    def remove_items(self, index: int, count: int) -> None:
+        """Remove count items from the list model starting at index as a single change. The list model must be a ListModel."""
+        list_model = self.__get_mutable_list_model()
+        with self.__preserve_scroll_anchor(lambda anchor_index, anchor_item: anchor_index - count if anchor_index >= index + count else min(anchor_index, index)):
+            with self.__changing_items():
+                for remove_index in reversed(range(index, index + count)):
+                    list_model.remove_item(remove_index)
+            self.__remove_grid_flow_item_canvas_items(index, count)
+
+    def reset_items(self, items: typing.Sequence[typing.Any]) -> None:
+        """Replace the items in the list model as a single change. The list model must be a ListModel.
+
+        Selected items, the first visible item, and the item canvas items are matched to the new items by identity.
+        """
+        list_model = self.__get_mutable_list_model()
+        new_indexes = dict[int, int]()
+        for new_index, item in enumerate(items):
+            new_indexes.setdefault(id(item), new_index)
+        selected_items = [list_model.items[index] for index in self.__selection.indexes]
+        with self.__preserve_scroll_anchor(lambda anchor_index, anchor_item: new_indexes.get(id(anchor_item), anchor_index)):
+            with self.__changing_items():
+                for remove_index in reversed(range(len(list_model.items))):
+                    list_model.remove_item(remove_index)
+                for new_index, item in enumerate(items):
+                    list_model.insert_item(new_index, item)
+            # keep the item canvas items of the items that remain, in their new order; release the others and
+            # append new item canvas items for the new items, then put them all in order.
+            canvas_items_by_id = dict[int, GridFlowItemCanvasItem]()
+            released_canvas_items = list[GridFlowItemCanvasItem]()
+            for canvas_item in self.__grid_flow_item_canvas_items:
+                if id(canvas_item.item) in new_indexes and id(canvas_item.item) not in canvas_items_by_id:
+                    canvas_items_by_id[id(canvas_item.item)] = canvas_item
+                else:
+                    released_canvas_items.append(canvas_item)
+            if released_canvas_items:
+                self.release_canvas_items(released_canvas_items)
+            new_items = [item for new_index, item in enumerate(items) if new_indexes[id(item)] != new_index or id(item) not in canvas_items_by_id]
+            new_canvas_items = iter(self.__acquire_grid_flow_item_canvas_items(len(canvas_items_by_id), new_items))
+            grid_flow_item_canvas_items = list[GridFlowItemCanvasItem]()
+            for new_index, item in enumerate(items):
+                kept_canvas_item = canvas_items_by_id.get(id(item)) if new_indexes[id(item)] == new_index else None
+                grid_flow_item_canvas_items.append(kept_canvas_item or next(new_canvas_items))
+            self.reorder_canvas_items(grid_flow_item_canvas_items)
+            self.__grid_flow_item_canvas_items = grid_flow_item_canvas_items
+            if not self.__is_shared_selection:
+                self.__selection.set_multiple({new_indexes[id(item)] for item in selected_items if id(item) in new_indexes})
+            self.__needs_handle_selection_changed = True
+            self.__needs_size_to_content = True
+
+    def __get_mutable_list_model(self) -> ListModel.ListModel[typing.Any]:
+        list_model = self.__list_model
+        if not isinstance(list_model, ListModel.ListModel):
+            raise TypeError(f"Changing items requires a mutable ListModel, not {type(list_model).__name__}.")
+        return list_model
+
+    @contextlib.contextmanager
+    def __changing_items(self) -> typing.Iterator[None]:
+        # change the list model without handling each item inserted or removed event.
+        self.__is_changing_items = True
+        try:
+            yield
+        finally:
+            self.__is_changing_items = False
+
+    def __acquire_grid_flow_item_canvas_items(self, index: int, items: typing.Sequence[typing.Any]) -> typing.Sequence[GridFlowItemCanvasItem]:
+        def create_fn(offset: int) -> CanvasItem.AbstractCanvasItem:
+            return GridFlowItemCanvasItem(self, items[offset], self.__item_factory)
+
+        def reset_fn(offset: int, canvas_item: CanvasItem.AbstractCanvasItem) -> None:
+            self.__rebind_grid_flow_item_canvas_item(items[offset], canvas_item)
+
+        return typing.cast(typing.Sequence[GridFlowItemCanvasItem], self.acquire_canvas_items(index, len(items), create_fn, reset_fn))
+
+    def __insert_grid_flow_item_canvas_items(self, index: int, items: typing.Sequence[typing.Any]) -> None:
+        self.__grid_flow_item_canvas_items[index:index] = self.__acquire_grid_flow_item_canvas_items(index, items)
+        if not self.__is_shared_selection:
+            for offset in range(len(items)):
+                self.__selection.insert_index(index + offset)
+        self.__needs_handle_selection_changed = True
+        self.__needs_size_to_content = True
+
+    def __remove_grid_flow_item_canvas_items(self, index: int, count: int) -> None:
+        self.release_canvas_items(self.__grid_flow_item_canvas_items[index:index + count])
+        del self.__grid_flow_item_canvas_items[index:index + count]
+        if not self.__is_shared_selection:
+            for remove_index in reversed(range(index, index + count)):
+                self.__selection.remove_index(remove_index)
+        self.__needs_handle_selection_changed = True
+        self.__needs_size_to_content = True
+
+    @contextlib.contextmanager
+    def __preserve_scroll_anchor(self, map_anchor_index: typing.Callable[[int, typing.Any], int]) -> typing.Iterator[None]:
+        # batch the changes into a single layout and update. keep the first visible item at the same position in the
+        # enclosing scroll area; map_anchor_index maps its old index (and item) to the new index.
+        scroll_area = self.container
+        canvas_bounds = self.canvas_bounds
+        grid_flow_item_canvas_items = self.__grid_flow_item_canvas_items
+        anchor: tuple[int, typing.Any, Geometry.IntPoint] | None = None
+        self.__pending_content_origin = None
+        if isinstance(scroll_area, CanvasItem.ScrollAreaCanvasItem) and canvas_bounds and grid_flow_item_canvas_items and scroll_area.content_origin != Geometry.IntPoint():
+            # when scrolled to the top, stay at the top.
+            visible_origin = -scroll_area.content_origin
+            anchor_index = max(0, min(self._get_index_for_point(visible_origin, canvas_bounds.size), len(grid_flow_item_canvas_items) - 1))
+            anchor_offset = visible_origin - self._rect_for_index(anchor_index).origin
+            anchor = anchor_index, grid_flow_item_canvas_items[anchor_index].item, anchor_offset
+        sizing = self.sizing
+        with self.batch_update():
+            yield
+        if anchor and isinstance(scroll_area, CanvasItem.ScrollAreaCanvasItem):
+            anchor_index, anchor_item, anchor_offset = anchor
+            new_anchor_index = map_anchor_index(anchor_index, anchor_item)
+            if 0 <= new_anchor_index < len(self.__grid_flow_item_canvas_items):
+                content_origin = -(self._rect_for_index(new_anchor_index).origin + anchor_offset)
+                scroll_area.update_content_origin(content_origin)
+                # the scroll area limits the content origin to the current content size; if the content size changes,
+                # apply the content origin again once the new size is laid out.
+                self.__pending_content_origin = content_origin if self.sizing != sizing else None
+
+    def __handle_canvas_size_changed(self, canvas_size: Geometry.IntSize | None) -> None:
+        content_origin = self.__pending_content_origin
+        scroll_area = self.container
+        if content_origin is not None and isinstance(scroll_area, CanvasItem.ScrollAreaCanvasItem):
+            self.__pending_content_origin = None
+            scroll_area.update_content_origin(content_origin)
+
+    def __rebind_grid_flow_item_canvas_item(self, item: typing.Any, canvas_item: CanvasItem.AbstractCanvasItem) -> None:
+        typing.cast(GridFlowItemCanvasItem, canvas_item)._rebind(item, self.__item_factory, self.__item_rebinder)
+
     def _update_child(self, canvas_item: CanvasItem.AbstractCanvasItem) -> None:
         index = self._grid_flow_item_canvas_items.index(typing.cast(GridFlowItemCanvasItem, canvas_item))
         rect = self._rect_for_index(index)
@@ -324,15 +500,35 @@ class GridFlowCanvasItem(CanvasItem.CanvasItemComposition):
     def _batch_update_ended(self) -> None:
         if self.__needs_handle_selection_changed:
             # the selection status (drawing) of each item is uncertain after insert/remove, so update it
-            self.__handle_selection_changed()
+            self.__refresh_selection()
             self.__needs_handle_selection_changed = False
         if self.__needs_size_to_content:
             self.size_to_content()
             self.__needs_size_to_content = False
 
+    def __refresh_selection(self) -> None:
+        # update the selected state of every item canvas item.
+        selected_indexes = self.__selection.indexes
+        for index, canvas_item in enumerate(self.__grid_flow_item_canvas_items):
+            canvas_item.is_selected = index in selected_indexes
+            self._selection_touch_count += 1
+        self.__selected_indexes = selected_indexes
+
     def __handle_selection_changed(self) -> None:
-        for index, canvas_item in enumerate(typing.cast(typing.Sequence[GridFlowItemCanvasItem], self.canvas_items)):
-            canvas_item.is_selected = self.__selection.contains(index)
+        # the selection changed event does not describe the change, so compare the new selection to the last applied
+        # selection and only update the item canvas items that were added to or removed from the selection.
+        if self.__needs_handle_selection_changed:
+            # insert/remove is pending; the selection will be refreshed when the batch update ends.
+            return
+        selected_indexes = self.__selection.indexes
+        # index the item canvas items directly; canvas_items returns a copy of all of them.
+        canvas_items = self.__grid_flow_item_canvas_items
+        with self.batch_update():
+            for index in selected_indexes ^ self.__selected_indexes:
+                if 0 <= index < len(canvas_items):
+                    canvas_items[index].is_selected = index in selected_indexes
+                    self._selection_touch_count += 1
+        self.__selected_indexes = selected_indexes
 
     def __grid_flow_item_at_point(self, p: Geometry.IntPoint) -> GridFlowItemCanvasItem | None:
         canvas_bounds = self.canvas_bounds
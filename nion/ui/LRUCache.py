@@ -0,0 +1,119 @@
+"""A thread safe cache holding the most recently used values.
+"""
+
+from __future__ import annotations
+
+# standard libraries
+import collections
+import threading
+import typing
+
+# third party libraries
+# none
+
+# local libraries
+# none
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+
+class LRUCache(typing.Generic[_KeyType, _ValueType]):
+    """A thread safe cache holding the most recently used values up to a total size of capacity.
+
+    The size of each value is given by size_fn, or is one if size_fn is None, in which case capacity is the number of
+    values. When full, putting a new value evicts the least recently used values. A value larger than the capacity is
+    not kept. None cannot be cached since get returns None for a missing value.
+    """
+
+    def __init__(self, capacity: int, size_fn: typing.Optional[typing.Callable[[_ValueType], int]] = None) -> None:
+        self.__capacity = capacity
+        self.__size_fn = size_fn
+        self.__values: collections.OrderedDict[_KeyType, _ValueType] = collections.OrderedDict()
+        self.__sizes = dict[_KeyType, int]()
+        self.__size = 0
+        self.__lock = threading.Lock()
+        self.hit_count = 0  # stats for testing
+        self.miss_count = 0  # stats for testing
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached values."""
+        return self.__size
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups found in the cache."""
+        lookup_count = self.hit_count + self.miss_count
+        return self.hit_count / lookup_count if lookup_count else 0.0
+
+    def get(self, key: _KeyType) -> typing.Optional[_ValueType]:
+        """Return the value for key, or None if it is not in the cache."""
+        with self.__lock:
+            value = self.__values.get(key)
+            if value is not None:
+                self.__values.move_to_end(key)
+                self.hit_count += 1
+            else:
+                self.miss_count += 1
+            return value
+
+    def peek(self, key: _KeyType) -> typing.Optional[_ValueType]:
+        """Return the value for key, or None if it is not in the cache, without marking it as recently used."""
+        with self.__lock:
+            return self.__values.get(key)
+
+    def put(self, key: _KeyType, value: _ValueType) -> None:
+        """Put the value for key into the cache, evicting the least recently used value if full."""
+        with self.__lock:
+            self.__put(key, value)
+
+    def get_or_create(self, key: _KeyType, create_fn: typing.Callable[[], _ValueType]) -> _ValueType:
+        """Return the value for key, calling create_fn to make and cache it if it is not in the cache.
+
+        create_fn is called without holding the lock. If another thread caches a value for key in the meantime, that
+        value is returned instead so that all callers share the same value.
+        """
+        value = self.get(key)
+        if value is None:
+            new_value = create_fn()
+            with self.__lock:
+                value = self.__values.get(key)
+                if value is None:
+                    value = new_value
+                    self.__put(key, value)
+        return value
+
+    def pop(self, key: _KeyType) -> typing.Optional[_ValueType]:
+        """Remove the value for key from the cache and return it, or None if it is not in the cache."""
+        with self.__lock:
+            if key in self.__values:
+                self.__size -= self.__sizes.pop(key, 1)
+            return self.__values.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+            self.__sizes.clear()
+            self.__size = 0
+
+    def __put(self, key: _KeyType, value: _ValueType) -> None:
+        size_fn = self.__size_fn
+        if size_fn:
+            size = size_fn(value)
+            self.__size += size - self.__sizes.get(key, 0)
+            self.__sizes[key] = size
+        elif key not in self.__values:
+            self.__size += 1
+        self.__values[key] = value
+        self.__values.move_to_end(key)
+        while self.__size > self.__capacity:
+            evicted_key, _ = self.__values.popitem(last=False)
+            self.__size -= self.__sizes.pop(evicted_key, 1)
@@ -19,7 +19,9 @@ import weakref
 
 # local libraries
 from nion.ui import CanvasItem
+from nion.ui import DrawingContext
 from nion.ui import GridFlowCanvasItem
+from nion.ui import LRUCache
 from nion.ui import UserInterface
 from nion.utils import Event
 from nion.utils import Geometry
@@ -28,7 +30,6 @@ from nion.utils import Model
 from nion.utils import ReferenceCounting
 
 if typing.TYPE_CHECKING:
-    from nion.ui import DrawingContext
     from nion.utils import Selection
 
 
@@ -83,6 +84,57 @@ class ListCanvasItemDelegate(typing.Protocol):
     def paint_item(self, drawing_context: DrawingContext.DrawingContext, display_item: typing.Any, rect: Geometry.IntRect, is_selected: bool) -> None:
         return  # required to avoid being recognized as abstract by mypy
 
+    def item_version(self, index: int) -> typing.Any:
+        # used with the row cache. return a value that changes whenever the painting of the item changes.
+        return None
+
+
+@dataclasses.dataclass(frozen=True)
+class _ListRowCacheEntry:
+    display_item: typing.Any
+    version: typing.Any
+    width: int
+    is_selected: bool
+    drawing_context: DrawingContext.DrawingContext
+
+
+class _ListRowCache:
+    """A cache of the drawing of each row painted by the list delegate.
+
+    A row is painted again when its display item (by identity), delegate item version, width, or selected state
+    changes, or when it is invalidated explicitly. The least recently used rows beyond the capacity are discarded.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.__rows = LRUCache.LRUCache[int, _ListRowCacheEntry](capacity)
+        # stats for testing
+        self._paint_count = 0
+        self._replay_count = 0
+
+    def paint_item(self, drawing_context: DrawingContext.DrawingContext, delegate: ListCanvasItemDelegate, index: int, display_item: typing.Any, rect: Geometry.IntRect, is_selected: bool) -> None:
+        version = delegate.item_version(index)
+        entry = self.__rows.get(index)
+        if entry and entry.display_item is display_item and entry.version == version and entry.width == rect.width and entry.is_selected == is_selected:
+            self._replay_count += 1
+        else:
+            row_drawing_context = DrawingContext.DrawingContext()
+            delegate.paint_item(row_drawing_context, display_item, rect, is_selected)
+            entry = _ListRowCacheEntry(display_item, version, rect.width, is_selected, row_drawing_context)
+            self.__rows.put(index, entry)
+            self._paint_count += 1
+        drawing_context.add(entry.drawing_context)
+
+    @property
+    def capacity(self) -> int:
+        return self.__rows.capacity
+
+    def invalidate(self, indexes: typing.Optional[typing.Iterable[int]] = None) -> None:
+        if indexes is None:
+            self.__rows.clear()
+        else:
+            for index in indexes:
+                self.__rows.pop(index)
+
 
 class ListCanvasItemComposer(CanvasItem.BaseComposer):
     def __init__(self,
@@ -93,27 +145,39 @@ class ListCanvasItemComposer(CanvasItem.BaseComposer):
                  item_height: int,
                  drop_index: typing.Optional[int],
                  selection: Selection.IndexedSelection,
-                 focused: bool) -> None:
+                 focused: bool,
+                 row_cache: typing.Optional[_ListRowCache] = None) -> None:
         super().__init__(canvas_item, layout_sizing, composer_cache)
         self.__delegate = delegate
         self.__item_height = item_height
         self.__drop_index = drop_index
         self.__selection = selection
         self.__focused = focused
+        self.__row_cache = row_cache
 
     def _adjust_canvas_bounds(self, canvas_bounds: Geometry.IntRect) -> Geometry.IntRect:
         item_count = self.__delegate.item_count
         height = item_count * self.__item_height
         return Geometry.IntRect(canvas_bounds.origin, Geometry.IntSize(height=height, width=canvas_bounds.width))
 
+    def _repaint_visible(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect, composer_cache: CanvasItem.ComposerCache) -> None:
+        if self.__row_cache:
+            # with the row cache, only paint the visible rows; the rows are replayed from the cache while scrolling.
+            self.__repaint_rows(drawing_context, canvas_rect, visible_rect.intersect(canvas_rect) - canvas_rect.origin)
+        else:
+            super()._repaint_visible(drawing_context, canvas_rect, visible_rect, composer_cache)
+
     def _repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, composer_cache: CanvasItem.ComposerCache) -> None:
+        self.__repaint_rows(drawing_context, canvas_rect, Geometry.IntRect(Geometry.IntPoint(), canvas_rect.size))
+
+    def __repaint_rows(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, visible_rect: Geometry.IntRect) -> None:
         canvas_size = canvas_rect.size
-        visible_rect = Geometry.IntRect(Geometry.IntPoint(), canvas_rect.size)
         delegate = self.__delegate
         item_height = self.__item_height
         drop_index = self.__drop_index
         selection = self.__selection
         focused = self.__focused
+        row_cache = self.__row_cache
         if canvas_size.height > 0 and canvas_size.width > 0:
             item_width = canvas_rect.width
 
@@ -135,7 +199,10 @@ class ListCanvasItemComposer(CanvasItem.BaseComposer):
                                     drawing_context.rect(rect.left, rect.top, rect.width, rect.height)
                                     drawing_context.fill_style = "#3875D6" if focused else "#DDD"
                                     drawing_context.fill()
-                            delegate.paint_item(drawing_context, items[index], rect, is_selected)
+                            if row_cache:
+                                row_cache.paint_item(drawing_context, delegate, index, items[index], rect, is_selected)
+                            else:
+                                delegate.paint_item(drawing_context, items[index], rect, is_selected)
                             if index == drop_index:
                                 with drawing_context.saver():
                                     drop_border_width = 2.5
@@ -163,9 +230,13 @@ class ListCanvasItem(CanvasItem.AbstractCanvasItem):
         key_pressed(key): called when user presses a key
         delete_pressed(): called when user presses delete key
         drag_started(index, x, y, modifiers): called when user begins drag with given index
+        item_version(index): return a value that changes when the painting of the item changes (with cache_rows)
+
+    If cache_rows is True, the drawing of each row is cached and only painted again when its item, item version,
+    width, or selected state changes. Call invalidate_items to repaint specific rows.
     """
 
-    def __init__(self, delegate: ListCanvasItemDelegate, selection: Selection.IndexedSelection, item_height: int = 80) -> None:
+    def __init__(self, delegate: ListCanvasItemDelegate, selection: Selection.IndexedSelection, item_height: int = 80, *, cache_rows: bool = False) -> None:
         super().__init__()
         # store parameters
         self.__delegate: typing.Optional[ListCanvasItemDelegate] = delegate
@@ -184,6 +255,7 @@ class ListCanvasItem(CanvasItem.AbstractCanvasItem):
         self.__drop_before_index: typing.Optional[int] = None
         self.__drop_index: typing.Optional[int] = None
         self.__item_height = item_height
+        self.__row_cache = _ListRowCache() if cache_rows else None
 
     def close(self) -> None:
         self.__selection_changed_listener.close()
@@ -214,9 +286,20 @@ class ListCanvasItem(CanvasItem.AbstractCanvasItem):
                                     size=Geometry.IntSize(width=item_width, height=item_height))
         return Geometry.IntRect.empty_rect()
 
+    @property
+    def _row_cache(self) -> typing.Optional[_ListRowCache]:
+        # for testing.
+        return self.__row_cache
+
+    def invalidate_items(self, indexes: typing.Optional[typing.Iterable[int]] = None) -> None:
+        """Repaint the items at the indexes, or all items if indexes is None."""
+        if self.__row_cache:
+            self.__row_cache.invalidate(indexes)
+        self.update()
+
     def _get_composer(self, composer_cache: CanvasItem.ComposerCache) -> typing.Optional[CanvasItem.BaseComposer]:
         assert self.__delegate
-        return ListCanvasItemComposer(self, self.layout_sizing, composer_cache, self.__delegate, self.__item_height, self.__drop_index, self.__selection, self.focused)
+        return ListCanvasItemComposer(self, self.layout_sizing, composer_cache, self.__delegate, self.__item_height, self.__drop_index, self.__selection, self.focused, self.__row_cache)
 
     def context_menu_event(self, x: int, y: int, gx: int, gy: int) -> bool:
         delegate = self.__delegate
@@ -538,6 +621,7 @@ class ListCanvasItemCompositionComposer(CanvasItem.CanvasItemCompositionComposer
                 else:
                     child_canvas_rect = Geometry.IntRect(Geometry.IntPoint(), Geometry.IntSize())
                 if visible_rect.intersects_rect(child_canvas_rect):
+                    CanvasItem.repaint_checkpoint()
                     with drawing_context.saver():
                         child_composer.update_layout(Geometry.IntPoint(), child_canvas_rect.size)
                         child_composer.repaint(drawing_context, child_canvas_rect, visible_rect)
@@ -550,14 +634,14 @@ class ListCanvasItem2(GridFlowCanvasItem.GridFlowCanvasItem):
     from being modified when items are inserted or removed.
     """
 
-    def __init__(self, list_model: ListModel.ListModelLike, selection: Selection.IndexedSelection, item_factory: GridFlowCanvasItem.GridFlowItemFactory, delegate: GridFlowCanvasItem.GridFlowCanvasItemDelegate, item_width: int | None = None, item_height: int | None = None, *, key: typing.Optional[str] = None, is_shared_selection: bool = False) -> None:
+    def __init__(self, list_model: ListModel.ListModelLike, selection: Selection.IndexedSelection, item_factory: GridFlowCanvasItem.GridFlowItemFactory, delegate: GridFlowCanvasItem.GridFlowCanvasItemDelegate, item_width: int | None = None, item_height: int | None = None, *, key: typing.Optional[str] = None, is_shared_selection: bool = False, pool_capacity: int = 0, item_rebinder: GridFlowCanvasItem.GridFlowItemRebinder | None = None) -> None:
         layout: CanvasItem.CanvasItemAbstractLayout | None = None
         if item_width is not None:
             layout = ListRowLayout(item_width)
         if item_height is not None:
             layout = ListColumnLayout(item_height)
         assert layout
-        super().__init__(list_model, selection, layout, item_factory, delegate, key=key, is_shared_selection=is_shared_selection)
+        super().__init__(list_model, selection, layout, item_factory, delegate, key=key, is_shared_selection=is_shared_selection, pool_capacity=pool_capacity, item_rebinder=item_rebinder)
         self.__item_width = item_width
         self.__item_height = item_height
 
@@ -0,0 +1,286 @@
+"""A filtered and sorted projection of a list model, updated incrementally.
+"""
+
+from __future__ import annotations
+
+# standard libraries
+import asyncio
+import bisect
+import concurrent.futures
+import functools
+import typing
+
+# third party libraries
+# none
+
+# local libraries
+from nion.utils import Event
+from nion.utils import ListModel
+from nion.utils import Observable
+from nion.utils import ReferenceCounting
+
+FilterPredicate = typing.Callable[[typing.Any], bool]
+SortKeyCallable = typing.Callable[[typing.Any], typing.Any]
+
+
+class _ReversedKey:
+    """Wrap a sort key so that it sorts in reverse order."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: typing.Any) -> None:
+        self.key = key
+
+    def __lt__(self, other: _ReversedKey) -> bool:
+        return bool(other.key < self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ReversedKey) and bool(self.key == other.key)
+
+
+def _filter_chunk(predicate: FilterPredicate, items: typing.Sequence[typing.Any]) -> typing.List[bool]:
+    return [bool(predicate(item)) for item in items]
+
+
+def _longest_increasing_subsequence(values: typing.Sequence[int]) -> typing.Set[int]:
+    """Return the values of a longest strictly increasing subsequence of values."""
+    tail_values = list[int]()  # smallest tail value of an increasing subsequence of each length
+    tail_indexes = list[int]()  # index into values of each tail
+    previous_indexes = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tail_values, value)
+        if length == len(tail_values):
+            tail_values.append(value)
+            tail_indexes.append(index)
+        else:
+            tail_values[length] = value
+            tail_indexes[length] = index
+        previous_indexes[index] = tail_indexes[length - 1] if length > 0 else -1
+    result = set[int]()
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index >= 0:
+        result.add(values[index])
+        index = previous_indexes[index]
+    return result
+
+
+class ProjectedListModel(Observable.Observable):
+    """A filtered and sorted view of the items of a list model.
+
+    The sort keys, the sorted order, and the filter results of the container items are kept as index arrays and are
+    updated incrementally when the container items, the filter, or the sort key change. Each change is sent as the
+    minimal set of item inserted/removed events (a move is a remove followed by an insert) between begin/end changes
+    events, which GridFlowCanvasItem and ListCanvasItem2 apply as a single batch.
+
+    When the filter or sort key changes, items is the new list for the whole change; the events describe the steps from
+    the previous list.
+
+    filter_async runs the filter predicate on an executor in chunks and applies the result on the event loop thread.
+    Pass narrowing when the new filter only matches items matched by the current filter (for instance, when text is
+    appended to a search string) to only test the currently included items.
+    """
+
+    def __init__(self, container: ListModel.ListModelLike, *, master_items_key: typing.Optional[str] = None,
+                 items_key: typing.Optional[str] = None, filter: typing.Optional[FilterPredicate] = None,
+                 sort_key: typing.Optional[SortKeyCallable] = None, sort_reverse: bool = False) -> None:
+        super().__init__()
+        self.__container = container
+        self.__master_items_key = master_items_key or "items"
+        self.__items_key = items_key or "items"
+        self.__filter = filter
+        self.__sort_key = sort_key
+        self.__sort_reverse = sort_reverse
+        self.begin_changes_event = Event.Event()
+        self.end_changes_event = Event.Event()
+        self.__master_items = list(container.items)
+        self.__sort_keys = [self.__make_sort_key(item) for item in self.__master_items]
+        self.__included = [self.__matches(item) for item in self.__master_items]
+        self.__order = sorted(range(len(self.__master_items)), key=self.__order_key)  # master indexes, sorted
+        self.__indexes = [index for index in self.__order if self.__included[index]]  # master indexes, projected
+        self.__items = [self.__master_items[index] for index in self.__indexes]
+        self.__master_version = 0  # incremented when the master items change
+        self.__filter_generation = 0  # incremented when the filter changes; used to abandon stale async filters
+        self.__item_inserted_listener: typing.Optional[Event.EventListener] = container.item_inserted_event.listen(ReferenceCounting.weak_partial(ProjectedListModel.__master_item_inserted, self))
+        self.__item_removed_listener: typing.Optional[Event.EventListener] = container.item_removed_event.listen(ReferenceCounting.weak_partial(ProjectedListModel.__master_item_removed, self))
+
+    def close(self) -> None:
+        self.__item_inserted_listener = None
+        self.__item_removed_listener = None
+
+    @property
+    def items(self) -> typing.Sequence[typing.Any]:
+        return self.__items
+
+    @property
+    def item_count(self) -> int:
+        return len(self.__items)
+
+    def __getattr__(self, item: str) -> typing.Any:
+        if item == self.__items_key:
+            return self.items
+        raise AttributeError(item)
+
+    @property
+    def filter(self) -> typing.Optional[FilterPredicate]:
+        return self.__filter
+
+    @filter.setter
+    def filter(self, value: typing.Optional[FilterPredicate]) -> None:
+        self.set_filter(value)
+
+    def set_filter(self, predicate: typing.Optional[FilterPredicate], *, narrowing: bool = False) -> None:
+        """Set the filter predicate, testing only the included items if narrowing."""
+        self.__filter_generation += 1
+        self.__filter = predicate
+        if narrowing:
+            included = [self.__included[index] and self.__matches(item) for index, item in enumerate(self.__master_items)]
+        else:
+            included = [self.__matches(item) for item in self.__master_items]
+        self.__apply_included(included)
+
+    async def filter_async(self, predicate: typing.Optional[FilterPredicate], *, narrowing: bool = False,
+                           executor: typing.Optional[concurrent.futures.Executor] = None, chunk_size: int = 10000) -> bool:
+        """Set the filter predicate, running it on the executor in chunks of chunk_size items.
+
+        The executor is the event loop default executor if None. Return False if a later filter change superseded this
+        one before it was applied.
+        """
+        loop = asyncio.get_running_loop()
+        self.__filter_generation += 1
+        filter_generation = self.__filter_generation
+        master_version = self.__master_version
+        master_items = list(self.__master_items)
+        candidate_indexes = [index for index, included in enumerate(self.__included) if included] if narrowing else list(range(len(master_items)))
+        candidate_items = [master_items[index] for index in candidate_indexes]
+        results = list[bool]()
+        if predicate:
+            for start in range(0, len(candidate_items), chunk_size):
+                chunk = candidate_items[start:start + chunk_size]
+                results.extend(await loop.run_in_executor(executor, functools.partial(_filter_chunk, predicate, chunk)))
+                if filter_generation != self.__filter_generation:
+                    return False
+        else:
+            results = [True] * len(candidate_items)
+        self.__filter = predicate
+        if master_version == self.__master_version:
+            included = [False] * len(master_items)
+            for index, result in zip(candidate_indexes, results):
+                included[index] = result
+        else:
+            # the master items changed while filtering; reuse the results by item and test the new items here.
+            results_by_id = {id(item): result for item, result in zip(candidate_items, results)}
+            master_item_ids = {id(item) for item in master_items}
+            included = list[bool]()
+            for item in self.__master_items:
+                item_id = id(item)
+                if item_id in results_by_id:
+                    included.append(results_by_id[item_id])
+                elif narrowing and item_id in master_item_ids:
+                    included.append(False)  # excluded by the previous filter
+                else:
+                    included.append(self.__matches(item))
+        self.__apply_included(included)
+        return True
+
+    @property
+    def sort_key(self) -> typing.Optional[SortKeyCallable]:
+        return self.__sort_key
+
+    @sort_key.setter
+    def sort_key(self, value: typing.Optional[SortKeyCallable]) -> None:
+        self.__sort_key = value
+        self.__resort()
+
+    @property
+    def sort_reverse(self) -> bool:
+        return self.__sort_reverse
+
+    @sort_reverse.setter
+    def sort_reverse(self, value: bool) -> None:
+        self.__sort_reverse = value
+        self.__resort()
+
+    def __matches(self, item: typing.Any) -> bool:
+        return bool(self.__filter(item)) if self.__filter else True
+
+    def __make_sort_key(self, item: typing.Any) -> typing.Any:
+        if self.__sort_key:
+            sort_key = self.__sort_key(item)
+            return _ReversedKey(sort_key) if self.__sort_reverse else sort_key
+        return None
+
+    def __order_key(self, index: int) -> typing.Any:
+        # items with equal sort keys stay in master order.
+        return (self.__sort_keys[index], index) if self.__sort_key else index
+
+    def __resort(self) -> None:
+        self.__sort_keys = [self.__make_sort_key(item) for item in self.__master_items]
+        self.__order = sorted(range(len(self.__master_items)), key=self.__order_key)
+        self.__update_indexes([index for index in self.__order if self.__included[index]])
+
+    def __apply_included(self, included: typing.List[bool]) -> None:
+        self.__included = included
+        self.__update_indexes([index for index in self.__order if included[index]])
+
+    def __update_indexes(self, new_indexes: typing.List[int]) -> None:
+        # send the minimal changes to go from the current projection to the new projection. items in both projections
+        # that are in a longest increasing run of old positions stay in place; the others are removed and then
+        # inserted at their new positions.
+        old_positions = {index: position for position, index in enumerate(self.__indexes)}
+        common_positions = [old_positions[index] for index in new_indexes if index in old_positions]
+        if all(a < b for a, b in zip(common_positions, common_positions[1:])):
+            kept_positions = set(common_positions)
+        else:
+            kept_positions = _longest_increasing_subsequence(common_positions)
+        removed_positions = [position for position in range(len(self.__indexes)) if position not in kept_positions]
+        inserted = [(position, index) for position, index in enumerate(new_indexes) if old_positions.get(index, -1) not in kept_positions]
+        if removed_positions or inserted:
+            # update the items in one step rather than per event; inserting into or removing from the middle of a long
+            # list for each event is quadratic.
+            old_items = self.__items
+            self.__indexes = new_indexes
+            self.__items = [self.__master_items[index] for index in new_indexes]
+            self.begin_changes_event.fire(self.__items_key)
+            try:
+                for position in reversed(removed_positions):
+                    self.notify_remove_item(self.__items_key, old_items[position], position)
+                for position, index in inserted:
+                    self.notify_insert_item(self.__items_key, self.__master_items[index], position)
+            finally:
+                self.end_changes_event.fire(self.__items_key)
+
+    def __master_item_inserted(self, key: str, item: typing.Any, before_index: int) -> None:
+        if key != self.__master_items_key:
+            return
+        self.__master_version += 1
+        if before_index < len(self.__master_items):
+            self.__order = [index + 1 if index >= before_index else index for index in self.__order]
+            self.__indexes = [index + 1 if index >= before_index else index for index in self.__indexes]
+        self.__master_items.insert(before_index, item)
+        self.__sort_keys.insert(before_index, self.__make_sort_key(item))
+        self.__included.insert(before_index, self.__matches(item))
+        order_key = self.__order_key(before_index)
+        self.__order.insert(bisect.bisect_left(self.__order, order_key, key=self.__order_key), before_index)
+        if self.__included[before_index]:
+            position = bisect.bisect_left(self.__indexes, order_key, key=self.__order_key)
+            self.__indexes.insert(position, before_index)
+            self.__items.insert(position, item)
+            self.notify_insert_item(self.__items_key, item, position)
+
+    def __master_item_removed(self, key: str, item: typing.Any, index: int) -> None:
+        if key != self.__master_items_key:
+            return
+        self.__master_version += 1
+        order_key = self.__order_key(index)
+        if self.__included[index]:
+            position = bisect.bisect_left(self.__indexes, order_key, key=self.__order_key)
+            self.__indexes.pop(position)
+            self.__items.pop(position)
+            self.notify_remove_item(self.__items_key, item, position)
+        self.__order.pop(bisect.bisect_left(self.__order, order_key, key=self.__order_key))
+        del self.__master_items[index]
+        del self.__sort_keys[index]
+        del self.__included[index]
+        if index < len(self.__master_items):
+            self.__order = [i - 1 if i > index else i for i in self.__order]
+            self.__indexes = [i - 1 if i > index else i for i in self.__indexes]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import collections
 import copy
+import functools
 import logging
 import math
 import numpy
@@ -18,6 +19,9 @@ from PySide6 import QtGui
 from PySide6 import QtWidgets
 from PySide6.QtCore import Signal, Slot
 
+# local libraries
+from nion.ui import LRUCache
+
 if typing.TYPE_CHECKING:
     from nion.ui import QtUserInterface
 
@@ -1308,6 +1312,30 @@ def addArcToPath(path: QtGui.QPainterPath, x: float, y: float, radius: float, st
         path.arcTo(x_start, y_start, width, height, start_angle_degrees, sweep_angle_degrees)
 
 
+# parsed fonts and their metrics, keyed by font string and display scaling.
+_font_cache = LRUCache.LRUCache[typing.Tuple[str, float], typing.Tuple[QtGui.QFont, QtGui.QFontMetrics]](256)
+
+
+def GetFontAndMetrics(font_string: str, display_scaling: float) -> typing.Tuple[QtGui.QFont, QtGui.QFontMetrics]:
+    """Return the parsed font and font metrics for the font string, sharing them between calls.
+
+    The returned font must not be modified.
+    """
+    def make_font_and_metrics() -> typing.Tuple[QtGui.QFont, QtGui.QFontMetrics]:
+        font = ParseFontString(font_string, display_scaling)
+        return font, QtGui.QFontMetrics(font)
+
+    return _font_cache.get_or_create((font_string, display_scaling), make_font_and_metrics)
+
+
+ElideModes = {
+    0: QtCore.Qt.ElideLeft,
+    1: QtCore.Qt.ElideRight,
+    2: QtCore.Qt.ElideMiddle,
+    3: QtCore.Qt.ElideNone
+}
+
+
 def ParseFontString(font_string: str, display_scaling: float = 1.0) -> QtGui.QFont:
     font = QtGui.QFont()
     family_parts = list()
@@ -1374,12 +1402,45 @@ def ParseFontString(font_string: str, display_scaling: float = 1.0) -> QtGui.QFo
     return font
 
 
+# colors, brushes, and pens are interned since an application paints with a small set of colors. the cached objects
+# are shared and must not be modified.
+_colors = LRUCache.LRUCache[str, QtGui.QColor](1024)
+_color_brushes = LRUCache.LRUCache[int, QtGui.QBrush](1024)
+_color_pens = LRUCache.LRUCache[typing.Tuple[typing.Any, ...], QtGui.QPen](1024)
+
+
 def ParseColorString(color_string: str) -> QtGui.QColor:
+    """Return the color for the color string. The returned color is shared and must not be modified."""
+    return _colors.get_or_create(color_string, functools.partial(_ParseColorString, color_string))
+
+
+def GetColorBrush(color: QtGui.QColor) -> QtGui.QBrush:
+    """Return a solid brush for the color. The returned brush is shared and must not be modified."""
+    return _color_brushes.get_or_create(color.rgba(), functools.partial(QtGui.QBrush, color))
+
+
+def GetColorPen(color: QtGui.QColor, width: float, join_style: QtCore.Qt.PenJoinStyle, cap_style: QtCore.Qt.PenCapStyle, dash: float) -> QtGui.QPen:
+    """Return a pen with the color and style. The returned pen is shared and must not be modified."""
+    def make_pen() -> QtGui.QPen:
+        pen = QtGui.QPen(color)
+        pen.setWidthF(width)
+        pen.setJoinStyle(join_style)
+        pen.setCapStyle(cap_style)
+        if dash > 0:
+            pen.setDashPattern([dash, dash])
+        return pen
+
+    return _color_pens.get_or_create((color.rgba(), width, join_style, cap_style, dash), make_pen)
+
+
+_rgba_color_expression = QtCore.QRegularExpression("^rgba\\((\\d+),\\s*(\\d+),\\s*(\\d+),\\s*(\\d+\\.\\d+)\\)$")
+_rgb_color_expression = QtCore.QRegularExpression("^rgb\\((\\d+),\\s*(\\d+),\\s*(\\d+)\\)$")
+
+
+def _ParseColorString(color_string: str) -> QtGui.QColor:
     color = QtGui.QColor()
-    re1 = QtCore.QRegularExpression("^rgba\\((\\d+),\\s*(\\d+),\\s*(\\d+),\\s*(\\d+\\.\\d+)\\)$")
-    re2 = QtCore.QRegularExpression("^rgb\\((\\d+),\\s*(\\d+),\\s*(\\d+)\\)$")
-    match1 = re1.match(color_string)
-    match2 = re2.match(color_string)
+    match1 = _rgba_color_expression.match(color_string)
+    match2 = _rgb_color_expression.match(color_string)
     if match1.hasMatch():
         color = QtGui.QColor(int(match1.captured(1)), int(match1.captured(2)), int(match1.captured(3)), int(float(match1.captured(4)) * 255))
     elif match2.hasMatch():
@@ -1452,6 +1513,10 @@ count_map: typing.Dict[str, typing.Any] = dict()
 
 RenderedTimestamp = collections.namedtuple("RenderedTimestamp", ["transform", "timestamp", "section_id"])
 
+# brushes for gradients, keyed by gradient id and display scaling. gradient ids are derived from the gradient contents,
+# so a brush can be reused whenever its id is drawn again.
+_gradient_brush_cache = LRUCache.LRUCache[typing.Tuple[int, float], QtGui.QBrush](256)
+
 
 def PaintCommands(painter: QtGui.QPainter, commands: typing.List[CanvasDrawingCommand],
                   image_cache: typing.MutableMapping[int, PaintImageCacheEntry], display_scaling: float = 1.0, *,
@@ -1490,6 +1555,7 @@ def PaintCommands(painter: QtGui.QPainter, commands: typing.List[CanvasDrawingCo
     context_scaling_y = 1.0
 
     gradients: typing.Dict[int, QtGui.QLinearGradient] = dict()
+    gradient_brushes: typing.Dict[int, QtGui.QBrush] = dict()
 
     painter.fillRect(painter.viewport(), QtGui.QBrush(fill_color))
 
@@ -1711,23 +1777,20 @@ def PaintCommands(painter: QtGui.QPainter, commands: typing.List[CanvasDrawingCo
                     if image_cache:
                         image_cache[image_id] = PaintImageCacheEntry(image_id, True, image)
         elif cmd == "stroke":
-            pen = QtGui.QPen(line_color)
-            pen.setWidthF(line_width * display_scaling)
-            pen.setJoinStyle(line_join)
-            pen.setCapStyle(line_cap)
-            if line_dash > 0:
-                dashes = [line_dash * display_scaling, line_dash * display_scaling]
-                pen.setDashPattern(dashes)
+            pen = GetColorPen(line_color, line_width * display_scaling, line_join, line_cap, line_dash * display_scaling)
             painter.strokePath(path, pen)
         elif cmd == "fill":
-            brush = QtGui.QBrush(gradients[fill_gradient]) if fill_gradient >= 0 else QtGui.QBrush(fill_color)
+            brush = gradient_brushes[fill_gradient] if fill_gradient >= 0 else GetColorBrush(fill_color)
             painter.fillPath(path, brush)
         elif cmd == "fillStyle":
-            color_arg = args[0].strip()
-            fill_color = ParseColorString(color_arg)
+            fill_color = ParseColorString(args[0].strip())
             fill_gradient = -1
         elif cmd == "fillStyleGradient":
             fill_gradient = args[0]
+            if fill_gradient not in gradient_brushes:
+                gradient_brush = QtGui.QBrush(gradients[fill_gradient])
+                gradient_brushes[fill_gradient] = gradient_brush
+                _gradient_brush_cache.put((fill_gradient, display_scaling), gradient_brush)
         elif cmd == "fillText" or cmd == "strokeText":
             text = args[0]
             text_pos = QtCore.QPointF(args[1] * display_scaling, args[2] * display_scaling)
@@ -1750,7 +1813,7 @@ def PaintCommands(painter: QtGui.QPainter, commands: typing.List[CanvasDrawingCo
             path = QtGui.QPainterPath()
             path.addText(text_pos, text_font, text)
             if cmd == "fillText":
-                brush = QtGui.QBrush(gradients[fill_gradient]) if fill_gradient >= 0 else QtGui.QBrush(fill_color)
+                brush = gradient_brushes[fill_gradient] if fill_gradient >= 0 else GetColorBrush(fill_color)
                 painter.fillPath(path, brush)
             else:
                 pen = QtGui.QPen(line_color)
@@ -1785,8 +1848,7 @@ def PaintCommands(painter: QtGui.QPainter, commands: typing.List[CanvasDrawingCo
             if args[0] == "bottom":
                 text_baseline = 6
         elif cmd == "strokeStyle":
-            color_arg = args[0].strip()
-            line_color = ParseColorString(color_arg)
+            line_color = ParseColorString(args[0].strip())
         elif cmd == "lineDash":
             line_dash = args[0]
         elif cmd == "lineWidth":
@@ -1806,9 +1868,16 @@ def PaintCommands(painter: QtGui.QPainter, commands: typing.List[CanvasDrawingCo
             if args[0] == "bevel":
                 line_join = QtCore.Qt.BevelJoin
         elif cmd == "gradient":
-            gradients[args[0]] = QtGui.QLinearGradient(args[3] * display_scaling, args[4] * display_scaling, args[3] * display_scaling + args[5] * display_scaling, args[4] * display_scaling + args[6] * display_scaling)
+            if args[0] not in gradient_brushes:
+                gradient_brush = _gradient_brush_cache.get((args[0], display_scaling))
+                if gradient_brush is not None:
+                    # the brush for this gradient was built before; skip building it and its color stops.
+                    gradient_brushes[args[0]] = gradient_brush
+                else:
+                    gradients[args[0]] = QtGui.QLinearGradient(args[3] * display_scaling, args[4] * display_scaling, args[3] * display_scaling + args[5] * display_scaling, args[4] * display_scaling + args[6] * display_scaling)
         elif cmd == "colorStop":
-            gradients[args[0]].setColorAt(args[1], QtGui.QColor(args[2]))
+            if args[0] not in gradient_brushes:
+                gradients[args[0]].setColorAt(args[1], QtGui.QColor(args[2]))
         elif cmd == "sleep":
             duration = args[0] * 1000000
             QtCore.QThread.usleep(duration)
@@ -2734,10 +2803,18 @@ class PyQtProxy:
     def Core_getFontMetrics(self, font_str: str, text: str) -> typing.Tuple[int, int, int, int, int]:
         text = text if text else str()
         display_scaling = GetDisplayScaling()
-        font = ParseFontString(font_str, display_scaling)
-        font_metrics = QtGui.QFontMetrics(font)
+        font, font_metrics = GetFontAndMetrics(font_str, display_scaling)
         return font_metrics.horizontalAdvance(text) / display_scaling, font_metrics.height() / display_scaling, font_metrics.ascent() / display_scaling, font_metrics.descent() / display_scaling, font_metrics.leading() / display_scaling
 
+    def Core_measureTexts(self, font_str: str, texts: typing.Sequence[str]) -> typing.List[typing.Tuple[int, int, int, int, int]]:
+        display_scaling = GetDisplayScaling()
+        font, font_metrics = GetFontAndMetrics(font_str, display_scaling)
+        height = font_metrics.height() / display_scaling
+        ascent = font_metrics.ascent() / display_scaling
+        descent = font_metrics.descent() / display_scaling
+        leading = font_metrics.leading() / display_scaling
+        return [(font_metrics.horizontalAdvance(text or str()) / display_scaling, height, ascent, descent, leading) for text in texts]
+
     def Core_getQtVersion(self) -> str:
         return QtCore.qVersion()
 
@@ -2788,15 +2865,14 @@ class PyQtProxy:
     def Core_truncateToWidth(self, font_str: str, text: str, pixel_width: int, mode: int) -> str:
         text = text if text else str()
         display_scaling = GetDisplayScaling()
-        font = ParseFontString(font_str, display_scaling)
-        font_metrics = QtGui.QFontMetrics(font)
-        mapping = {
-            0: QtCore.Qt.ElideLeft,
-            1: QtCore.Qt.ElideRight,
-            2: QtCore.Qt.ElideMiddle,
-            3: QtCore.Qt.ElideNone
-        }
-        return font_metrics.elidedText(text, mapping[mode], pixel_width)
+        font, font_metrics = GetFontAndMetrics(font_str, display_scaling)
+        return font_metrics.elidedText(text, ElideModes[mode], pixel_width)
+
+    def Core_truncateTextsToWidth(self, font_str: str, texts: typing.Sequence[str], pixel_width: int, mode: int) -> typing.List[str]:
+        display_scaling = GetDisplayScaling()
+        font, font_metrics = GetFontAndMetrics(font_str, display_scaling)
+        elide_mode = ElideModes[mode]
+        return [font_metrics.elidedText(text or str(), elide_mode, pixel_width) for text in texts]
 
     def Core_URLToPath(self, url: str) -> str:
         qurl = QtCore.QUrl(url)
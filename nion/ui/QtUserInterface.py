@@ -23,6 +23,7 @@ import numpy
 from nion.ui import Bitmap
 from nion.ui import CanvasItem
 from nion.ui import DrawingContext
+from nion.ui import LRUCache
 from nion.ui import UserInterface
 from nion.utils import Color
 from nion.utils import Geometry
@@ -1947,9 +1948,11 @@ class QtMenu(UserInterface.Menu):
 
 class QtWindow(UserInterface.Window):
 
-    def __init__(self, proxy: _QtProxy, parent: typing.Optional[UserInterface.Window], title: str) -> None:
+    def __init__(self, proxy: _QtProxy, parent: typing.Optional[UserInterface.Window], title: str,
+                 display_scaling_changed_fn: typing.Optional[typing.Callable[[], None]] = None) -> None:
         super().__init__(parent, title)
         self.proxy = proxy
+        self.__display_scaling_changed_fn = display_scaling_changed_fn
         parent_native: typing.Optional[_QtObject] = typing.cast(QtWindow, parent).native_document_window if parent else None
         self.native_document_window: _QtObject = self.proxy.DocumentWindow_create(parent_native, title)
         self.proxy.DocumentWindow_connect(self.native_document_window, self)
@@ -2124,12 +2127,16 @@ class QtWindow(UserInterface.Window):
         return Geometry.IntSize(w=w, h=h)
 
     def logicalDPIChanged(self, dpi: float) -> None:
+        if callable(self.__display_scaling_changed_fn):
+            self.__display_scaling_changed_fn()
         self._handle_logical_dpi_changed(dpi)
 
     def physicalDPIChanged(self, dpi: float) -> None:
         self._handle_physical_dpi_changed(dpi)
 
     def screenChanged(self) -> None:
+        if callable(self.__display_scaling_changed_fn):
+            self.__display_scaling_changed_fn()
         self._handle_screen_changed()
 
     def colorSchemeChanged(self, color_scheme: str) -> None:
@@ -2226,6 +2233,12 @@ class QtUserInterface(UserInterface.UserInterface):
         self.proxy = proxy
         self.persistence_root = "0"
         self.persistence_handler: typing.Optional[UserInterface.PersistenceHandler] = None
+        # font metrics, shared by all canvas items. the host measures with fonts at the current display scaling and
+        # rounding makes the metrics depend on it, so the cache is cleared when the display scaling changes.
+        self._font_metrics_cache = LRUCache.LRUCache[typing.Tuple[str, str], UserInterface.FontMetrics](4096)
+        # truncated texts, shared by all canvas items since rows are repainted with the same inputs across frames. the
+        # host truncates at the current display scaling, so the cache is cleared when the display scaling changes.
+        self._truncated_text_cache = LRUCache.LRUCache[typing.Tuple[str, str, int, int], str](8192)
         self.proxy.Core_syncLatencyTimer(time.perf_counter())
 
     def close(self) -> None:
@@ -2260,7 +2273,7 @@ class QtUserInterface(UserInterface.UserInterface):
     # window elements
 
     def create_document_window(self, title: typing.Optional[str] = None, parent_window: typing.Optional[UserInterface.Window] = None) -> UserInterface.Window:
-        return QtWindow(self.proxy, parent_window, title or str())
+        return QtWindow(self.proxy, parent_window, title or str(), self._display_scaling_changed)
 
     def destroy_document_window(self, document_window: UserInterface.Window) -> None:
         document_window.close()
@@ -2436,14 +2449,56 @@ class QtUserInterface(UserInterface.UserInterface):
             self.proxy.DrawingContext_paintRGBAToImage(self.proxy.convert_drawing_commands(drawing_context.commands), image_array)
         return image_array
 
+    def _display_scaling_changed(self) -> None:
+        # called when a window reports a logical dpi or screen change.
+        self._font_metrics_cache.clear()
+        self._truncated_text_cache.clear()
+
     def get_font_metrics(self, font_str: str, text: str) -> UserInterface.FontMetrics:
-        return typing.cast(UserInterface.FontMetrics, self.proxy.decode_font_metrics(self.proxy.Core_getFontMetrics(font_str, text)))
+        key = (font_str, text)
+        font_metrics = self._font_metrics_cache.get(key)
+        if font_metrics is None:
+            font_metrics = typing.cast(UserInterface.FontMetrics, self.proxy.decode_font_metrics(self.proxy.Core_getFontMetrics(font_str, text)))
+            self._font_metrics_cache.put(key, font_metrics)
+        return font_metrics
+
+    def measure_texts(self, font: str, texts: typing.Sequence[str]) -> typing.List[float]:
+        if not self.proxy.has_method("Core_measureTexts"):
+            return super().measure_texts(font, texts)
+        font_metrics_list = [self._font_metrics_cache.get((font, text)) for text in texts]
+        missing_texts = list(dict.fromkeys(text for text, font_metrics in zip(texts, font_metrics_list) if font_metrics is None))
+        if missing_texts:
+            # measure all of the missing texts with a single call to the host.
+            measured = dict[str, UserInterface.FontMetrics]()
+            for text, encoded_font_metrics in zip(missing_texts, self.proxy.Core_measureTexts(font, missing_texts)):
+                measured[text] = typing.cast(UserInterface.FontMetrics, self.proxy.decode_font_metrics(encoded_font_metrics))
+                self._font_metrics_cache.put((font, text), measured[text])
+            font_metrics_list = [font_metrics or measured[text] for text, font_metrics in zip(texts, font_metrics_list)]
+        return [typing.cast(UserInterface.FontMetrics, font_metrics).width for font_metrics in font_metrics_list]
 
     def truncate_string_to_width(self, font_str: str, text: str, pixel_width: int, mode: UserInterface.TruncateModeType) -> str:
         if self.proxy.has_method("Core_truncateToWidth"):
-            return typing.cast(str, self.proxy.Core_truncateToWidth(font_str, text, pixel_width, int(mode)))
+            key = (font_str, text, pixel_width, int(mode))
+            truncated_text = self._truncated_text_cache.get(key)
+            if truncated_text is None:
+                truncated_text = typing.cast(str, self.proxy.Core_truncateToWidth(font_str, text, pixel_width, int(mode)))
+                self._truncated_text_cache.put(key, truncated_text)
+            return truncated_text
         return text
 
+    def truncate_strings_to_width(self, font_str: str, texts: typing.Sequence[str], pixel_width: int, mode: UserInterface.TruncateModeType) -> typing.List[str]:
+        if not self.proxy.has_method("Core_truncateTextsToWidth"):
+            return super().truncate_strings_to_width(font_str, texts, pixel_width, mode)
+        truncated_texts = [self._truncated_text_cache.get((font_str, text, pixel_width, int(mode))) for text in texts]
+        missing_texts = list(dict.fromkeys(text for text, truncated_text in zip(texts, truncated_texts) if truncated_text is None))
+        if missing_texts:
+            # truncate all of the missing texts with a single call to the host.
+            truncated = dict(zip(missing_texts, self.proxy.Core_truncateTextsToWidth(font_str, missing_texts, pixel_width, int(mode))))
+            for text in missing_texts:
+                self._truncated_text_cache.put((font_str, text, pixel_width, int(mode)), truncated[text])
+            truncated_texts = [truncated_text if truncated_text is not None else truncated[text] for text, truncated_text in zip(texts, truncated_texts)]
+        return [typing.cast(str, truncated_text) for truncated_text in truncated_texts]
+
     def get_qt_version(self) -> str:
         return typing.cast(str, self.proxy.Core_getQtVersion())
 
@@ -0,0 +1,251 @@
+"""Word wrapping of text into lines, cached for repeated layout and painting.
+"""
+
+from __future__ import annotations
+
+# standard libraries
+import bisect
+import dataclasses
+import math
+import re
+import threading
+import typing
+
+# third party libraries
+# none
+
+# local libraries
+from nion.ui import CanvasItem
+from nion.ui import DrawingContext
+from nion.ui import UserInterface
+from nion.utils import Geometry
+
+_WORD_PATTERN = re.compile(r"\S+")
+_WORD_WIDTH_CACHE_SIZE = 4096
+
+
+@dataclasses.dataclass(frozen=True)
+class LineBox:
+    """A line of wrapped text.
+
+    start and end index the line text within the laid out text. rect is relative to the top left of the layout and
+    baseline is the y position of the line baseline.
+    """
+    text: str
+    start: int
+    end: int
+    rect: Geometry.FloatRect
+    baseline: float
+
+
+@dataclasses.dataclass(frozen=True)
+class WrappedText:
+    """The lines of a text wrapped to a width in a font."""
+    text: str
+    font: str
+    width: typing.Optional[float]
+    lines: typing.Sequence[LineBox]
+    size: Geometry.FloatSize
+
+    def line_index_at(self, y: float) -> int:
+        """Return the index of the line at y, clamped to the first and last lines, or -1 if there are no lines."""
+        if not self.lines:
+            return -1
+        index = bisect.bisect_right([line.rect.top for line in self.lines], y) - 1
+        return max(0, min(index, len(self.lines) - 1))
+
+
+class TextLayout:
+    """Wrap text to a width, measuring words with get_font_metrics_fn.
+
+    The most recent layout is kept and returned again until the text, font, or width changes, so a canvas item can lay
+    out and paint repeatedly without measuring. Word widths are kept for the current font so that wrapping the same text
+    to a new width (for instance, while resizing) only measures each resulting line.
+
+    Lines break at whitespace; a word wider than the width is placed on its own line. Newlines start a new line. A
+    width of None disables wrapping.
+
+    Layouts may be requested from any thread.
+    """
+
+    def __init__(self, get_font_metrics_fn: UserInterface.MeasureTextFn) -> None:
+        self.__get_font_metrics_fn = get_font_metrics_fn
+        self.__lock = threading.RLock()
+        self.__wrapped_text: typing.Optional[WrappedText] = None
+        self.__word_widths_font: typing.Optional[str] = None
+        self.__word_widths = dict[str, float]()
+        self._wrap_count = 0  # stats for testing
+
+    def layout(self, text: str, font: str, width: typing.Optional[float]) -> WrappedText:
+        """Return the text wrapped to width in font, reusing the previous layout if the inputs are unchanged."""
+        with self.__lock:
+            wrapped_text = self.__wrapped_text
+            if wrapped_text and wrapped_text.text == text and wrapped_text.font == font and wrapped_text.width == width:
+                return wrapped_text
+            wrapped_text = self.__wrap(text, font, width)
+            self.__wrapped_text = wrapped_text
+            return wrapped_text
+
+    def character_index_at(self, wrapped_text: WrappedText, point: Geometry.FloatPoint) -> int:
+        """Return the index into the wrapped text of the character boundary nearest to point."""
+        line_index = wrapped_text.line_index_at(point.y)
+        if line_index < 0:
+            return 0
+        line = wrapped_text.lines[line_index]
+        x = point.x - line.rect.left
+        # find the shortest prefix at least as wide as x, then pick the nearer of it and the next shorter prefix.
+        low, high = 0, len(line.text)
+        while low < high:
+            middle = (low + high) // 2
+            if self.__get_font_metrics_fn(wrapped_text.font, line.text[:middle]).width < x:
+                low = middle + 1
+            else:
+                high = middle
+        if low > 0:
+            before_width = self.__get_font_metrics_fn(wrapped_text.font, line.text[:low - 1]).width
+            after_width = self.__get_font_metrics_fn(wrapped_text.font, line.text[:low]).width
+            if x - before_width < after_width - x:
+                low -= 1
+        return line.start + low
+
+    def __get_word_width(self, font: str, word: str) -> float:
+        if self.__word_widths_font != font or len(self.__word_widths) > _WORD_WIDTH_CACHE_SIZE:
+            self.__word_widths_font = font
+            self.__word_widths = dict()
+        word_width = self.__word_widths.get(word)
+        if word_width is None:
+            word_width = self.__get_font_metrics_fn(font, word).width
+            self.__word_widths[word] = word_width
+        return word_width
+
+    def __wrap(self, text: str, font: str, width: typing.Optional[float]) -> WrappedText:
+        self._wrap_count += 1
+        font_metrics = self.__get_font_metrics_fn(font, str())
+        line_height = font_metrics.height + font_metrics.leading
+        space_width = self.__get_word_width(font, " ")
+        # find the line breaks as (start, end) ranges of text.
+        line_ranges = list[typing.Tuple[int, int]]()
+        paragraph_start = 0
+        for paragraph in text.split("\n"):
+            line_start = line_end = -1
+            line_width = 0.0
+            for match in _WORD_PATTERN.finditer(paragraph):
+                word_width = self.__get_word_width(font, match.group())
+                if line_start >= 0:
+                    extended_width = line_width + space_width * (match.start() - line_end) + word_width
+                    if width is None or extended_width <= width:
+                        line_end = match.end()
+                        line_width = extended_width
+                        continue
+                    line_ranges.append((paragraph_start + line_start, paragraph_start + line_end))
+                line_start, line_end = match.span()
+                line_width = word_width
+            if line_start >= 0:
+                line_ranges.append((paragraph_start + line_start, paragraph_start + line_end))
+            else:
+                line_ranges.append((paragraph_start, paragraph_start))
+            paragraph_start += len(paragraph) + 1
+        # measure each line once to size the line boxes.
+        lines = list[LineBox]()
+        for index, (start, end) in enumerate(line_ranges):
+            line_text = text[start:end]
+            line_width = self.__get_font_metrics_fn(font, line_text).width if line_text else 0.0
+            top = index * line_height
+            lines.append(LineBox(line_text, start, end, Geometry.FloatRect.from_tlhw(top, 0, line_height, line_width), top + font_metrics.ascent))
+        size = Geometry.FloatSize(height=len(lines) * line_height, width=max((line.rect.width for line in lines), default=0.0))
+        return WrappedText(text, font, width, lines, size)
+
+
+class WrappedTextCanvasItemComposer(CanvasItem.BaseComposer):
+    def __init__(self, canvas_item: CanvasItem.AbstractCanvasItem, layout_sizing: CanvasItem.Sizing, cache: CanvasItem.ComposerCache,
+                 text_layout: TextLayout, text: str, text_font: str, text_color: str) -> None:
+        super().__init__(canvas_item, layout_sizing, cache)
+        self.__text_layout = text_layout
+        self.__text = text
+        self.__text_font = text_font
+        self.__text_color = text_color
+
+    def _repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_rect: Geometry.IntRect, composer_cache: CanvasItem.ComposerCache) -> None:
+        wrapped_text = self.__text_layout.layout(self.__text, self.__text_font, canvas_rect.width)
+        with drawing_context.saver():
+            drawing_context.font = self.__text_font
+            drawing_context.text_baseline = "alphabetic"
+            drawing_context.text_align = "left"
+            drawing_context.fill_style = self.__text_color
+            for line in wrapped_text.lines:
+                if line.text:
+                    drawing_context.fill_text(line.text, canvas_rect.left + line.rect.left, canvas_rect.top + line.baseline)
+
+
+class WrappedTextCanvasItem(CanvasItem.AbstractCanvasItem):
+    """A canvas item drawing text wrapped to its width.
+
+    Call size_to_width to make the height fit the wrapped text; painting at the same width reuses that layout. The
+    height is fitted again at that width when the text or font changes.
+    """
+
+    def __init__(self, get_font_metrics_fn: UserInterface.MeasureTextFn, text: typing.Optional[str] = None, *,
+                 text_font: typing.Optional[str] = None, text_color: typing.Optional[str] = None) -> None:
+        super().__init__()
+        self.__text_layout = TextLayout(get_font_metrics_fn)
+        self.__text = text or str()
+        self.__text_font = text_font or "12px"
+        self.__text_color = text_color or "black"
+        self.__sized_width: typing.Optional[int] = None
+
+    @property
+    def text_layout(self) -> TextLayout:
+        return self.__text_layout
+
+    @property
+    def text(self) -> str:
+        return self.__text
+
+    @text.setter
+    def text(self, value: typing.Optional[str]) -> None:
+        value = value or str()
+        if self.__text != value:
+            self.__text = value
+            self.__update_size()
+
+    @property
+    def text_font(self) -> str:
+        return self.__text_font
+
+    @text_font.setter
+    def text_font(self, value: typing.Optional[str]) -> None:
+        value = value or "12px"
+        if self.__text_font != value:
+            self.__text_font = value
+            self.__update_size()
+
+    @property
+    def text_color(self) -> str:
+        return self.__text_color
+
+    @text_color.setter
+    def text_color(self, value: typing.Optional[str]) -> None:
+        value = value or "black"
+        if self.__text_color != value:
+            self.__text_color = value
+            self.update()
+
+    @property
+    def wrapped_text(self) -> WrappedText:
+        """Return the text wrapped to the current width, for hit testing."""
+        canvas_size = self.canvas_size
+        return self.__text_layout.layout(self.__text, self.__text_font, canvas_size.width if canvas_size else None)
+
+    def size_to_width(self, width: int) -> None:
+        """Fix the height to fit the text wrapped to width, now and whenever the text or font changes."""
+        self.__sized_width = width
+        wrapped_text = self.__text_layout.layout(self.__text, self.__text_font, width)
+        self.update_sizing(self.sizing.with_fixed_height(math.ceil(wrapped_text.size.height)))
+
+    def __update_size(self) -> None:
+        if self.__sized_width is not None:
+            self.size_to_width(self.__sized_width)
+        self.update()
+
+    def _get_composer(self, composer_cache: CanvasItem.ComposerCache) -> typing.Optional[CanvasItem.BaseComposer]:
+        return WrappedTextCanvasItemComposer(self, self.layout_sizing, composer_cache, self.__text_layout, self.__text, self.__text_font, self.__text_color)
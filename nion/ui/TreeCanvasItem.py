@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 # standard libraries
-import copy
 import dataclasses
 import functools
 import json
@@ -17,10 +16,14 @@ import typing
 # local libraries
 from nion.ui import CanvasItem
 from nion.ui import UserInterface
+from nion.utils import Event
 from nion.utils import Geometry
 
 _ValuePath = typing.Sequence[typing.Union[int, str]]
 
+_INDENT_SIZE = 16
+_ITEM_HEIGHT = 18
+
 
 @dataclasses.dataclass
 class TreeItem:
@@ -38,6 +41,84 @@ class TreeCanvasItemDelegate(typing.Protocol):
     def toggle_is_expanded(self, value_path_key: str) -> None: ...
 
 
+class _TreeRowLayout(CanvasItem.CanvasItemAbstractLayout):
+    """Lay out fixed height rows in a column.
+
+    The first canvas item is placed at first_row and the sizing covers row_count rows (or the number of canvas items
+    if row_count is None), which allows only a window of the rows to be present.
+    """
+
+    def __init__(self, item_height: int, first_row: int = 0, row_count: typing.Optional[int] = None) -> None:
+        super().__init__()
+        self.item_height = item_height
+        self.first_row = first_row
+        self.row_count = row_count
+
+    def copy(self) -> CanvasItem.CanvasItemAbstractLayout:
+        return _TreeRowLayout(self.item_height, self.first_row, self.row_count)
+
+    def layout(self, canvas_origin: Geometry.IntPoint, canvas_size: Geometry.IntSize, canvas_items: typing.Sequence[CanvasItem.LayoutItem]) -> None:
+        item_size = Geometry.IntSize(height=self.item_height, width=canvas_size.width)
+        for index, canvas_item in enumerate(canvas_items):
+            item_origin = Geometry.IntPoint(y=canvas_origin.y + (self.first_row + index) * self.item_height, x=canvas_origin.x)
+            self.update_canvas_item_layout(item_origin, item_size, canvas_item)
+
+    def get_sizing(self, canvas_items: typing.Sequence[CanvasItem.LayoutSizingItem]) -> CanvasItem.Sizing:
+        row_count = self.row_count if self.row_count is not None else len(canvas_items)
+        return CanvasItem.Sizing(self._get_column_sizing(canvas_items).sizing_data).with_fixed_height(self.item_height * row_count)
+
+    def create_spacing_item(self, spacing: int) -> CanvasItem.AbstractCanvasItem:
+        raise NotImplementedError()
+
+    def create_stretch_item(self) -> CanvasItem.AbstractCanvasItem:
+        raise NotImplementedError()
+
+
+class _TreeRowCanvasItem(CanvasItem.CanvasItemComposition):
+    """A row of the tree: indent, twist down (for parents), and the tree item canvas item.
+
+    The tree item canvas item is owned by the tree; it is detached rather than closed when the row is removed.
+    """
+
+    def __init__(self, tree_item: TreeItem, value_path_key: str, on_toggle: typing.Callable[[_ValuePath], None]) -> None:
+        super().__init__()
+        self.value_path = tree_item.value_path
+        self.value_path_key = value_path_key
+        self.item_type = tree_item.item_type
+        self.update_sizing(self.sizing.with_fixed_height(_ITEM_HEIGHT))
+        self.layout = CanvasItem.CanvasItemRowLayout()
+        self.add_spacing((len(tree_item.value_path) - 1) * _INDENT_SIZE)
+        self.__twist_down_canvas_item: typing.Optional[CanvasItem.TwistDownCanvasItem] = None
+        if tree_item.item_type == "parent":
+            twist_down_canvas_item = CanvasItem.TwistDownCanvasItem()
+            twist_down_canvas_item.update_sizing(twist_down_canvas_item.sizing.with_fixed_size(Geometry.IntSize(height=_ITEM_HEIGHT, width=_INDENT_SIZE)))
+            twist_down_canvas_item.checked = tree_item.is_expanded
+            twist_down_canvas_item.on_clicked = functools.partial(on_toggle, tree_item.value_path)
+            self.add_canvas_item(twist_down_canvas_item)
+            self.__twist_down_canvas_item = twist_down_canvas_item
+        else:
+            self.add_spacing(_INDENT_SIZE)
+        self.__content_canvas_item = tree_item.canvas_item
+        self.add_canvas_item(tree_item.canvas_item)
+        self.add_stretch()
+
+    def detach_content(self) -> None:
+        self.detach_canvas_item(self.__content_canvas_item)
+
+    def patch(self, tree_item: TreeItem) -> bool:
+        """Update the row in place to show the tree item. Return False if the row must be rebuilt instead."""
+        if tree_item.item_type != self.item_type:
+            return False
+        if self.__twist_down_canvas_item and self.__twist_down_canvas_item.checked != tree_item.is_expanded:
+            self.__twist_down_canvas_item.checked = tree_item.is_expanded
+        if tree_item.canvas_item is not self.__content_canvas_item:
+            index = self.canvas_items.index(self.__content_canvas_item)
+            self.detach_canvas_item(self.__content_canvas_item)
+            self.insert_canvas_item(index, tree_item.canvas_item)
+            self.__content_canvas_item = tree_item.canvas_item
+        return True
+
+
 class TreeCanvasItem(CanvasItem.CanvasItemComposition):
     """
     Takes a delegate that supports the following properties, methods, and optional methods:
@@ -52,10 +133,15 @@ class TreeCanvasItem(CanvasItem.CanvasItemComposition):
     Optional methods:
         None
 
-    Call reconstruct when data or selection changes.
+    Call reconstruct when data or selection changes. Rows are matched to tree items by value path; existing rows are
+    patched in place and only the rows that appear or disappear are inserted or removed.
+
+    Pass virtualize_rows to only keep rows near the visible part of the enclosing scroll area (plus overscan rows above
+    and below) as canvas items. The other rows are only accounted for in the fixed row height layout.
     """
 
-    def __init__(self, get_font_metrics_fn: typing.Callable[[str, str], UserInterface.FontMetrics], delegate: TreeCanvasItemDelegate) -> None:
+    def __init__(self, get_font_metrics_fn: typing.Callable[[str, str], UserInterface.FontMetrics], delegate: TreeCanvasItemDelegate, *,
+                 virtualize_rows: bool = False, overscan: int = 8) -> None:
         super().__init__()
         self.__get_font_metrics_fn = get_font_metrics_fn
         self.__delegate = delegate
@@ -69,51 +155,137 @@ class TreeCanvasItem(CanvasItem.CanvasItemComposition):
         self.__mouse_dragging = False
         self.__mouse_item: typing.Optional[_ValuePath] = None
         self.__selected_value_paths: typing.Set[str] = set()
-        self.layout = CanvasItem.CanvasItemColumnLayout()
+        self.__tree_items: typing.Sequence[TreeItem] = list()
+        self.__value_path_keys: typing.Sequence[str] = list()
+        self.__virtualize_rows = virtualize_rows
+        self.__overscan = overscan
+        self.__row_layout = _TreeRowLayout(_ITEM_HEIGHT, 0, 0 if virtualize_rows else None)
+        self.__scroll_area_canvas_item: typing.Optional[CanvasItem.ScrollAreaCanvasItem] = None
+        self.__scroll_area_content_updated_listener: typing.Optional[Event.EventListener] = None
+        self.layout = self.__row_layout
         self.on_content_height_changed: typing.Optional[typing.Callable[[int], None]] = None
         self.on_reconstruct: typing.Optional[typing.Callable[[], None]] = None
+        # stats for testing
+        self._row_create_count = 0
 
     def close(self) -> None:
+        self.__scroll_area_content_updated_listener = None
         self.on_content_height_changed = None
+        # close the tree item canvas items that are not in a row; the rows close the others.
+        for tree_item in self.__tree_items:
+            if tree_item.canvas_item.container is None:
+                tree_item.canvas_item.close()
+        self.__tree_items = list()
         super().close()
 
+    def _inserted(self, container: typing.Optional[CanvasItem.AbstractCanvasItem]) -> None:
+        super()._inserted(container)
+        if self.__virtualize_rows:
+            # track the visible rows of the nearest enclosing scroll area.
+            scroll_area_canvas_item = container
+            while scroll_area_canvas_item and not isinstance(scroll_area_canvas_item, CanvasItem.ScrollAreaCanvasItem):
+                scroll_area_canvas_item = scroll_area_canvas_item.container
+            if isinstance(scroll_area_canvas_item, CanvasItem.ScrollAreaCanvasItem):
+                self.__scroll_area_canvas_item = scroll_area_canvas_item
+                self.__scroll_area_content_updated_listener = scroll_area_canvas_item.content_updated_event.listen(self.__update_visible_rows)
+                self.__update_visible_rows()
+
+    def _removed(self, container: typing.Optional[CanvasItem.AbstractCanvasItem]) -> None:
+        self.__scroll_area_canvas_item = None
+        self.__scroll_area_content_updated_listener = None
+        super()._removed(container)
+
+    @property
+    def row_range(self) -> range:
+        """Return the range of rows currently present as canvas items."""
+        return range(self.__row_layout.first_row, self.__row_layout.first_row + self.canvas_items_count)
+
     def __is_selected(self, value_path: _ValuePath) -> bool:
         return json.dumps(value_path) in self.__selected_value_paths
 
     def reconstruct(self) -> None:
-        for canvas_item in copy.copy(self.canvas_items):
-            self._remove_canvas_item(canvas_item)
-        indent_size = 16
         canvas_bounds = self.canvas_bounds
         item_width = int(canvas_bounds.width) if canvas_bounds else None
-        canvas_height = 0
-        ITEM_HEIGHT = 18
-        for tree_item in self.__delegate.build_items(self.__get_font_metrics_fn, item_width):
-            indent = (len(tree_item.value_path) - 1) * indent_size
-            item_row = CanvasItem.CanvasItemComposition()
-            item_row.update_sizing(item_row.sizing.with_fixed_height(ITEM_HEIGHT))
-            item_row.layout = CanvasItem.CanvasItemRowLayout()
-            item_row.add_spacing(indent)
-            if tree_item.item_type == "parent":
-                twist_down_canvas_item = CanvasItem.TwistDownCanvasItem()
-                twist_down_canvas_item.update_sizing(twist_down_canvas_item.sizing.with_fixed_size(Geometry.IntSize(height=ITEM_HEIGHT, width=16)))
-                twist_down_canvas_item.checked = tree_item.is_expanded
-
-                def twist_down_clicked(toggle_value_path: _ValuePath) -> None:
-                    self.__toggle_is_expanded(toggle_value_path)
-
-                twist_down_canvas_item.on_clicked = functools.partial(twist_down_clicked, tree_item.value_path)
-                item_row.add_canvas_item(twist_down_canvas_item)
-            else:
-                item_row.add_spacing(indent_size)
-            item_row.add_canvas_item(tree_item.canvas_item)
-            item_row.add_stretch()
-            setattr(item_row, "value_path", tree_item.value_path)
-            self.add_canvas_item(item_row)
-            canvas_height += ITEM_HEIGHT
+        old_tree_items = self.__tree_items
+        self.__tree_items = list(self.__delegate.build_items(self.__get_font_metrics_fn, item_width))
+        self.__value_path_keys = [json.dumps(tree_item.value_path) for tree_item in self.__tree_items]
+        if self.__virtualize_rows:
+            self.__row_layout.row_count = len(self.__tree_items)
+            self.__update_visible_rows(True)
+        else:
+            self.__update_rows(self.__tree_items, self.__value_path_keys)
+        # close the previous tree item canvas items that are no longer used.
+        tree_item_canvas_item_ids = {id(tree_item.canvas_item) for tree_item in self.__tree_items}
+        for tree_item in old_tree_items:
+            if id(tree_item.canvas_item) not in tree_item_canvas_item_ids and tree_item.canvas_item.container is None:
+                tree_item.canvas_item.close()
         self.update()
         if callable(self.on_content_height_changed):
-            self.on_content_height_changed(canvas_height)
+            self.on_content_height_changed(len(self.__tree_items) * _ITEM_HEIGHT)
+
+    def __visible_row_range(self) -> typing.Tuple[int, int]:
+        row_count = len(self.__tree_items)
+        scroll_area_canvas_item = self.__scroll_area_canvas_item
+        if not scroll_area_canvas_item:
+            return 0, row_count
+        scroll_area_canvas_size = scroll_area_canvas_item.canvas_size
+        if not scroll_area_canvas_size:
+            return 0, 0
+        # find the top of this item within the scroll area content, then the rows within the scroll area viewport.
+        top = 0
+        canvas_item: typing.Optional[CanvasItem.AbstractCanvasItem] = self
+        while canvas_item and canvas_item.container is not scroll_area_canvas_item:
+            top += canvas_item.canvas_origin.y if canvas_item.canvas_origin else 0
+            canvas_item = canvas_item.container
+        visible_top = -scroll_area_canvas_item.content_origin.y - top
+        visible_bottom = visible_top + scroll_area_canvas_size.height
+        first_row = max(0, visible_top // _ITEM_HEIGHT - self.__overscan)
+        last_row = min(row_count, -(-visible_bottom // _ITEM_HEIGHT) + self.__overscan)
+        return first_row, max(first_row, last_row)
+
+    def __update_visible_rows(self, force: bool = False) -> None:
+        first_row, last_row = self.__visible_row_range()
+        if force or (first_row, last_row) != (self.row_range.start, self.row_range.stop):
+            self.__row_layout.first_row = first_row
+            self.__update_rows(self.__tree_items[first_row:last_row], self.__value_path_keys[first_row:last_row])
+            self.update()
+
+    def __update_rows(self, tree_items: typing.Sequence[TreeItem], value_path_keys: typing.Sequence[str]) -> None:
+        # bring the rows in line with the tree items. rows for value paths that are still present are patched in
+        # place if they are still in order; rows are only inserted or removed where the tree changed.
+        rows = typing.cast(typing.List[_TreeRowCanvasItem], list(self.canvas_items))
+        row_indexes = {value_path_key: index for index, value_path_key in enumerate(value_path_keys)}
+        if len(row_indexes) != len(value_path_keys):
+            row_indexes.clear()  # duplicate value paths; rebuild all rows
+        kept_rows = list[_TreeRowCanvasItem]()
+        for row in rows:
+            if row.value_path_key in row_indexes:
+                kept_rows.append(row)
+            else:
+                self.__remove_row(row)
+        kept_row_indexes = [row_indexes[row.value_path_key] for row in kept_rows]
+        if kept_row_indexes != sorted(kept_row_indexes):
+            for row in kept_rows:
+                self.__remove_row(row)
+            kept_rows.clear()
+        kept_rows_iter = iter(kept_rows)
+        next_row = next(kept_rows_iter, None)
+        for index, (tree_item, value_path_key) in enumerate(zip(tree_items, value_path_keys)):
+            if next_row and next_row.value_path_key == value_path_key:
+                if not next_row.patch(tree_item):
+                    self.__remove_row(next_row)
+                    self.__insert_row(index, tree_item, value_path_key)
+                next_row = next(kept_rows_iter, None)
+            else:
+                self.__insert_row(index, tree_item, value_path_key)
+
+    def __insert_row(self, index: int, tree_item: TreeItem, value_path_key: str) -> None:
+        self.insert_canvas_item(index, _TreeRowCanvasItem(tree_item, value_path_key, self.__toggle_is_expanded))
+        self._row_create_count += 1
+
+    def __remove_row(self, row: _TreeRowCanvasItem) -> None:
+        row.detach_content()
+        self.remove_canvas_item(row)
 
     def __set_selection(self, value_path: _ValuePath) -> None:
         self.__selected_value_paths.clear()
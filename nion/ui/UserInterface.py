@@ -609,6 +609,7 @@ class Widget:
 
         def set_visible(value: bool) -> None:
             self._behavior.visible = value
+            self._visible_changed(value)
 
         def set_enabled(value: bool) -> None:
             self._behavior.enabled = value
@@ -717,6 +718,10 @@ class Widget:
             contained_widget.redraw()
         self._redraw()
 
+    def _visible_changed(self, visible: bool) -> None:
+        # called when the visible property changes. subclasses may override.
+        pass
+
     def _redraw(self) -> None:
         # redraw this particular widget. default is to do nothing since the normal container based widgets will
         # redraw themselves automatically. this will typically be implemented by custom widgets like canvas.
@@ -2638,6 +2643,8 @@ class CanvasWidgetBehavior(WidgetBehavior, typing.Protocol):
 class CanvasWidget(Widget):
 
     def __init__(self, widget_behavior: CanvasWidgetBehavior, *, layout_render: typing.Optional[str] = None) -> None:
+        # visible may be set during widget initialization, so define its callback first.
+        self.on_visible_changed: typing.Optional[typing.Callable[[bool], None]] = None
         super().__init__(widget_behavior)
         self.on_periodic: typing.Optional[typing.Callable[[], None]] = None
         self.on_dispatch_any: typing.Optional[typing.Callable[..., typing.Any]] = None
@@ -2817,6 +2824,7 @@ class CanvasWidget(Widget):
         self.on_drop = None
         self.on_tool_tip = None
         self.on_pan_gesture = None
+        self.on_visible_changed = None
         super().close()
 
     @property
@@ -2833,6 +2841,10 @@ class CanvasWidget(Widget):
                 self.on_mouse_position_changed(*self.position_info)
             self.position_info = None
 
+    def _visible_changed(self, visible: bool) -> None:
+        if callable(self.on_visible_changed):
+            self.on_visible_changed(visible)
+
     def _redraw(self) -> None:
         self.__canvas_item.redraw()
 
@@ -3472,6 +3484,7 @@ class Window:
         self.on_key_pressed: typing.Optional[typing.Callable[[Key], bool]] = None
         self.on_key_released: typing.Optional[typing.Callable[[Key], bool]] = None
         self.on_activation_changed: typing.Optional[typing.Callable[[bool], None]] = None
+        self.is_active = True
         self.on_size_changed: typing.Optional[typing.Callable[[int, int], None]] = None
         self.on_position_changed: typing.Optional[typing.Callable[[int, int], None]] = None
         self.on_refocus_widget: typing.Optional[typing.Callable[[Widget], None]] = None
@@ -3699,6 +3712,7 @@ class Window:
             self.on_about_to_show()
 
     def _handle_activation_changed(self, activated: bool) -> None:
+        self.is_active = activated
         if self.on_activation_changed:
             self.on_activation_changed(activated)
 
@@ -4117,10 +4131,24 @@ class UserInterface(abc.ABC):
     def get_font_metrics(self, font: str, text: str) -> FontMetrics:
         ...
 
+    def measure_texts(self, font: str, texts: typing.Sequence[str]) -> typing.List[float]:
+        """Return the width of each text in the font.
+
+        Subclasses may override this to measure the texts in a single call to the host.
+        """
+        return [self.get_font_metrics(font, text).width for text in texts]
+
     @abc.abstractmethod
     def truncate_string_to_width(self, font_str: str, text: str, pixel_width: int, mode: TruncateModeType) -> str:
         ...
 
+    def truncate_strings_to_width(self, font_str: str, texts: typing.Sequence[str], pixel_width: int, mode: TruncateModeType) -> typing.List[str]:
+        """Return each text truncated to the pixel width in the font.
+
+        Subclasses may override this to truncate the texts in a single call to the host.
+        """
+        return [self.truncate_string_to_width(font_str, text, pixel_width, mode) for text in texts]
+
     @abc.abstractmethod
     def get_qt_version(self) -> str:
         ...
@@ -408,11 +408,10 @@ class BasicTabWidgetCanvasItemController(TabWidgetCanvasItemController):
                 border.border_left = CanvasItem.CellBorderProperties(Color.Color("gray"))
                 border.border_bottom = self.__header_bottom_border_properties
                 drawing_context = DrawingContext.DrawingContext()
-                gradient = drawing_context.create_linear_gradient(0, self.__button_height, 0, 0, 0, self.__button_height)
-                gradient.add_color_stop(0.0, Color.Color("gray").to_color_with_alpha(0.00).color_str)
-                gradient.add_color_stop(0.5, Color.Color("gray").to_color_with_alpha(0.33).color_str)
-                gradient.add_color_stop(1.0, Color.Color("gray").to_color_with_alpha(0.25).color_str)
-                button_canvas_item.background_color = gradient
+                color_stops = ((0.0, Color.Color("gray").to_color_with_alpha(0.00).color_str),
+                               (0.5, Color.Color("gray").to_color_with_alpha(0.33).color_str),
+                               (1.0, Color.Color("gray").to_color_with_alpha(0.25).color_str))
+                button_canvas_item.background_color = drawing_context.create_linear_gradient(0, self.__button_height, 0, 0, 0, self.__button_height, color_stops)
             if index == len(self.__button_canvas_items) - 1:
                 border.border_right = CanvasItem.CellBorderProperties(Color.Color("gray"))
             button_canvas_item.border = border
@@ -894,13 +893,53 @@ class StringListWidget(ListWidget):
                          v_scroll_enabled=v_scroll_enabled, v_auto_resize=v_auto_resize)
 
 
+TableRowRebinder = typing.Callable[[UserInterface.BoxWidget, typing.Any], bool]
+
+
+class _TableListItems(typing.Sequence[UserInterface.Widget]):
+    """A sequence of the row widgets of a table, indexed by model index."""
+
+    def __init__(self, count_fn: typing.Callable[[], int], get_fn: typing.Callable[[int], UserInterface.Widget]) -> None:
+        self.__count_fn = count_fn
+        self.__get_fn = get_fn
+
+    def __len__(self) -> int:
+        return self.__count_fn()
+
+    @typing.overload
+    def __getitem__(self, index: int) -> UserInterface.Widget: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> typing.Sequence[UserInterface.Widget]: ...
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[UserInterface.Widget, typing.Sequence[UserInterface.Widget]]:
+        if isinstance(index, slice):
+            return [self.__get_fn(i) for i in range(len(self))[index]]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("list item index out of range")
+        return self.__get_fn(index)
+
+
 class TableWidget(UserInterface.Widget):
-    """A widget representing a table (column only)."""
+    """A widget representing a table (column only).
+
+    If row_height is specified, the table is virtualized: the rows are placed in a scroll area and row widgets are only
+    created for the rows within the viewport plus the overscan rows above and below. All rows must have the row height.
+    In this case, list_items is still indexed by model index; accessing a row outside of list_item_range creates its row
+    widget, which is kept until it scrolls into view or its item is removed. The rebind_list_item_widget function, if
+    provided, is used to rebind an existing row widget to a different item when jumping to a new scroll position; it
+    returns False if the row widget cannot be rebound, in which case a new row widget is created.
+    """
 
     def __init__(self, ui: UserInterface.UserInterface,
                  create_list_item_widget: typing.Callable[[typing.Any], UserInterface.BoxWidget],
                  header_widget: typing.Optional[UserInterface.Widget] = None,
-                 header_for_empty_list_widget: typing.Optional[UserInterface.Widget] = None) -> None:
+                 header_for_empty_list_widget: typing.Optional[UserInterface.Widget] = None,
+                 *, row_height: typing.Optional[int] = None, overscan: int = 4,
+                 rebind_list_item_widget: typing.Optional[TableRowRebinder] = None) -> None:
         column_widget = ui.create_column_widget()
         super().__init__(CompositeWidgetBehavior(column_widget))
         self.__binding: typing.Optional[Binding.Binding] = None
@@ -915,32 +954,90 @@ class TableWidget(UserInterface.Widget):
             header_column.add(self.header_for_empty_list_widget)
         column_widget.add(header_column)
         content_column = ui.create_column_widget()
-        content_column.add(self.content_section)
-        content_column.add_stretch()
-        column_widget.add(content_column)
-        column_widget.add_stretch()
+        self.__row_height = row_height
+        self.__overscan = overscan
+        self.__rebind_list_item_widget = rebind_list_item_widget
+        self.__items = list[typing.Any]()  # all items when virtualized
+        self.__first_row = 0  # model index of the first row widget when virtualized
+        self.__detached_rows = dict[int, UserInterface.BoxWidget]()  # rows accessed outside of the rows in view
+        self.__viewport = Geometry.IntRect.empty_rect()
+        self.__top_spacer: typing.Optional[UserInterface.BoxWidget] = None
+        self.__bottom_spacer: typing.Optional[UserInterface.BoxWidget] = None
+        self.__scroll_area_widget: typing.Optional[UserInterface.ScrollAreaWidget] = None
+        if row_height:
+            self.__top_spacer = ui.create_column_widget(properties={"height": 0})
+            self.__bottom_spacer = ui.create_column_widget(properties={"height": 0})
+            content_column.add(self.__top_spacer)
+            content_column.add(self.content_section)
+            content_column.add(self.__bottom_spacer)
+            content_column.add_stretch()
+            self.__scroll_area_widget = ui.create_scroll_area_widget()
+            self.__scroll_area_widget.content = content_column
+            self.__scroll_area_widget.on_viewport_changed = self.__viewport_changed
+            column_widget.add(self.__scroll_area_widget)
+        else:
+            content_column.add(self.content_section)
+            content_column.add_stretch()
+            column_widget.add(content_column)
+            column_widget.add_stretch()
         self.create_list_item_widget = create_list_item_widget
+        # stats for testing
+        self._create_row_count = 0
+        self._rebind_row_count = 0
 
     def close(self) -> None:
         if self.__binding:
             self.__binding.close()
             self.__binding = None
+        if self.__scroll_area_widget:
+            self.__scroll_area_widget.on_viewport_changed = None
         self.clear_queued_tasks()
         self.content_section = typing.cast(typing.Any, None)
         self.header_widget = None
         self.header_for_empty_list_widget = None
         self.create_list_item_widget = typing.cast(typing.Any, None)
+        self.__items = list()
+        self.__close_detached_rows()
         super().close()
 
     @property
     def list_items(self) -> typing.Sequence[UserInterface.Widget]:
+        """Return the row widgets, indexed by model index."""
+        if self.__row_height:
+            return _TableListItems(lambda: self.list_item_count, self.__get_list_item)
         return self.content_section.children
 
     @property
     def list_item_count(self) -> int:
-        return self.content_section.child_count
+        return len(self.__items) if self.__row_height else self.content_section.child_count
+
+    @property
+    def list_item_range(self) -> range:
+        """Return the range of model indexes of the row widgets in view."""
+        return range(self.__first_row, self.__first_row + self.content_section.child_count)
+
+    @property
+    def _scroll_area_widget(self) -> typing.Optional[UserInterface.ScrollAreaWidget]:
+        # for testing
+        return self.__scroll_area_widget
 
     def insert_item(self, item: typing.Any, before_index: int) -> None:
+        if self.__row_height:
+            if self.content_section:
+                self.__items.insert(before_index, item)
+                self.__shift_detached_rows(before_index, 1)
+                first_row = self.__first_row
+                row_count = self.content_section.child_count
+                if before_index < first_row or (before_index == first_row and row_count > 0):
+                    # the existing row widgets move down by one item.
+                    self.__first_row = first_row + 1
+                elif before_index < first_row + row_count:
+                    row_widget = self.__create_row_widget(item)
+                    if row_widget:
+                        self.content_section.insert(row_widget, before_index - first_row)
+                self.__update_rows()
+                self.__sync_header()
+            return
         if callable(self.create_list_item_widget):  # item may be closed while this call is pending on main thread.
             item_row = self.create_list_item_widget(item)
             if self.content_section:
@@ -951,16 +1048,120 @@ class TableWidget(UserInterface.Widget):
 
     def remove_item(self, index: int) -> None:
         if self.content_section:
-            self.content_section.remove(index)
+            if self.__row_height:
+                self.__items.pop(index)
+                self.__close_detached_rows(range(index, index + 1))
+                self.__shift_detached_rows(index, -1)
+                first_row = self.__first_row
+                if index < first_row:
+                    self.__first_row = first_row - 1
+                elif index < first_row + self.content_section.child_count:
+                    self.content_section.remove(index - first_row)
+                self.__update_rows()
+            else:
+                self.content_section.remove(index)
             self.__sync_header()
 
     def remove_all_items(self) -> None:
+        self.__items.clear()
+        self.__close_detached_rows()
+        self.__first_row = 0
         self.content_section.remove_all()
+        self.__update_rows()
         self.__sync_header()
 
+    def __create_row_widget(self, item: typing.Any) -> typing.Optional[UserInterface.BoxWidget]:
+        if callable(self.create_list_item_widget):  # item may be closed while this call is pending on main thread.
+            self._create_row_count += 1
+            return self.create_list_item_widget(item)
+        return None
+
+    def __get_list_item(self, index: int) -> UserInterface.Widget:
+        first_row = self.__first_row
+        if first_row <= index < first_row + self.content_section.child_count:
+            return self.content_section.children[index - first_row]
+        row_widget = self.__detached_rows.get(index)
+        if not row_widget:
+            row_widget = self.__create_row_widget(self.__items[index])
+            if not row_widget:
+                raise IndexError("list item is closed")
+            self.__detached_rows[index] = row_widget
+        return row_widget
+
+    def __shift_detached_rows(self, index: int, delta: int) -> None:
+        # keep the detached rows at the model index of their items when items are inserted or removed.
+        if self.__detached_rows:
+            self.__detached_rows = {(i + delta if i >= index else i): row_widget for i, row_widget in self.__detached_rows.items()}
+
+    def __close_detached_rows(self, index_range: typing.Optional[range] = None) -> None:
+        # close the detached rows within index_range, or all of them if index_range is None.
+        for index in list(self.__detached_rows.keys()):
+            if index_range is None or index in index_range:
+                self.__detached_rows.pop(index).close()
+
+    def __viewport_changed(self, viewport: Geometry.IntRect) -> None:
+        self.__viewport = viewport
+        self.__update_rows()
+
+    def __update_rows(self) -> None:
+        # create, remove, or rebind the row widgets so that they cover the viewport plus the overscan rows.
+        row_height = self.__row_height
+        content_section = self.content_section
+        if not row_height or not content_section:
+            return
+        items = self.__items
+        viewport = self.__viewport
+        # before the viewport is known, assume a typical viewport height.
+        viewport_height = viewport.height if viewport.height > 0 else 480
+        first_row = max(0, min(len(items), viewport.top // row_height - self.__overscan))
+        last_row = max(first_row, min(len(items), (viewport.top + viewport_height + row_height - 1) // row_height + self.__overscan))
+        old_first_row = self.__first_row
+        old_last_row = old_first_row + content_section.child_count
+        if self.__rebind_list_item_widget and (last_row <= old_first_row or first_row >= old_last_row):
+            # jumping to a new position; rebind the existing row widgets in place.
+            for index, existing_row_widget in enumerate(list(content_section.children[:last_row - first_row])):
+                item = items[first_row + index]
+                self._rebind_row_count += 1
+                if not self.__rebind_list_item_widget(typing.cast(UserInterface.BoxWidget, existing_row_widget), item):
+                    content_section.remove(index)
+                    new_row_widget = self.__create_row_widget(item)
+                    if new_row_widget:
+                        content_section.insert(new_row_widget, index)
+            old_first_row = first_row
+            old_last_row = first_row + content_section.child_count
+        elif last_row <= old_first_row or first_row >= old_last_row:
+            content_section.remove_all()
+            old_first_row = old_last_row = first_row
+        # remove the row widgets outside of the new range.
+        while old_last_row > max(last_row, old_first_row):
+            content_section.remove(old_last_row - old_first_row - 1)
+            old_last_row -= 1
+        while old_first_row < min(first_row, old_last_row):
+            content_section.remove(0)
+            old_first_row += 1
+        if old_first_row == old_last_row:
+            old_first_row = old_last_row = first_row
+        # create the row widgets within the new range.
+        detached_rows = self.__detached_rows
+        for index in reversed(range(first_row, old_first_row)):
+            row_widget = detached_rows.pop(index, None) or self.__create_row_widget(items[index])
+            if row_widget:
+                content_section.insert(row_widget, 0)
+        for index in range(old_last_row, last_row):
+            row_widget = detached_rows.pop(index, None) or self.__create_row_widget(items[index])
+            if row_widget:
+                content_section.add(row_widget)
+        self.__first_row = first_row
+        # detached rows for rows that were rebound in view are no longer reachable.
+        if detached_rows:
+            self.__close_detached_rows(range(first_row, last_row))
+        if self.__top_spacer and self.__bottom_spacer:
+            self.__top_spacer.set_property("height", first_row * row_height)
+            self.__bottom_spacer.set_property("height", (len(items) - last_row) * row_height)
+
     def __sync_header(self) -> None:
         # select the right header item
-        has_content = self.content_section.child_count > 0
+        has_content = self.list_item_count > 0
         if self.header_widget:
             self.header_widget.visible = has_content
         if self.header_for_empty_list_widget:
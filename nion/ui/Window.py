@@ -548,6 +548,9 @@ class Window:
     def get_font_metrics(self, font: str, text: str) -> UserInterface.FontMetrics:
         return self.ui.get_font_metrics(font, text)
 
+    def measure_texts(self, font: str, texts: typing.Sequence[str]) -> typing.List[float]:
+        return self.ui.measure_texts(font, texts)
+
     @property
     def focus_widget(self) -> typing.Optional[UserInterface.Widget]:
         focus_widget = self.__document_window.focus_widget
@@ -0,0 +1,47 @@
+# standard libraries
+import io
+import logging
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.ui import Application
+
+
+def _make_record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+
+class TestApplicationClass(unittest.TestCase):
+
+    def setUp(self) -> None:
+        pass
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_logging_handler_keeps_bounded_records_in_order(self) -> None:
+        handler = Application.LoggingHandler(capacity=100, level_capacities={logging.DEBUG: 10})
+        handler.setStream(io.StringIO())
+        for i in range(1000):
+            handler.handle(_make_record(logging.DEBUG, f"debug {i}"))
+            if i % 20 == 0:
+                handler.handle(_make_record(logging.INFO, f"info {i}"))
+        # all of the info records fit; only the most recent debug records are kept.
+        self.assertEqual(60, handler.record_count)
+        self.assertEqual(990, handler.dropped_count)
+        records = handler.take_records()
+        self.assertEqual([f"info {i}" for i in range(0, 1000, 20)] + [f"debug {i}" for i in range(990, 1000)], [record.getMessage() for record in records])
+        self.assertEqual(0, handler.record_count)
+        self.assertEqual([], handler.take_records())
+        # when the overall capacity is reached, the oldest records are dropped regardless of level.
+        for i in range(150):
+            handler.handle(_make_record(logging.WARNING, f"warning {i}"))
+        self.assertEqual([f"warning {i}" for i in range(50, 150)], [record.getMessage() for record in handler.take_records()])
+
+
+if __name__ == '__main__':
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -1,14 +1,19 @@
 # standard libraries
 import contextlib
+import copy
+import gc
 import logging
+import threading
 import time
+import tracemalloc
 import typing
 import unittest
 
 # third party libraries
-# None
+import numpy
 
 # local libraries
+from nion.ui import Bitmap
 from nion.ui import CanvasItem
 from nion.ui import DrawingContext
 from nion.ui import TestUI
@@ -1721,6 +1726,158 @@ class TestCanvasItemClass(unittest.TestCase):
                 time.sleep(0.01)
             self.assertEqual(2, test_canvas_item._repaint_count)
 
+    def test_update_during_threaded_repaint_aborts_superseded_repaint_between_children(self) -> None:
+        CanvasItem._threaded_rendering_enabled = True
+        outer_layer = CanvasItem.LayerCanvasItem()
+        outer_layer.layout = CanvasItem.CanvasItemColumnLayout()
+        with contextlib.closing(outer_layer):
+            test_canvas_item1 = _TestCanvasItem()
+            test_canvas_item1.repaint_delay = 0.2
+            test_canvas_item2 = _TestCanvasItem()
+            outer_layer.add_canvas_item(test_canvas_item1)
+            outer_layer.add_canvas_item(test_canvas_item2)
+            outer_layer.update_layout(Geometry.IntPoint(), Geometry.IntSize(width=640, height=480))
+            # update the second item while the first item is painting.
+            time.sleep(test_canvas_item1.repaint_delay / 4)
+            aborted_repaint_count = outer_layer._aborted_repaint_count
+            test_canvas_item2.update()
+            start_time = time.perf_counter()
+            while test_canvas_item2._repaint_count < 1 and time.perf_counter() - start_time < test_canvas_item1.repaint_delay * 10:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            # the first repaint was aborted before painting the second item; the first item was not repainted.
+            self.assertEqual(aborted_repaint_count + 1, outer_layer._aborted_repaint_count)
+            self.assertGreater(outer_layer._aborted_repaint_time, 0.0)
+            self.assertEqual(1, test_canvas_item1._repaint_count)
+            self.assertEqual(1, test_canvas_item2._repaint_count)
+
+    def test_repaint_checkpoint_does_nothing_outside_threaded_repaint(self) -> None:
+        CanvasItem.repaint_checkpoint()
+
+    def test_layer_maximum_frame_rate_batches_rapid_updates_into_frames(self) -> None:
+        CanvasItem._threaded_rendering_enabled = True
+        outer_layer = CanvasItem.LayerCanvasItem()
+        outer_layer.maximum_frame_rate = 10.0
+        with contextlib.closing(outer_layer):
+            test_canvas_item = _TestCanvasItem()
+            outer_layer.add_canvas_item(test_canvas_item)
+            outer_layer.update_layout(Geometry.IntPoint(), Geometry.IntSize(width=640, height=480))
+            time.sleep(0.05)
+            outer_layer_repaint_count = outer_layer._repaint_count
+            # twenty updates over about 0.1s should only produce a couple of frames at 10 fps.
+            for i in range(20):
+                test_canvas_item.update()
+                time.sleep(0.005)
+            time.sleep(0.3)
+            repaint_count = outer_layer._repaint_count - outer_layer_repaint_count
+            self.assertGreaterEqual(repaint_count, 1)
+            self.assertLessEqual(repaint_count, 3)
+
+    def test_frame_clock_uses_inactive_rate_and_coalesces_requests(self) -> None:
+        is_active = True
+        frame_clock = CanvasItem.FrameClock(frame_rate=50.0, inactive_frame_rate=5.0, is_active_fn=lambda: is_active)
+        try:
+            self.assertAlmostEqual(0.02, frame_clock.frame_interval)
+            is_active = False
+            self.assertAlmostEqual(0.2, frame_clock.frame_interval)
+            calls = list[str]()
+            done_event = threading.Event()
+            frame_time = time.perf_counter() + 0.02
+            frame_clock.request_frame("a", lambda: calls.append("a"), frame_time)
+            frame_clock.request_frame("a", lambda: calls.append("a"), frame_time + 0.01)
+            frame_clock.request_frame("b", done_event.set, frame_time)
+            self.assertTrue(done_event.wait(5.0))
+            self.assertEqual(["a"], calls)
+            self.assertEqual(1, frame_clock._frame_count)
+        finally:
+            frame_clock.close()
+
+    def test_composition_skips_painting_children_covered_by_later_opaque_children(self) -> None:
+        layer = CanvasItem.LayerCanvasItem()
+        with contextlib.closing(layer):
+            hidden_canvas_item = _TestCanvasItem()
+            partly_hidden_canvas_item = _TestCanvasItem()
+            partly_hidden_canvas_item.update_sizing(partly_hidden_canvas_item.sizing.with_fixed_width(200))
+            overlay_composition = CanvasItem.CanvasItemComposition()
+            overlay_composition.layout = CanvasItem.CanvasItemRowLayout()
+            overlay_composition.add_stretch()
+            overlay_canvas_item = _TestCanvasItem()
+            overlay_canvas_item.is_opaque = True
+            overlay_canvas_item.update_sizing(overlay_canvas_item.sizing.with_fixed_width(100))
+            overlay_composition.add_canvas_item(overlay_canvas_item)
+            opaque_canvas_item = _TestCanvasItem()
+            opaque_canvas_item.is_opaque = True
+            layer.add_canvas_item(hidden_canvas_item)
+            layer.add_canvas_item(opaque_canvas_item)
+            layer.add_canvas_item(partly_hidden_canvas_item)
+            layer.add_canvas_item(overlay_composition)
+            layer.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=640, height=480))
+            self.assertEqual(0, hidden_canvas_item._repaint_count)
+            self.assertEqual(1, opaque_canvas_item._repaint_count)
+            self.assertEqual(1, partly_hidden_canvas_item._repaint_count)
+            self.assertEqual(1, overlay_canvas_item._repaint_count)
+            self.assertEqual(1, layer._last_culled_repaint_count)
+
+    def test_stacked_pages_with_solid_backgrounds_cull_the_pages_below(self) -> None:
+        layer = CanvasItem.LayerCanvasItem()
+        with contextlib.closing(layer):
+            page_text_canvas_items = list[_TestCanvasItem]()
+            for background_color in ("white", "#EEE", "rgba(255, 255, 255, 1.0)"):
+                page = CanvasItem.CanvasItemComposition()
+                page.background_color = background_color
+                page_text_canvas_item = _TestCanvasItem()
+                page.add_canvas_item(page_text_canvas_item)
+                page_text_canvas_items.append(page_text_canvas_item)
+                layer.add_canvas_item(page)
+            # a translucent page does not hide the pages below.
+            translucent_page = CanvasItem.CanvasItemComposition()
+            translucent_page.background_color = "rgba(255, 255, 255, 0.5)"
+            layer.add_canvas_item(translucent_page)
+            layer.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=640, height=480))
+            self.assertEqual([0, 0, 1], [c._repaint_count for c in page_text_canvas_items])
+            self.assertEqual(2, layer._last_culled_repaint_count)
+            # an overlay with a solid background hides the pages too.
+            overlay = CanvasItem.BackgroundCanvasItem("#FFF")
+            layer.add_canvas_item(overlay)
+            layer.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=640, height=480))
+            self.assertEqual([0, 0, 1], [c._repaint_count for c in page_text_canvas_items])
+            self.assertEqual(4, layer._last_culled_repaint_count)
+
+    def test_deferred_child_composers_are_built_for_visible_children_and_evicted(self) -> None:
+        composer_counts = dict[int, int]()
+
+        class CountingCanvasItem(_TestCanvasItem):
+            def __init__(self, index: int) -> None:
+                super().__init__()
+                self.index = index
+
+            def _get_composer(self, composer_cache: CanvasItem.ComposerCache) -> typing.Optional[CanvasItem.BaseComposer]:
+                composer_counts[self.index] = composer_counts.get(self.index, 0) + 1
+                return super()._get_composer(composer_cache)
+
+        content = CanvasItem.CanvasItemComposition()
+        content.layout = CanvasItem.CanvasItemColumnLayout()
+        content.defer_child_composers = True
+        content.composer_eviction_interval = 0.0
+        for i in range(100):
+            canvas_item = CountingCanvasItem(i)
+            canvas_item.update_sizing(canvas_item.sizing.with_fixed_height(20))
+            content.add_canvas_item(canvas_item)
+        scroll_area = CanvasItem.ScrollAreaCanvasItem(content)
+        with contextlib.closing(scroll_area):
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=100))
+            # only the first five children are visible (plus the one touching the bottom edge)
+            self.assertEqual(set(range(0, 6)), set(composer_counts.keys()))
+            self.assertEqual(2000, (content.canvas_size or Geometry.IntSize()).height)
+            scroll_area.update_content_origin(Geometry.IntPoint(y=-1000))
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=100))
+            self.assertEqual(set(range(0, 6)) | set(range(49, 56)), set(composer_counts.keys()))
+            # scrolling back rebuilds the evicted composers for the first children.
+            scroll_area.update_content_origin(Geometry.IntPoint())
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=100))
+            self.assertEqual(2, composer_counts[0])
+            self.assertEqual(1, composer_counts[50])
+
     def test_parent_canvas_item_triggers_only_one_layout_for_each_descendent(self) -> None:
         CanvasItem._threaded_rendering_enabled = True
         outer_layer = CanvasItem.LayerCanvasItem()
@@ -1807,6 +1964,386 @@ class TestCanvasItemClass(unittest.TestCase):
             self.assertEqual(inner_composition_height, canvas_size.height)
 
 
+    def test_sizing_with_methods_return_interned_immutable_sizings(self) -> None:
+        sizing1 = CanvasItem.make_sizing().with_fixed_width(20)
+        sizing2 = CanvasItem.make_sizing().with_fixed_width(20)
+        self.assertIs(sizing1, sizing2)
+        self.assertIs(sizing1, copy.deepcopy(sizing1))
+        self.assertEqual(sizing1, CanvasItem.Sizing(sizing1.sizing_data))
+        self.assertEqual(hash(sizing1), hash(CanvasItem.Sizing(sizing1.sizing_data)))
+        # float values <= 1.0 are percentages and must not be interned with integer values
+        self.assertIsNot(CanvasItem.make_sizing().with_fixed_width(1), CanvasItem.make_sizing().with_fixed_width(1.0))
+        self.assertEqual(1, CanvasItem.make_sizing().with_fixed_width(1).get_width_constraint(640).preferred)
+        self.assertEqual(640, CanvasItem.make_sizing().with_fixed_width(1.0).get_width_constraint(640).preferred)
+
+    def test_sizing_constraints_are_shared_per_sizing_and_available_size(self) -> None:
+        sizing = CanvasItem.make_sizing().with_maximum_width(0.5).with_minimum_width(10)
+        constraint = sizing.get_width_constraint(640)
+        self.assertIs(constraint, sizing.get_width_constraint(640))
+        self.assertEqual((10, 320, None), (constraint.minimum, constraint.maximum, constraint.preferred))
+        self.assertEqual(400, sizing.get_width_constraint(800).maximum)
+        self.assertEqual(0, sizing.get_height_constraint(640).minimum)
+
+
+    def test_canvas_item_creates_streams_lazily_with_current_value(self) -> None:
+        canvas_item = CanvasItem.EmptyCanvasItem()
+        with contextlib.closing(canvas_item):
+            self.assertFalse(hasattr(canvas_item, "__dict__"))
+            canvas_item.update_layout(Geometry.IntPoint(x=2, y=3), Geometry.IntSize(width=40, height=30))
+            self.assertEqual(Geometry.IntSize(width=40, height=30), canvas_item._canvas_size_stream.value)
+            self.assertEqual(Geometry.IntPoint(x=2, y=3), canvas_item._canvas_origin_stream.value)
+            canvas_item.update_layout(Geometry.IntPoint(), Geometry.IntSize(width=50, height=30))
+            self.assertEqual(Geometry.IntSize(width=50, height=30), canvas_item._canvas_size_stream.value)
+            focus_changes = list[bool]()
+            with canvas_item.focus_changed_event.listen(lambda: focus_changes.append(canvas_item.focused)):
+                canvas_item._set_focused(True)
+            self.assertEqual([True], focus_changes)
+
+    def test_lightweight_canvas_item_memory_per_item_benchmark(self) -> None:
+        item_count = 2000
+        gc.collect()
+        tracemalloc.start()
+        try:
+            canvas_items = [CanvasItem.TextCanvasItem(str(i)) for i in range(item_count)]
+            bytes_per_item = tracemalloc.get_traced_memory()[0] / item_count
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(item_count, len(canvas_items))
+        # was about 4.6k bytes per item with eager locks, streams, and events.
+        self.assertLess(bytes_per_item, 3000)
+
+    def test_lightweight_canvas_item_construction_rate_benchmark(self) -> None:
+        item_count = 5000
+        start_time = time.perf_counter()
+        canvas_items = [CanvasItem.TextCanvasItem(str(i)) for i in range(item_count)]
+        items_per_second = item_count / (time.perf_counter() - start_time)
+        self.assertEqual(item_count, len(canvas_items))
+        # generous lower bound to avoid failures on slow machines; typically well over 20k items per second.
+        self.assertGreater(items_per_second, 2000)
+
+
+    def test_render_scheduler_runs_by_priority_and_round_robin_between_groups(self) -> None:
+        scheduler = CanvasItem.RenderScheduler(max_workers=1, starvation_interval=60.0)
+        try:
+            started_event = threading.Event()
+            release_event = threading.Event()
+            order = list[str]()
+
+            def block() -> None:
+                started_event.set()
+                release_event.wait()
+
+            scheduler.submit_render(block)
+            started_event.wait()
+            scheduler.submit_render(lambda: order.append("background"), priority=CanvasItem.RenderPriority.BACKGROUND)
+            scheduler.submit_render(lambda: order.append("a1"), group="a")
+            scheduler.submit_render(lambda: order.append("a2"), group="a")
+            scheduler.submit_render(lambda: order.append("b1"), group="b")
+            future = scheduler.submit_render(lambda: order.append("focused"), priority=CanvasItem.RenderPriority.FOCUSED)
+            release_event.set()
+            future.result(timeout=5.0)
+        finally:
+            scheduler.shutdown()
+        self.assertEqual(["focused", "a1", "b1", "a2", "background"], order)
+
+    def test_render_scheduler_prevents_starvation_and_records_queue_wait_time(self) -> None:
+        scheduler = CanvasItem.RenderScheduler(max_workers=1, starvation_interval=0.0)
+        try:
+            started_event = threading.Event()
+            release_event = threading.Event()
+            order = list[str]()
+            key = CanvasItem.LayerCanvasItem()
+
+            def block() -> None:
+                started_event.set()
+                release_event.wait()
+
+            scheduler.submit_render(block)
+            started_event.wait()
+            scheduler.submit_render(lambda: order.append("background"), priority=CanvasItem.RenderPriority.BACKGROUND, key=key)
+            scheduler.submit_render(lambda: order.append("focused"), priority=CanvasItem.RenderPriority.FOCUSED)
+            time.sleep(0.02)
+            release_event.set()
+            scheduler.shutdown()
+            # the background item waited longest and the starvation interval is zero, so it runs first.
+            self.assertEqual(["background", "focused"], order)
+            queue_stats = scheduler.get_queue_stats(key)
+            assert queue_stats
+            self.assertEqual(1, queue_stats.count)
+            self.assertGreaterEqual(queue_stats.last_wait_time, 0.02)
+        finally:
+            scheduler.shutdown()
+
+    def test_root_canvas_item_partitions_busy_progress_bar_layer_into_section(self) -> None:
+        current_time = 0.0
+
+        def clock() -> float:
+            return current_time
+
+        update_rate_clock = CanvasItem._update_rate_clock
+        CanvasItem._update_rate_clock = clock
+        try:
+            ui = TestUI.UserInterface()
+            canvas_widget = ui.create_canvas_widget()
+            with contextlib.closing(canvas_widget):
+                root_canvas_item = typing.cast(CanvasItem.RootCanvasItem, canvas_widget.canvas_item)
+                root_canvas_item.auto_section_enabled = True
+                # the progress bar fills the layer, so the layer is opaque without being marked.
+                progress_layer = CanvasItem.LayerCanvasItem()
+                progress_bar = CanvasItem.ProgressBarCanvasItem()
+                progress_layer.add_canvas_item(progress_bar)
+                progress_layer.update_sizing(progress_layer.sizing.with_fixed_height(4))
+                # the static layer is opaque but rarely updated.
+                static_layer = CanvasItem.LayerCanvasItem()
+                static_layer.background_color = "#FFF"
+                # the clear layer is updated as often but is not opaque.
+                clear_layer = CanvasItem.LayerCanvasItem()
+                container = CanvasItem.CanvasItemComposition()
+                container.layout = CanvasItem.CanvasItemColumnLayout()
+                container.add_canvas_item(progress_layer)
+                container.add_canvas_item(static_layer)
+                container.add_canvas_item(clear_layer)
+                root_canvas_item.add_canvas_item(container)
+                root_canvas_item.layout_immediate(Geometry.IntSize(w=100, h=100))
+                # spin the busy indicator for half a second at the animation frame rate, one second after setup.
+                current_time += 1.0
+                progress_bar.busy = True
+                for i in range(30):
+                    current_time += 1 / 60
+                    CanvasItem.animation_timeline.tick()
+                    clear_layer.update()
+                static_layer.update()
+                self.assertTrue(progress_layer.is_root_opaque)
+                self.assertFalse(static_layer.is_root_opaque)
+                self.assertFalse(clear_layer.is_root_opaque)
+                section_stats = root_canvas_item.section_stats
+                self.assertIs(progress_layer, section_stats[0].canvas_item)
+                self.assertTrue(section_stats[0].is_auto_section)
+                self.assertEqual(Geometry.IntRect.from_tlbr(0, 0, 4, 100), section_stats[0].canvas_rect)
+                self.assertFalse(any(s.is_section for s in section_stats[1:]))
+                # once idle, the progress layer returns to regular layer drawing when the auto sections are checked,
+                # even though no layer is updated.
+                progress_bar.busy = False
+                current_time += 0.1
+                root_canvas_item._update_auto_sections()
+                self.assertTrue(progress_layer.is_root_opaque)
+                current_time += 1.0
+                root_canvas_item._update_auto_sections()
+                self.assertFalse(progress_layer.is_root_opaque)
+                self.assertFalse(any(s.is_section for s in root_canvas_item.section_stats))
+        finally:
+            CanvasItem._update_rate_clock = update_rate_clock
+
+    def test_root_canvas_item_demotes_idle_auto_section_from_frame_clock(self) -> None:
+        current_time = 0.0
+
+        def clock() -> float:
+            return current_time
+
+        update_rate_clock = CanvasItem._update_rate_clock
+        CanvasItem._update_rate_clock = clock
+        try:
+            ui = TestUI.UserInterface()
+            CanvasItem._threaded_rendering_enabled = True
+            canvas_widget = ui.create_canvas_widget()
+            with contextlib.closing(canvas_widget):
+                root_canvas_item = typing.cast(CanvasItem.RootCanvasItem, canvas_widget.canvas_item)
+                root_canvas_item.auto_section_enabled = True
+                root_canvas_item.auto_section_idle_update_rate = 100.0
+                hot_layer = CanvasItem.LayerCanvasItem()
+                hot_layer.background_color = "#FFF"
+                root_canvas_item.add_canvas_item(hot_layer)
+                root_canvas_item.layout_immediate(Geometry.IntSize(w=100, h=100))
+                for i in range(30):
+                    current_time += 1 / 200
+                    hot_layer.update()
+                self.assertTrue(hot_layer.is_root_opaque)
+                # no further updates; the frame clock checks the auto sections and demotes the idle layer.
+                current_time += 1.0
+                deadline = time.perf_counter() + 2.0
+                while hot_layer.is_root_opaque and time.perf_counter() < deadline:
+                    time.sleep(0.01)
+                self.assertFalse(hot_layer.is_root_opaque)
+        finally:
+            CanvasItem._update_rate_clock = update_rate_clock
+
+    def test_identical_cells_record_drawing_once(self) -> None:
+        bitmap = Bitmap.Bitmap(rgba_bitmap_data=numpy.zeros((8, 8), numpy.uint32))
+        cell_display_list_cache = CanvasItem.cell_display_list_cache
+        cell_display_list_cache.clear()
+        record_count = cell_display_list_cache._record_count
+        canvas_item = CanvasItem.CanvasItemComposition()
+        with contextlib.closing(canvas_item):
+            canvas_item.layout = CanvasItem.CanvasItemGridLayout(Geometry.IntSize(width=50, height=100))
+            for i in range(5000):
+                bitmap_canvas_item = CanvasItem.BitmapCanvasItem(bitmap=bitmap)
+                canvas_item.add_canvas_item(bitmap_canvas_item, Geometry.IntPoint(x=i % 50, y=i // 50))
+            canvas_item.update_layout(Geometry.IntPoint(), Geometry.IntSize(width=800, height=1600))
+            drawing_context = DrawingContext.DrawingContext()
+            canvas_item.repaint_immediate(drawing_context, Geometry.IntSize(width=800, height=1600))
+            self.assertEqual(record_count + 1, cell_display_list_cache._record_count)
+            # each cell replays the recorded drawing at its own location.
+            self.assertEqual(5000, sum(1 for command in drawing_context.commands if command[0] == "image"))
+            self.assertLess(0, cell_display_list_cache._byte_size)
+        # the recorded drawing is discarded once no cell uses it.
+        self.assertEqual(0, cell_display_list_cache._byte_size)
+
+    def test_cell_display_list_cache_is_bounded_by_byte_size(self) -> None:
+        cell_display_list_cache = CanvasItem.CellDisplayListCache(capacity=4 * 64 * 64 * 4)
+        images = [numpy.zeros((64, 64), numpy.uint32) for i in range(8)]
+        for image in images:
+            cell_display_list_cache.get_drawing_context(CanvasItem._IdentityKey(image), lambda dc: dc.draw_image(image, 0, 0, 64, 64))
+        self.assertEqual(8, cell_display_list_cache._record_count)
+        self.assertGreaterEqual(4 * 64 * 64 * 4, cell_display_list_cache._byte_size)
+        self.assertLess(0, cell_display_list_cache._byte_size)
+
+    def test_animation_timeline_ticks_busy_indicators_with_one_update_per_frame(self) -> None:
+        ui = TestUI.UserInterface()
+        canvas_widget = ui.create_canvas_widget()
+        with contextlib.closing(canvas_widget):
+            root_canvas_item = canvas_widget.canvas_item
+            root_canvas_item.layout = CanvasItem.CanvasItemColumnLayout()
+            progress_bars = list[CanvasItem.ProgressBarCanvasItem]()
+            for i in range(10):
+                progress_bar = CanvasItem.ProgressBarCanvasItem()
+                progress_bar.busy = True
+                root_canvas_item.add_canvas_item(progress_bar)
+                progress_bars.append(progress_bar)
+            progress_bars[-1].visible = False
+            root_canvas_item.layout_immediate(Geometry.IntSize(w=100, h=100))
+            root_update_count = root_canvas_item._update_count
+            update_counts = [progress_bar._update_count for progress_bar in progress_bars]
+            CanvasItem.animation_timeline.tick()
+            # the visible busy indicators are updated together, resulting in a single update of the root.
+            self.assertEqual(root_update_count + 1, root_canvas_item._update_count)
+            self.assertEqual([c + 1 for c in update_counts[:-1]], [progress_bar._update_count for progress_bar in progress_bars[:-1]])
+            self.assertEqual(update_counts[-1], progress_bars[-1]._update_count)
+            # with reduced motion, nothing is ticked.
+            CanvasItem.animation_timeline.reduced_motion = True
+            try:
+                root_update_count = root_canvas_item._update_count
+                CanvasItem.animation_timeline.tick()
+                self.assertEqual(root_update_count, root_canvas_item._update_count)
+            finally:
+                CanvasItem.animation_timeline.reduced_motion = False
+
+    def test_animation_timeline_waits_while_no_items_are_visible(self) -> None:
+        ui = TestUI.UserInterface()
+        canvas_widget = ui.create_canvas_widget()
+        with contextlib.closing(canvas_widget):
+            tick_times = list[float]()
+
+            class AnimatedCanvasItem(CanvasItem.AbstractCanvasItem):
+                def _animation_tick(self, animation_time: float) -> None:
+                    tick_times.append(animation_time)
+
+            canvas_item = AnimatedCanvasItem()
+            canvas_item.visible = False
+            canvas_widget.canvas_item.add_canvas_item(canvas_item)
+            animation_timeline = CanvasItem.AnimationTimeline(frame_rate=100.0)
+            CanvasItem._threaded_rendering_enabled = True
+            try:
+                animation_timeline.register(canvas_item)
+                start_time = time.perf_counter()
+                while not animation_timeline._idle_count and time.perf_counter() - start_time < 5.0:
+                    time.sleep(0.01)
+                # the hidden item is not ticked and the timeline stops running frames.
+                frame_count = animation_timeline._frame_count
+                time.sleep(0.1)
+                self.assertEqual(frame_count, animation_timeline._frame_count)
+                self.assertEqual(1, animation_timeline._idle_count)
+                self.assertEqual([], tick_times)
+                # a visibility change wakes the timeline and the visible item is ticked.
+                canvas_item.visible = True
+                animation_timeline.visibility_changed()
+                start_time = time.perf_counter()
+                while len(tick_times) < 2 and time.perf_counter() - start_time < 5.0:
+                    time.sleep(0.01)
+                self.assertGreaterEqual(len(tick_times), 2)
+            finally:
+                animation_timeline.unregister(canvas_item)
+                CanvasItem._threaded_rendering_enabled = False
+
+    def test_throttled_splitter_tracking_lays_out_once_per_frame_and_exactly_on_release(self) -> None:
+        ui = TestUI.UserInterface()
+        canvas_widget = ui.create_canvas_widget()
+        with contextlib.closing(canvas_widget):
+            canvas_item = canvas_widget.canvas_item
+            splitter = CanvasItem.SplitterCanvasItem()
+            splitter.throttle_tracking = True
+            splitter.tracking_snapshots = True
+            canvas_item1 = _TestCanvasItem()
+            canvas_item2 = _TestCanvasItem()
+            splitter.add_canvas_item(canvas_item1)
+            splitter.add_canvas_item(canvas_item2)
+            canvas_item.add_canvas_item(splitter)
+            canvas_item.update_layout(Geometry.IntPoint(x=0, y=0), Geometry.IntSize(width=640, height=480))
+            modifiers = typing.cast(UserInterface.KeyboardModifiers, CanvasItem.KeyboardModifiers())
+            splitter.mouse_pressed(320, 240, modifiers)
+            for x in range(321, 481):
+                splitter.mouse_position_changed(x, 240, modifiers)
+            # far fewer layouts than mouse moves; the children keep their layout while tracking with snapshots.
+            self.assertLess(splitter._tracking_layout_count, 20)
+            canvas_item.update_layout(Geometry.IntPoint(x=0, y=0), Geometry.IntSize(width=640, height=480))
+            self.assertEqual(320, canvas_item1.canvas_rect.width if canvas_item1.canvas_rect else 0)
+            splitter.mouse_released(480, 240, modifiers)
+            canvas_item.update_layout(Geometry.IntPoint(x=0, y=0), Geometry.IntSize(width=640, height=480))
+            self.assertAlmostEqual(splitter.splits[0], 0.75)
+            self.assertEqual(canvas_item1.canvas_rect, Geometry.IntRect(origin=Geometry.IntPoint(x=0, y=0), size=Geometry.IntSize(width=480, height=480)))
+            self.assertEqual(canvas_item2.canvas_rect, Geometry.IntRect(origin=Geometry.IntPoint(x=480, y=0), size=Geometry.IntSize(width=160, height=480)))
+
+    def test_throttled_resize_is_applied_on_the_ui_thread(self) -> None:
+        ui = TestUI.UserInterface()
+        canvas_widget = ui.create_canvas_widget()
+        with contextlib.closing(canvas_widget):
+            canvas_item = typing.cast(CanvasItem.RootCanvasItem, canvas_widget.canvas_item)
+            canvas_item.throttle_resize = True
+            canvas_item.size_changed(640, 480)
+            # the second size change within the frame waits for the frame clock, which queues it to the UI thread
+            # rather than applying it on the frame clock thread.
+            canvas_item.size_changed(320, 240)
+            start_time = time.perf_counter()
+            while not canvas_widget.pending_queued_tasks and time.perf_counter() - start_time < 5.0:
+                time.sleep(0.01)
+            self.assertEqual(Geometry.IntSize(width=640, height=480), canvas_item.canvas_size)
+            self.assertEqual(1, len(canvas_widget.pending_queued_tasks))
+            # running the queued task on this thread applies the latest size.
+            for task in canvas_widget.pending_queued_tasks:
+                task()
+            self.assertEqual(Geometry.IntSize(width=320, height=240), canvas_item.canvas_size)
+
+    def test_scroll_area_tile_cache_records_only_exposed_and_updated_tiles(self) -> None:
+        content = CanvasItem.CanvasItemComposition()
+        content.layout = CanvasItem.CanvasItemColumnLayout()
+        rows = list[CanvasItem.AbstractCanvasItem]()
+        for i in range(100):
+            row = CanvasItem.BackgroundCanvasItem("#F00" if i % 2 else "#00F")
+            row.update_sizing(row.sizing.with_fixed_height(20))
+            content.add_canvas_item(row)
+            rows.append(row)
+        scroll_area = CanvasItem.ScrollAreaCanvasItem(content)
+        scroll_area.tile_size = 100
+        with contextlib.closing(scroll_area):
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=100))
+            tile_cache = scroll_area._tile_cache
+            assert tile_cache
+            self.assertEqual(1, tile_cache._record_count)
+            # scrolling by a few pixels only records the newly exposed tile.
+            scroll_area.update_content_origin(Geometry.IntPoint(y=-10))
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=100))
+            self.assertEqual(2, tile_cache._record_count)
+            self.assertEqual(1, tile_cache._hit_count)
+            scroll_area.update_content_origin(Geometry.IntPoint(y=-20))
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=100))
+            self.assertEqual(2, tile_cache._record_count)
+            # updating a row only records the tile containing it again.
+            rows[7].background_color = "#0F0"
+            drawing_context = DrawingContext.DrawingContext()
+            scroll_area.repaint_immediate(drawing_context, Geometry.IntSize(width=100, height=100))
+            self.assertEqual(3, tile_cache._record_count)
+            self.assertIn("#0F0", drawing_context.to_js())
+
+
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)
     unittest.main()
@@ -25,3 +25,31 @@ class TestImageClass(unittest.TestCase):
         color_map_data[:] = 0xFF010203
         dc.draw_data(data, 0, 0, 4, 4, 0, 1, color_map_data)
         dc.to_svg(Geometry.IntSize(4, 4), Geometry.IntRect.from_tlbr(0, 0, 4, 4))
+
+    def test_gradient_ids_are_derived_from_contents(self) -> None:
+        dc = DrawingContext.DrawingContext()
+        gradient1 = dc.create_linear_gradient(10, 20, 0, 0, 0, 20)
+        gradient1.add_color_stop(0.0, "red")
+        gradient1.add_color_stop(1.0, "blue")
+        gradient2 = dc.create_linear_gradient(10, 20, 0, 0, 0, 20)
+        gradient2.add_color_stop(0.0, "red")
+        gradient2.add_color_stop(1.0, "blue")
+        self.assertEqual(gradient1.command_var, gradient2.command_var)
+        self.assertEqual(gradient1.binary_commands, gradient2.binary_commands)
+        gradient2.add_color_stop(1.0, "green")
+        self.assertNotEqual(gradient1.command_var, gradient2.command_var)
+        self.assertEqual({gradient2.command_var}, {command[1] for command in gradient2.commands})
+        # complete gradients are shared and have the same id as the equivalent built gradient.
+        color_stops = ((0.0, "red"), (1.0, "blue"))
+        gradient3 = dc.create_linear_gradient(10, 20, 0, 0, 0, 20, color_stops)
+        self.assertIs(gradient3, dc.create_linear_gradient(10, 20, 0, 0, 0, 20, color_stops))
+        self.assertEqual(gradient1.command_var, gradient3.command_var)
+        with self.assertRaises(RuntimeError):
+            gradient3.add_color_stop(0.5, "green")
+        # color stops may be any sequence of pairs; equal stops share the gradient.
+        self.assertIs(gradient3, dc.create_linear_gradient(10, 20, 0, 0, 0, 20, [[0, "red"], [1, "blue"]]))  # type: ignore
+        dc.begin_path()
+        dc.rect(0, 0, 10, 20)
+        dc.fill_style = gradient3
+        dc.fill()
+        self.assertIn("grad" + str(gradient3.command_var), dc.to_svg(Geometry.IntSize(20, 10), Geometry.IntRect.from_tlbr(0, 0, 20, 10)))
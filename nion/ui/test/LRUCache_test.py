@@ -0,0 +1,63 @@
+# standard libraries
+import concurrent.futures
+import threading
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.ui import LRUCache
+
+
+class TestLRUCacheClass(unittest.TestCase):
+
+    def test_least_recently_used_value_is_evicted(self) -> None:
+        cache = LRUCache.LRUCache[str, int](2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual(0.75, cache.hit_rate)
+        # peeking does not mark the value as recently used.
+        self.assertEqual(1, cache.peek("a"))
+        cache.put("d", 4)
+        self.assertIsNone(cache.peek("a"))
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+    def test_values_are_evicted_to_keep_the_total_size_within_capacity(self) -> None:
+        cache = LRUCache.LRUCache[str, bytes](10, len)
+        cache.put("a", bytes(4))
+        cache.put("b", bytes(4))
+        self.assertEqual(8, cache.size)
+        cache.put("c", bytes(4))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(8, cache.size)
+        self.assertEqual(bytes(4), cache.pop("b"))
+        self.assertEqual(4, cache.size)
+        # a value larger than the capacity is not kept.
+        cache.put("d", bytes(11))
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size)
+
+    def test_get_or_create_shares_one_value_between_threads(self) -> None:
+        cache = LRUCache.LRUCache[str, object](8)
+        barrier = threading.Barrier(4)
+
+        def create() -> object:
+            barrier.wait()
+            return object()
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            values = list(executor.map(lambda i: cache.get_or_create("key", create), range(4)))
+        self.assertTrue(all(value is values[0] for value in values))
+        self.assertIs(values[0], cache.get_or_create("key", object))
+
+
+if __name__ == '__main__':
+    unittest.main()
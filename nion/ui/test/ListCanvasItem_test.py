@@ -1,15 +1,23 @@
 # standard libraries
+import contextlib
+import functools
 import typing
 import unittest
+import unittest.mock
 
 # third party libraries
 # None
 
 # local libraries
 from nion.ui import CanvasItem
+from nion.ui import DrawingContext
+from nion.ui import GridFlowCanvasItem
 from nion.ui import ListCanvasItem
+from nion.ui import ProjectedListModel
 from nion.ui import UserInterface
 from nion.utils import Geometry
+from nion.utils import ListModel
+from nion.utils import Model
 from nion.utils import Selection
 
 
@@ -34,6 +42,20 @@ class ListCanvasItemDelegate(ListCanvasItem.ListCanvasItemDelegate):
         pass
 
 
+class PaintCountingListCanvasItemDelegate(ListCanvasItemDelegate):
+    def __init__(self) -> None:
+        super().__init__()
+        self.painted_items = list[typing.Any]()
+
+    def paint_item(self, drawing_context: DrawingContext.DrawingContext, display_item: typing.Any, rect: Geometry.IntRect, is_selected: bool) -> None:
+        self.painted_items.append(display_item)
+        drawing_context.fill_text(str(display_item), rect.left, rect.top)
+
+
+def _contains_text(text: str, s: str) -> bool:
+    return text in s
+
+
 class TestListCanvasItemClass(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -62,3 +84,149 @@ class TestListCanvasItemClass(unittest.TestCase):
         self.assertEqual(selection.indexes, set())
         canvas_item.simulate_drag(Geometry.IntPoint(y=120, x=50), Geometry.IntPoint(y=120, x=500))
         self.assertEqual(selection.indexes, set())
+
+    def test_list_canvas_item_recycles_item_canvas_items_while_filtering(self) -> None:
+        list_model = ListModel.ListModel[str](items=[f"item{i}" for i in range(200)])
+        filtered_list_model = ListModel.FilteredListModel(container=list_model, items_key="items")
+        selection = Selection.IndexedSelection()
+
+        def make_item_canvas_item(item: typing.Any, is_selected_model: Model.PropertyModel[bool]) -> CanvasItem.AbstractCanvasItem:
+            return CanvasItem.TextCanvasItem(item)
+
+        def rebind_item_canvas_item(canvas_item: CanvasItem.AbstractCanvasItem, item: typing.Any) -> bool:
+            typing.cast(CanvasItem.TextCanvasItem, canvas_item).text = item
+            return True
+
+        canvas_item = ListCanvasItem.ListCanvasItem2(filtered_list_model, selection, make_item_canvas_item, GridFlowCanvasItem.GridFlowCanvasItemDelegate(), item_height=20, pool_capacity=200, item_rebinder=rebind_item_canvas_item)
+        with contextlib.closing(canvas_item):
+            self.assertEqual(200, canvas_item.pool_stats.created_count)
+            # simulate typing and erasing filter text several times.
+            created_counts = list[int]()
+            for i in range(3):
+                for text in ("1", "12", "123", "12", "1", ""):
+                    filtered_list_model.filter = ListModel.PredicateFilter(functools.partial(_contains_text, text))
+                created_counts.append(canvas_item.pool_stats.created_count)
+            # no new item canvas items are created; removed ones are rebound to the inserted items.
+            self.assertEqual([200, 200, 200], created_counts)
+            self.assertLess(0.5, canvas_item.pool_stats.hit_rate)
+            self.assertEqual([f"item{i}" for i in range(200)], [typing.cast(CanvasItem.TextCanvasItem, c._canvas_item).text for c in canvas_item._grid_flow_item_canvas_items])
+
+    def test_list_canvas_item_row_cache_repaints_only_changed_rows(self) -> None:
+        selection = Selection.IndexedSelection()
+        delegate = PaintCountingListCanvasItemDelegate()
+        canvas_item = ListCanvasItem.ListCanvasItem(delegate, selection, cache_rows=True)
+        with contextlib.closing(canvas_item):
+            canvas_item.update_layout(Geometry.IntPoint(), Geometry.IntSize(height=320, width=100))
+            canvas_item._repaint(DrawingContext.DrawingContext())
+            self.assertEqual([1, 2, 3, 4], delegate.painted_items)
+            # changing the selection only paints the rows whose selected state changed.
+            delegate.painted_items.clear()
+            selection.set(1)
+            canvas_item._repaint(DrawingContext.DrawingContext())
+            self.assertEqual([2], delegate.painted_items)
+            delegate.painted_items.clear()
+            selection.set(2)
+            canvas_item._repaint(DrawingContext.DrawingContext())
+            self.assertEqual([2, 3], delegate.painted_items)
+            # invalidating an item paints only that row again.
+            delegate.painted_items.clear()
+            canvas_item.invalidate_items([0])
+            drawing_context = DrawingContext.DrawingContext()
+            canvas_item._repaint(drawing_context)
+            self.assertEqual([1], delegate.painted_items)
+            self.assertEqual(4, drawing_context.to_js().count("fillText"))
+
+    def test_list_canvas_item_selection_change_only_touches_changed_items(self) -> None:
+        list_model = ListModel.ListModel[str](items=[f"item{i}" for i in range(5000)])
+        selection = Selection.IndexedSelection()
+
+        def make_item_canvas_item(item: typing.Any, is_selected_model: Model.PropertyModel[bool]) -> CanvasItem.AbstractCanvasItem:
+            return CanvasItem.TextCanvasItem(item)
+
+        canvas_item = ListCanvasItem.ListCanvasItem2(list_model, selection, make_item_canvas_item, GridFlowCanvasItem.GridFlowCanvasItemDelegate(), item_height=20)
+        # count the copies of the full list of canvas items.
+        canvas_items_property = CanvasItem.CanvasItemComposition.canvas_items
+        canvas_items_copy_count = 0
+
+        def get_canvas_items(composition: CanvasItem.CanvasItemComposition) -> typing.Sequence[CanvasItem.AbstractCanvasItem]:
+            nonlocal canvas_items_copy_count
+            canvas_items_copy_count += 1
+            return typing.cast(typing.Sequence[CanvasItem.AbstractCanvasItem], canvas_items_property.fget(composition))  # type: ignore
+
+        with contextlib.closing(canvas_item), unittest.mock.patch.object(CanvasItem.CanvasItemComposition, "canvas_items", property(get_canvas_items)):
+            canvas_item._selection_touch_count = 0
+            selection.set(10)
+            self.assertEqual(1, canvas_item._selection_touch_count)
+            selection.set(20)
+            self.assertEqual(3, canvas_item._selection_touch_count)
+            selection.extend(29)
+            self.assertEqual(12, canvas_item._selection_touch_count)
+            self.assertEqual(0, canvas_items_copy_count)
+            self.assertEqual(set(range(20, 30)), {i for i, c in enumerate(canvas_item._grid_flow_item_canvas_items) if c.is_selected})
+
+    def test_list_canvas_item_bulk_changes_lay_out_once_and_preserve_selection_and_scroll_anchor(self) -> None:
+        items = [f"item{i}" for i in range(1000)]
+        list_model = ListModel.ListModel[str](items=items)
+        selection = Selection.IndexedSelection()
+
+        def make_item_canvas_item(item: typing.Any, is_selected_model: Model.PropertyModel[bool]) -> CanvasItem.AbstractCanvasItem:
+            return CanvasItem.TextCanvasItem(item)
+
+        canvas_item = ListCanvasItem.ListCanvasItem2(list_model, selection, make_item_canvas_item, GridFlowCanvasItem.GridFlowCanvasItemDelegate(), item_height=20)
+        scroll_area = CanvasItem.ScrollAreaCanvasItem(canvas_item)
+        with contextlib.closing(scroll_area):
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=200))
+            selection.set(500)
+            # scroll so that item 400 is the first visible item, 5 pixels above the top.
+            scroll_area.update_content_origin(Geometry.IntPoint(y=-(400 * 20 + 5)))
+            # insert items above the first visible item.
+            update_count = canvas_item._update_count
+            layout_count = canvas_item._layout_count
+            canvas_item.insert_items(100, [f"new{i}" for i in range(2000)])
+            self.assertEqual(update_count + 1, canvas_item._update_count)
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=200))
+            self.assertEqual(layout_count + 1, canvas_item._layout_count)
+            self.assertEqual({2500}, selection.indexes)
+            self.assertEqual(-(2400 * 20 + 5), scroll_area.content_origin.y)
+            # remove a range above the first visible item.
+            update_count = canvas_item._update_count
+            layout_count = canvas_item._layout_count
+            canvas_item.remove_items(1000, 1000)
+            self.assertEqual(update_count + 1, canvas_item._update_count)
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=200))
+            self.assertEqual(layout_count + 1, canvas_item._layout_count)
+            self.assertEqual(2000, len(canvas_item._grid_flow_item_canvas_items))
+            self.assertEqual(-(1400 * 20 + 5), scroll_area.content_origin.y)
+            self.assertEqual({1500}, selection.indexes)
+            # reset to a reordered subset; the selected item and first visible item are found in the new items.
+            selected_item = list_model.items[1500]
+            first_visible_item = list_model.items[1200]
+            scroll_area.update_content_origin(Geometry.IntPoint(y=-(1200 * 20)))
+            update_count = canvas_item._update_count
+            new_items = list(reversed(list_model.items[1000:])) + ["added"]
+            old_canvas_items = {id(c.item): c for c in canvas_item._grid_flow_item_canvas_items}
+            canvas_item.reset_items(new_items)
+            self.assertEqual(update_count + 1, canvas_item._update_count)
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=100, height=200))
+            self.assertEqual({new_items.index(selected_item)}, selection.indexes)
+            self.assertEqual(-(new_items.index(first_visible_item) * 20), scroll_area.content_origin.y)
+            self.assertEqual(new_items, [typing.cast(CanvasItem.TextCanvasItem, c._canvas_item).text for c in canvas_item._grid_flow_item_canvas_items])
+            self.assertEqual(canvas_item._grid_flow_item_canvas_items, list(canvas_item.canvas_items))
+            # the remaining items keep their item canvas items.
+            self.assertTrue(all(c is old_canvas_items[id(c.item)] for c in canvas_item._grid_flow_item_canvas_items[:-1]))
+            self.assertNotIn(id(canvas_item._grid_flow_item_canvas_items[-1].item), old_canvas_items)
+
+    def test_list_canvas_item_bulk_changes_require_a_mutable_list_model(self) -> None:
+        list_model = ListModel.ListModel[str](items=["a", "b"])
+        projected_list_model = ProjectedListModel.ProjectedListModel(list_model)
+
+        def make_item_canvas_item(item: typing.Any, is_selected_model: Model.PropertyModel[bool]) -> CanvasItem.AbstractCanvasItem:
+            return CanvasItem.TextCanvasItem(item)
+
+        canvas_item = ListCanvasItem.ListCanvasItem2(projected_list_model, Selection.IndexedSelection(), make_item_canvas_item, GridFlowCanvasItem.GridFlowCanvasItemDelegate(), item_height=20)
+        with contextlib.closing(canvas_item), contextlib.closing(projected_list_model):
+            with self.assertRaises(TypeError):
+                canvas_item.insert_items(0, ["c"])
+            with self.assertRaises(TypeError):
+                canvas_item.reset_items(["c"])
+            self.assertEqual(2, len(canvas_item._grid_flow_item_canvas_items))
@@ -0,0 +1,130 @@
+# standard libraries
+import asyncio
+import concurrent.futures
+import contextlib
+import random
+import typing
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.ui import CanvasItem
+from nion.ui import GridFlowCanvasItem
+from nion.ui import ListCanvasItem
+from nion.ui import ProjectedListModel
+from nion.utils import ListModel
+from nion.utils import Model
+from nion.utils import Selection
+
+
+class ChangeRecorder:
+    def __init__(self, list_model: ProjectedListModel.ProjectedListModel) -> None:
+        self.items = list(list_model.items)
+        self.changes = list[typing.Tuple[str, typing.Any, int]]()
+        self.__item_inserted_listener = list_model.item_inserted_event.listen(self.__item_inserted)
+        self.__item_removed_listener = list_model.item_removed_event.listen(self.__item_removed)
+
+    def __item_inserted(self, key: str, item: typing.Any, index: int) -> None:
+        self.items.insert(index, item)
+        self.changes.append(("insert", item, index))
+
+    def __item_removed(self, key: str, item: typing.Any, index: int) -> None:
+        removed_item = self.items.pop(index)
+        assert removed_item == item
+        self.changes.append(("remove", item, index))
+
+
+class TestProjectedListModelClass(unittest.TestCase):
+
+    def test_projection_matches_filtered_sorted_items_after_random_changes(self) -> None:
+        random.seed(1)
+        list_model = ListModel.ListModel[int](items=[random.randrange(100) for _ in range(200)])
+        projected_list_model = ProjectedListModel.ProjectedListModel(list_model, filter=lambda x: bool(x % 3), sort_key=lambda x: x // 10)
+        with contextlib.closing(projected_list_model):
+            recorder = ChangeRecorder(projected_list_model)
+
+            def expected_items() -> typing.List[int]:
+                filter_ = projected_list_model.filter
+                sort_key = projected_list_model.sort_key
+                items = [item for item in list_model.items if not filter_ or filter_(item)]
+                return sorted(items, key=sort_key, reverse=projected_list_model.sort_reverse) if sort_key else items
+
+            for i in range(300):
+                action = random.randrange(5)
+                if action == 0:
+                    list_model.insert_item(random.randrange(len(list_model.items) + 1), random.randrange(100))
+                elif action == 1 and list_model.items:
+                    list_model.remove_item(random.randrange(len(list_model.items)))
+                elif action == 2:
+                    divisor = random.randrange(2, 5)
+                    projected_list_model.filter = lambda x: bool(x % divisor)
+                elif action == 3:
+                    projected_list_model.sort_key = random.choice([None, lambda x: x // 10, lambda x: -x])
+                else:
+                    projected_list_model.sort_reverse = not projected_list_model.sort_reverse
+                self.assertEqual(expected_items(), list(projected_list_model.items))
+                self.assertEqual(expected_items(), recorder.items)
+
+    def test_filter_and_sort_changes_send_minimal_changes(self) -> None:
+        list_model = ListModel.ListModel[int](items=list(range(1000)))
+        projected_list_model = ProjectedListModel.ProjectedListModel(list_model)
+        with contextlib.closing(projected_list_model):
+            recorder = ChangeRecorder(projected_list_model)
+            # narrowing the filter only removes items.
+            projected_list_model.set_filter(lambda x: x % 10 != 0)
+            self.assertEqual(100, len(recorder.changes))
+            self.assertTrue(all(change[0] == "remove" for change in recorder.changes))
+            recorder.changes.clear()
+            projected_list_model.set_filter(lambda x: x % 10 != 0 and x % 10 != 1, narrowing=True)
+            self.assertEqual(100, len(recorder.changes))
+            recorder.changes.clear()
+            # moving a single item to the front is one remove and one insert.
+            projected_list_model.sort_key = lambda x: -1 if x == 502 else x
+            self.assertEqual([("remove", 502, 400), ("insert", 502, 0)], recorder.changes)
+            self.assertEqual([502, 2, 3, 4], list(projected_list_model.items[:4]))
+
+    def test_filter_async_applies_latest_filter_only(self) -> None:
+        list_model = ListModel.ListModel[int](items=list(range(50000)))
+        projected_list_model = ProjectedListModel.ProjectedListModel(list_model)
+        with contextlib.closing(projected_list_model):
+            recorder = ChangeRecorder(projected_list_model)
+
+            async def type_search_text() -> typing.List[bool]:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                    first = asyncio.ensure_future(projected_list_model.filter_async(lambda x: "1" in str(x), executor=executor, chunk_size=1000))
+                    await asyncio.sleep(0)
+                    second = asyncio.ensure_future(projected_list_model.filter_async(lambda x: "12" in str(x), executor=executor, chunk_size=1000))
+                    # the master items may change while filtering.
+                    await asyncio.sleep(0)
+                    list_model.insert_item(0, 120000)
+                    return [await first, await second]
+
+            event_loop = asyncio.new_event_loop()
+            try:
+                self.assertEqual([False, True], event_loop.run_until_complete(type_search_text()))
+            finally:
+                event_loop.close()
+            expected_items = [item for item in list_model.items if "12" in str(item)]
+            self.assertEqual(expected_items, list(projected_list_model.items))
+            self.assertEqual(expected_items, recorder.items)
+
+    def test_list_canvas_item_follows_projection(self) -> None:
+        list_model = ListModel.ListModel[str](items=[f"item{i}" for i in range(500)])
+        projected_list_model = ProjectedListModel.ProjectedListModel(list_model)
+
+        def make_item_canvas_item(item: typing.Any, is_selected_model: Model.PropertyModel[bool]) -> CanvasItem.AbstractCanvasItem:
+            return CanvasItem.TextCanvasItem(item)
+
+        canvas_item = ListCanvasItem.ListCanvasItem2(projected_list_model, Selection.IndexedSelection(), make_item_canvas_item, GridFlowCanvasItem.GridFlowCanvasItemDelegate(), item_height=20)
+        with contextlib.closing(canvas_item), contextlib.closing(projected_list_model):
+            update_count = canvas_item._update_count
+            projected_list_model.set_filter(lambda x: "9" in x)
+            projected_list_model.sort_key = lambda x: x[::-1]
+            self.assertEqual(update_count + 2, canvas_item._update_count)
+            self.assertEqual(list(projected_list_model.items), [typing.cast(CanvasItem.TextCanvasItem, c._canvas_item).text for c in canvas_item._grid_flow_item_canvas_items])
+
+
+if __name__ == '__main__':
+    unittest.main()
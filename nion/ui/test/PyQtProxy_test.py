@@ -0,0 +1,55 @@
+# standard libraries
+import importlib
+import importlib.util
+import types
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+# None
+
+
+def import_proxy() -> types.ModuleType:
+    # the proxy module is not type checked.
+    return importlib.import_module("nion.ui.PyQtProxy")
+
+
+@unittest.skipIf(importlib.util.find_spec("PySide6") is None, "PySide6 is not installed")
+class TestPyQtProxyClass(unittest.TestCase):
+
+    def test_parsed_colors_are_interned(self) -> None:
+        PyQtProxy = import_proxy()
+        PyQtProxy._colors.clear()
+        color = PyQtProxy.ParseColorString("rgba(128, 64, 32, 0.5)")
+        self.assertEqual((128, 64, 32, 127), color.getRgb())
+        self.assertEqual((64, 32, 16, 255), PyQtProxy.ParseColorString("rgb(64, 32, 16)").getRgb())
+        self.assertEqual((255, 0, 0, 255), PyQtProxy.ParseColorString("red").getRgb())
+        # parsing the same color string again returns the same color without parsing it.
+        miss_count = PyQtProxy._colors.miss_count
+        self.assertIs(color, PyQtProxy.ParseColorString("rgba(128, 64, 32, 0.5)"))
+        self.assertEqual(miss_count, PyQtProxy._colors.miss_count)
+
+    def test_brushes_and_pens_are_interned_by_color_value(self) -> None:
+        PyQtProxy = import_proxy()
+        from PySide6 import QtCore
+        red = PyQtProxy.ParseColorString("red")
+        red_hex = PyQtProxy.ParseColorString("#F00")
+        blue = PyQtProxy.ParseColorString("blue")
+        # color strings for the same color share a brush.
+        brush = PyQtProxy.GetColorBrush(red)
+        self.assertIs(brush, PyQtProxy.GetColorBrush(red_hex))
+        self.assertIsNot(brush, PyQtProxy.GetColorBrush(blue))
+        self.assertEqual(red, brush.color())
+        # pens are shared for the same color and style.
+        pen = PyQtProxy.GetColorPen(red, 1.0, QtCore.Qt.PenJoinStyle.BevelJoin, QtCore.Qt.PenCapStyle.SquareCap, 0.0)
+        self.assertIs(pen, PyQtProxy.GetColorPen(red_hex, 1.0, QtCore.Qt.PenJoinStyle.BevelJoin, QtCore.Qt.PenCapStyle.SquareCap, 0.0))
+        dashed_pen = PyQtProxy.GetColorPen(red, 1.0, QtCore.Qt.PenJoinStyle.BevelJoin, QtCore.Qt.PenCapStyle.SquareCap, 2.0)
+        self.assertIsNot(pen, dashed_pen)
+        self.assertEqual([2.0, 2.0], dashed_pen.dashPattern())
+        self.assertEqual(2.0, PyQtProxy.GetColorPen(red, 2.0, QtCore.Qt.PenJoinStyle.BevelJoin, QtCore.Qt.PenCapStyle.SquareCap, 0.0).widthF())
+
+
+if __name__ == '__main__':
+    unittest.main()
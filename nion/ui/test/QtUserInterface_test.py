@@ -0,0 +1,115 @@
+# standard libraries
+import typing
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.ui import QtUserInterface
+from nion.ui import UserInterface
+
+
+class TextProxy:
+    """A proxy implementing the text measuring and truncating methods of the host, counting the calls."""
+
+    def __init__(self) -> None:
+        self.calls = list[typing.Tuple[str, typing.Any]]()
+
+    def has_method(self, name: str) -> bool:
+        return hasattr(self, name)
+
+    def Core_syncLatencyTimer(self, value: float) -> float:
+        return 0.0
+
+    def Core_getFontMetrics(self, font_str: str, text: str) -> typing.Tuple[float, float, float, float, float]:
+        self.calls.append(("Core_getFontMetrics", text))
+        return 7.0 * len(text), 16.0, 12.0, 4.0, 0.0
+
+    def Core_measureTexts(self, font_str: str, texts: typing.Sequence[str]) -> typing.List[typing.Tuple[float, float, float, float, float]]:
+        self.calls.append(("Core_measureTexts", list(texts)))
+        return [(7.0 * len(text), 16.0, 12.0, 4.0, 0.0) for text in texts]
+
+    def Core_truncateToWidth(self, font_str: str, text: str, pixel_width: int, mode: int) -> str:
+        self.calls.append(("Core_truncateToWidth", text))
+        return text[:pixel_width // 7]
+
+    def Core_truncateTextsToWidth(self, font_str: str, texts: typing.Sequence[str], pixel_width: int, mode: int) -> typing.List[str]:
+        self.calls.append(("Core_truncateTextsToWidth", list(texts)))
+        return [text[:pixel_width // 7] for text in texts]
+
+    def DocumentWindow_create(self, parent_native: typing.Any, title: str) -> typing.Any:
+        return object()
+
+    def DocumentWindow_connect(self, native_document_window: typing.Any, document_window: typing.Any) -> None:
+        pass
+
+    def decode_font_metrics(self, font_metrics: typing.Sequence[float]) -> UserInterface.FontMetrics:
+        return UserInterface.FontMetrics(*font_metrics)
+
+
+class TestQtUserInterfaceClass(unittest.TestCase):
+
+    def test_font_metrics_are_cached_and_measured_in_batches(self) -> None:
+        proxy = TextProxy()
+        ui = QtUserInterface.QtUserInterface(proxy)
+        self.assertEqual(14.0, ui.get_font_metrics("12px", "ab").width)
+        self.assertEqual(14.0, ui.get_font_metrics("12px", "ab").width)
+        self.assertEqual([("Core_getFontMetrics", "ab")], proxy.calls)
+        # only the texts not measured yet are sent to the host, once each, in a single call.
+        proxy.calls.clear()
+        self.assertEqual([14.0, 7.0, 21.0, 7.0], ui.measure_texts("12px", ["ab", "a", "abc", "a"]))
+        self.assertEqual([("Core_measureTexts", ["a", "abc"])], proxy.calls)
+        proxy.calls.clear()
+        self.assertEqual([21.0, 7.0], ui.measure_texts("12px", ["abc", "a"]))
+        self.assertEqual(16.0, ui.get_font_metrics("12px", "abc").height)
+        self.assertEqual([], proxy.calls)
+        # the cache is keyed by font as well as text.
+        ui.get_font_metrics("bold 12px", "ab")
+        self.assertEqual([("Core_getFontMetrics", "ab")], proxy.calls)
+
+    def test_font_metrics_are_measured_again_when_display_scaling_changes(self) -> None:
+        proxy = TextProxy()
+        ui = QtUserInterface.QtUserInterface(proxy)
+        document_window = typing.cast(QtUserInterface.QtWindow, ui.create_document_window())
+        ui.get_font_metrics("12px", "ab")
+        ui.get_font_metrics("12px", "ab")
+        document_window.logicalDPIChanged(144.0)
+        ui.get_font_metrics("12px", "ab")
+        self.assertEqual(2 * [("Core_getFontMetrics", "ab")], proxy.calls)
+
+    def test_truncated_texts_are_cached_and_truncated_in_batches(self) -> None:
+        proxy = TextProxy()
+        ui = QtUserInterface.QtUserInterface(proxy)
+        mode = UserInterface.TruncateModeType.RIGHT
+        self.assertEqual("abc", ui.truncate_string_to_width("12px", "abcdef", 21, mode))
+        self.assertEqual("abc", ui.truncate_string_to_width("12px", "abcdef", 21, mode))
+        self.assertEqual([("Core_truncateToWidth", "abcdef")], proxy.calls)
+        self.assertEqual(0.5, ui._truncated_text_cache.hit_rate)
+        # a column of texts only sends the texts not truncated yet, in a single call.
+        proxy.calls.clear()
+        self.assertEqual(["abc", "xyz", "ab"], ui.truncate_strings_to_width("12px", ["abcdef", "xyzxyz", "ab"], 21, mode))
+        self.assertEqual([("Core_truncateTextsToWidth", ["xyzxyz", "ab"])], proxy.calls)
+        # repainting the column at the same width is served from the cache; a new width is not.
+        proxy.calls.clear()
+        self.assertEqual(["abc", "xyz", "ab"], ui.truncate_strings_to_width("12px", ["abcdef", "xyzxyz", "ab"], 21, mode))
+        self.assertEqual([], proxy.calls)
+        self.assertEqual(["a", "x", "a"], ui.truncate_strings_to_width("12px", ["abcdef", "xyzxyz", "ab"], 7, mode))
+        self.assertEqual(1, len(proxy.calls))
+        self.assertEqual(5 / 11, ui._truncated_text_cache.hit_rate)
+
+    def test_truncated_texts_are_truncated_again_when_display_scaling_changes(self) -> None:
+        proxy = TextProxy()
+        ui = QtUserInterface.QtUserInterface(proxy)
+        document_window = typing.cast(QtUserInterface.QtWindow, ui.create_document_window())
+        mode = UserInterface.TruncateModeType.RIGHT
+        ui.truncate_string_to_width("12px", "abcdef", 21, mode)
+        document_window.logicalDPIChanged(144.0)
+        ui.truncate_string_to_width("12px", "abcdef", 21, mode)
+        document_window.screenChanged()
+        ui.truncate_string_to_width("12px", "abcdef", 21, mode)
+        self.assertEqual(3 * [("Core_truncateToWidth", "abcdef")], proxy.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
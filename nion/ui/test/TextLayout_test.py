@@ -0,0 +1,86 @@
+# standard libraries
+import contextlib
+import math
+import typing
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.ui import CanvasItem
+from nion.ui import DrawingContext
+from nion.ui import TestUI
+from nion.ui import TextLayout
+from nion.ui import UserInterface
+from nion.utils import Geometry
+
+
+class TestTextLayoutClass(unittest.TestCase):
+
+    def setUp(self) -> None:
+        CanvasItem._threaded_rendering_enabled = False
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_text_wraps_at_whitespace_and_newlines(self) -> None:
+        ui = TestUI.UserInterface()
+        text_layout = TextLayout.TextLayout(ui.get_font_metrics)
+        text = "The quick brown fox jumps over the lazy dog.\n\nSecond paragraph"
+        wrapped_text = text_layout.layout(text, "12px", 80)
+        self.assertEqual(["The quick", "brown fox", "jumps over the", "lazy dog.", "", "Second", "paragraph"], [line.text for line in wrapped_text.lines])
+        for line in wrapped_text.lines:
+            self.assertEqual(line.text, text[line.start:line.end])
+            self.assertLessEqual(line.rect.width, 80)
+        line_height = wrapped_text.lines[1].rect.top
+        self.assertEqual(len(wrapped_text.lines) * line_height, wrapped_text.size.height)
+        # hit testing finds the line and the nearest character boundary.
+        self.assertEqual(2, wrapped_text.line_index_at(line_height * 2.5))
+        self.assertEqual(len(wrapped_text.lines) - 1, wrapped_text.line_index_at(1000))
+        fox_x = ui.get_font_metrics("12px", "brown f").width
+        self.assertEqual(text.index("fox") + 1, text_layout.character_index_at(wrapped_text, Geometry.FloatPoint(y=line_height * 1.5, x=fox_x + 1)))
+        # without a width, each paragraph is one line.
+        self.assertEqual([text.split("\n")[0], "", "Second paragraph"], [line.text for line in text_layout.layout(text, "12px", None).lines])
+
+    def test_layout_is_reused_until_text_font_or_width_changes(self) -> None:
+        ui = TestUI.UserInterface()
+        measured_texts = list[str]()
+
+        def get_font_metrics(font: str, text: str) -> UserInterface.FontMetrics:
+            measured_texts.append(text)
+            return ui.get_font_metrics(font, text)
+
+        text = " ".join(["word"] * 200)
+        canvas_item = TextLayout.WrappedTextCanvasItem(get_font_metrics, text)
+        column = CanvasItem.CanvasItemComposition()
+        column.layout = CanvasItem.CanvasItemColumnLayout()
+        column.add_canvas_item(canvas_item)
+        column.add_stretch()
+        with contextlib.closing(column):
+            # lays out once to size the canvas item; painting at that width reuses the layout.
+            canvas_item.size_to_width(200)
+            column.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=200, height=1000))
+            canvas_item.text_color = "red"
+            column.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=200, height=1000))
+            self.assertEqual(2, canvas_item._repaint_count)
+            self.assertEqual(1, canvas_item.text_layout._wrap_count)
+            self.assertEqual(len(canvas_item.wrapped_text.lines) * canvas_item.wrapped_text.lines[1].rect.top, canvas_item.sizing.preferred_height)
+            # rewrapping to a new width only measures the new lines, not each word again.
+            measured_texts.clear()
+            canvas_item.size_to_width(300)
+            self.assertEqual(2, canvas_item.text_layout._wrap_count)
+            self.assertNotIn("word", measured_texts)
+            self.assertEqual(len(canvas_item.text_layout.layout(text, "12px", 300).lines) + 1, len(measured_texts))
+            # changing the text lays out again and fits the height at the sized width.
+            canvas_item.text = "word"
+            self.assertEqual(3, canvas_item.text_layout._wrap_count)
+            line_height = canvas_item.text_layout.layout("word", "12px", 300).size.height
+            self.assertEqual(line_height, canvas_item.sizing.preferred_height)
+            canvas_item.text_font = "24px"
+            self.assertEqual(4, canvas_item.text_layout._wrap_count)
+            self.assertEqual(math.ceil(canvas_item.text_layout.layout("word", "24px", 300).size.height), canvas_item.sizing.preferred_height)
+
+
+if __name__ == '__main__':
+    unittest.main()
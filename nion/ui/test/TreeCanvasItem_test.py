@@ -0,0 +1,107 @@
+# standard libraries
+import contextlib
+import json
+import typing
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.ui import CanvasItem
+from nion.ui import DrawingContext
+from nion.ui import TestUI
+from nion.ui import TreeCanvasItem
+from nion.ui import UserInterface
+from nion.utils import Geometry
+
+
+class TreeCanvasItemDelegate:
+    """A tree of parent_count parents, each with child_count children."""
+
+    def __init__(self, parent_count: int, child_count: int) -> None:
+        self.parent_count = parent_count
+        self.child_count = child_count
+        self.expanded_value_path_keys = set[str]()
+
+    def build_items(self, get_font_metrics_fn: typing.Callable[[str, str], UserInterface.FontMetrics],
+                    item_width: typing.Optional[int]) -> typing.Sequence[TreeCanvasItem.TreeItem]:
+        tree_items = list[TreeCanvasItem.TreeItem]()
+        for i in range(self.parent_count):
+            is_expanded = json.dumps([i]) in self.expanded_value_path_keys
+            tree_items.append(TreeCanvasItem.TreeItem(CanvasItem.TextCanvasItem(f"{i}"), "parent", is_expanded, [i]))
+            if is_expanded:
+                for j in range(self.child_count):
+                    tree_items.append(TreeCanvasItem.TreeItem(CanvasItem.TextCanvasItem(f"{i}.{j}"), "child", False, [i, j]))
+        return tree_items
+
+    def toggle_is_expanded(self, value_path_key: str) -> None:
+        self.expanded_value_path_keys ^= {value_path_key}
+
+
+def _row_value_paths(tree_canvas_item: TreeCanvasItem.TreeCanvasItem) -> typing.List[typing.Any]:
+    return [getattr(row, "value_path") for row in tree_canvas_item.canvas_items]
+
+
+class TestTreeCanvasItemClass(unittest.TestCase):
+
+    def setUp(self) -> None:
+        CanvasItem._threaded_rendering_enabled = False
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_expanding_and_collapsing_only_inserts_and_removes_child_rows(self) -> None:
+        ui = TestUI.UserInterface()
+        delegate = TreeCanvasItemDelegate(3, 100)
+        tree_canvas_item = TreeCanvasItem.TreeCanvasItem(ui.get_font_metrics, delegate)
+        with contextlib.closing(tree_canvas_item):
+            tree_canvas_item.reconstruct()
+            self.assertEqual([[0], [1], [2]], _row_value_paths(tree_canvas_item))
+            self.assertEqual(3, tree_canvas_item._row_create_count)
+            parent_rows = list(tree_canvas_item.canvas_items)
+            delegate.toggle_is_expanded(json.dumps([1]))
+            tree_canvas_item.reconstruct()
+            self.assertEqual([[0], [1]] + [[1, j] for j in range(100)] + [[2]], _row_value_paths(tree_canvas_item))
+            self.assertEqual(103, tree_canvas_item._row_create_count)
+            # the parent rows are patched in place.
+            self.assertEqual(parent_rows, [tree_canvas_item.canvas_items[i] for i in (0, 1, 102)])
+            delegate.toggle_is_expanded(json.dumps([1]))
+            tree_canvas_item.reconstruct()
+            self.assertEqual([[0], [1], [2]], _row_value_paths(tree_canvas_item))
+            self.assertEqual(parent_rows, list(tree_canvas_item.canvas_items))
+            self.assertEqual(103, tree_canvas_item._row_create_count)
+            # rows are laid out at the fixed row height.
+            tree_canvas_item.update_layout(Geometry.IntPoint(), Geometry.IntSize(width=200, height=54))
+            self.assertEqual([0, 18, 36], [(row.canvas_rect or Geometry.IntRect.empty_rect()).top for row in tree_canvas_item.canvas_items])
+
+    def test_virtualized_tree_only_creates_rows_near_visible_rect(self) -> None:
+        ui = TestUI.UserInterface()
+        delegate = TreeCanvasItemDelegate(10, 1000)
+        tree_canvas_item = TreeCanvasItem.TreeCanvasItem(ui.get_font_metrics, delegate, virtualize_rows=True, overscan=2)
+        content_heights = list[int]()
+        tree_canvas_item.on_content_height_changed = content_heights.append
+        scroll_area = CanvasItem.ScrollAreaCanvasItem(tree_canvas_item)
+        with contextlib.closing(scroll_area):
+            tree_canvas_item.reconstruct()
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=200, height=180))
+            self.assertEqual(range(0, 10), tree_canvas_item.row_range)
+            # expanding a node only touches the visible rows; the content height accounts for all rows.
+            delegate.toggle_is_expanded(json.dumps([0]))
+            tree_canvas_item.reconstruct()
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=200, height=180))
+            self.assertEqual(1010 * 18, content_heights[-1])
+            self.assertEqual([[0]] + [[0, j] for j in range(11)], _row_value_paths(tree_canvas_item))
+            self.assertLess(tree_canvas_item._row_create_count, 30)
+            # scrolling materializes the rows near the new visible rect, positioned by row index.
+            scroll_area.update_content_origin(Geometry.IntPoint(y=-18 * 500))
+            scroll_area.repaint_immediate(DrawingContext.DrawingContext(), Geometry.IntSize(width=200, height=180))
+            self.assertEqual(range(498, 512), tree_canvas_item.row_range)
+            self.assertEqual([0, 497], _row_value_paths(tree_canvas_item)[0])
+            self.assertEqual(498 * 18, (tree_canvas_item.canvas_items[0].canvas_rect or Geometry.IntRect.empty_rect()).top)
+            self.assertEqual(1010 * 18, (tree_canvas_item.canvas_rect or Geometry.IntRect.empty_rect()).height)
+            self.assertLess(tree_canvas_item._row_create_count, 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -50,6 +50,95 @@ class TestCanvasItemClass(unittest.TestCase):
             self.assertEqual(scroll_canvas_rect.height, 200)
             self.assertEqual(scroll_content_rect.height, 20)
 
+    def test_virtualized_table_widget_only_creates_rows_near_viewport(self) -> None:
+        from nion.ui import Widgets
+        ui = TestUI.UserInterface()
+
+        def create_list_item_widget(item: typing.Any) -> UserInterface.BoxWidget:
+            row = ui.create_row_widget()
+            row.add(ui.create_label_widget(str(item)))
+            return row
+
+        def rebind_list_item_widget(row: UserInterface.BoxWidget, item: typing.Any) -> bool:
+            typing.cast(UserInterface.LabelWidget, row.children[0]).text = str(item)
+            return True
+
+        def row_texts(table: Widgets.TableWidget) -> typing.List[str]:
+            return [typing.cast(UserInterface.LabelWidget, typing.cast(UserInterface.BoxWidget, table.list_items[i]).children[0]).text or str() for i in table.list_item_range]
+
+        widget = Widgets.TableWidget(ui, create_list_item_widget, row_height=20, overscan=2, rebind_list_item_widget=rebind_list_item_widget)
+        with contextlib.closing(widget):
+            for i in range(20000):
+                widget.insert_item(i, i)
+            self.assertEqual(20000, widget.list_item_count)
+            self.assertEqual(range(0, 26), widget.list_item_range)
+            self.assertEqual(26, widget._create_row_count)
+            # scroll by a few rows; rows slide in at the bottom and out at the top.
+            scroll_area_widget = widget._scroll_area_widget
+            assert scroll_area_widget
+            viewport_changed = scroll_area_widget._behavior.on_viewport_changed
+            assert viewport_changed
+            viewport_changed(((100, 0), (200, 300)))
+            self.assertEqual(range(3, 17), widget.list_item_range)
+            self.assertEqual([str(i) for i in range(3, 17)], row_texts(widget))
+            self.assertEqual(26, widget._create_row_count)
+            # jump far away; the existing rows are rebound.
+            viewport_changed(((200000, 0), (200, 300)))
+            self.assertEqual(range(9998, 10012), widget.list_item_range)
+            self.assertEqual([str(i) for i in range(9998, 10012)], row_texts(widget))
+            self.assertEqual(26, widget._create_row_count)
+            # inserting and removing items keeps the rows in sync.
+            widget.insert_item("a", 0)
+            widget.remove_item(10005)
+            self.assertEqual(20000, widget.list_item_count)
+            self.assertEqual([str(i) for i in range(9997, 10004)] + [str(i) for i in range(10005, 10012)], row_texts(widget))
+
+    def test_virtualized_table_widget_list_items_are_indexed_by_model_index(self) -> None:
+        from nion.ui import Widgets
+        ui = TestUI.UserInterface()
+
+        def create_list_item_widget(item: typing.Any) -> UserInterface.BoxWidget:
+            row = ui.create_row_widget()
+            row.add(ui.create_label_widget(str(item)))
+            return row
+
+        def row_text(row: UserInterface.Widget) -> str:
+            return typing.cast(UserInterface.LabelWidget, typing.cast(UserInterface.BoxWidget, row).children[0]).text or str()
+
+        widget = Widgets.TableWidget(ui, create_list_item_widget, row_height=20, overscan=2)
+        with contextlib.closing(widget):
+            for i in range(1000):
+                widget.insert_item(i, i)
+            scroll_area_widget = widget._scroll_area_widget
+            assert scroll_area_widget
+            viewport_changed = scroll_area_widget._behavior.on_viewport_changed
+            assert viewport_changed
+            viewport_changed(((4000, 0), (200, 300)))
+            self.assertEqual(range(198, 212), widget.list_item_range)
+            create_row_count = widget._create_row_count
+            # the list items have one entry per item and are indexed by model index.
+            self.assertEqual(widget.list_item_count, len(widget.list_items))
+            self.assertEqual("205", row_text(widget.list_items[205]))
+            self.assertEqual(create_row_count, widget._create_row_count)
+            # accessing a row outside of the view creates it once.
+            row_10 = widget.list_items[10]
+            self.assertEqual("10", row_text(row_10))
+            self.assertEqual("999", row_text(widget.list_items[-1]))
+            self.assertEqual(create_row_count + 2, widget._create_row_count)
+            self.assertIs(row_10, widget.list_items[10])
+            # the row is kept at the model index of its item when items are inserted.
+            widget.insert_item("a", 0)
+            self.assertIs(row_10, widget.list_items[11])
+            self.assertEqual("a", row_text(widget.list_items[0]))
+            # the rows are used when they scroll into view.
+            create_row_count = widget._create_row_count
+            viewport_changed(((0, 0), (200, 300)))
+            self.assertIn(11, widget.list_item_range)
+            self.assertIs(row_10, widget.list_items[11])
+            self.assertEqual(create_row_count + len(widget.list_item_range) - 2, widget._create_row_count)
+            with self.assertRaises(IndexError):
+                widget.list_items[1001]
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)